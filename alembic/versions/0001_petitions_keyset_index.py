@@ -0,0 +1,46 @@
+"""petitions keyset pagination index
+
+Tablolar uygulama başlangıcında create_all ile oluşturulur; bu revizyon
+mevcut veritabanlarına /petitions/list için (user_id, created_at DESC,
+id DESC) indeksini ekler.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_petitions_user_id_created_at_id"
+
+
+def upgrade() -> None:
+    # Büyük tabloda yazmaları kilitlememek için CONCURRENTLY (transaction dışında)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "petitions",
+            ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="petitions",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,80 @@
+"""compress petition content
+
+petitions.content metin kolonundan sıkıştırılmış binary kolona taşınır.
+Mevcut kayıtlar partiler halinde sıkıştırılır; ardından eski kolon
+kaldırılır ve yeni kolon content adını alır.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Callable, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.compression import compress_text, decompress_text
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+
+def _backfill(source: str, source_type, target: str, target_type, convert: Callable) -> None:
+    """source kolonunu convert ile dönüştürüp target kolonuna id sırasıyla partiler halinde yazar."""
+    bind = op.get_bind()
+    petitions = sa.table(
+        "petitions",
+        sa.column("id", sa.Integer),
+        sa.column(source, source_type),
+        sa.column(target, target_type),
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(petitions.c.id, petitions.c[source])
+            .where(petitions.c.id > last_id)
+            .order_by(petitions.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            petitions.update()
+            .where(petitions.c.id == sa.bindparam("row_id"))
+            .values({target: sa.bindparam("value")}),
+            [{"row_id": row_id, "value": convert(value)} for row_id, value in rows],
+        )
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    op.add_column("petitions", sa.Column("content_compressed", sa.LargeBinary(), nullable=True))
+    _backfill("content", sa.String, "content_compressed", sa.LargeBinary, compress_text)
+    with op.batch_alter_table("petitions") as batch_op:
+        batch_op.drop_column("content")
+        batch_op.alter_column(
+            "content_compressed",
+            new_column_name="content",
+            existing_type=sa.LargeBinary(),
+            nullable=False,
+        )
+
+
+def downgrade() -> None:
+    op.add_column("petitions", sa.Column("content_text", sa.String(), nullable=True))
+    _backfill("content", sa.LargeBinary, "content_text", sa.String, lambda value: decompress_text(bytes(value)))
+    with op.batch_alter_table("petitions") as batch_op:
+        batch_op.drop_column("content")
+        batch_op.alter_column(
+            "content_text",
+            new_column_name="content",
+            existing_type=sa.String(),
+            nullable=False,
+        )
@@ -0,0 +1,108 @@
+"""petition full-text search index
+
+PostgreSQL: petitions.search_vector (tsvector) kolonu ve GIN indeksi.
+SQLite: petitions_fts (FTS5) tablosu.
+Mevcut kayıtların arama belgeleri partiler halinde doldurulur.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.db import search
+from app.db.compression import decompress_text
+from app.schemas.petition import PetitionType
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+INDEX_NAME = "ix_petitions_search_vector"
+
+petitions = sa.table(
+    "petitions",
+    sa.column("id", sa.Integer),
+    sa.column("petition_type", sa.Enum(PetitionType)),
+    sa.column("content", sa.LargeBinary),
+    sa.column("search_vector", postgresql.TSVECTOR),
+)
+
+
+def _iter_batches():
+    """Kayıtları (id, başlık, içerik) olarak id sırasıyla partiler halinde okur."""
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(petitions.c.id, petitions.c.petition_type, petitions.c.content)
+            .where(petitions.c.id > last_id)
+            .order_by(petitions.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        yield [
+            (row_id, PetitionType.get_description(petition_type), decompress_text(bytes(content)))
+            for row_id, petition_type, content in rows
+        ]
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.add_column("petitions", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+        for batch in _iter_batches():
+            for row_id, title, content in batch:
+                bind.execute(
+                    petitions.update()
+                    .where(petitions.c.id == row_id)
+                    .values(search_vector=search.to_search_vector(title, content))
+                )
+        # GIN indeksi yazmaları kilitlemeden oluşturulur
+        with op.get_context().autocommit_block():
+            op.create_index(
+                INDEX_NAME,
+                "petitions",
+                ["search_vector"],
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    else:
+        op.add_column("petitions", sa.Column("search_vector", sa.Text(), nullable=True))
+        op.execute(search.CREATE_FTS_TABLE)
+        insert = sa.text(
+            f"INSERT OR REPLACE INTO {search.FTS_TABLE}(rowid, title, content) "
+            "VALUES (:id, :title, :content)"
+        )
+        for batch in _iter_batches():
+            bind.execute(insert, [
+                {"id": row_id, "title": search.fold(title), "content": search.fold(content)}
+                for row_id, title, content in batch
+            ])
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                INDEX_NAME,
+                table_name="petitions",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    else:
+        op.execute(search.DROP_FTS_TABLE)
+    with op.batch_alter_table("petitions") as batch_op:
+        batch_op.drop_column("search_vector")
@@ -0,0 +1,102 @@
+"""analytics rollup tables
+
+Günlük analitik toplamaları için analytics_daily,
+analytics_daily_petition_types ve analytics_watermarks tabloları;
+üretim ölçümleri (petitions.generation_ms, petitions.total_tokens),
+users.premium_activated_at kolonu ve gün aralığı taramaları için indeksler.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.schemas.petition import PetitionType
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (indeks, tablo, kolon)
+INDEXES = [
+    ("ix_petitions_created_at", "petitions", "created_at"),
+    ("ix_users_created_at", "users", "created_at"),
+    ("ix_users_premium_activated_at", "users", "premium_activated_at"),
+]
+
+
+def upgrade() -> None:
+    op.add_column("petitions", sa.Column("generation_ms", sa.Integer(), nullable=True))
+    op.add_column("petitions", sa.Column("total_tokens", sa.Integer(), nullable=True))
+    op.add_column("users", sa.Column("premium_activated_at", sa.DateTime(), nullable=True))
+
+    op.create_table(
+        "analytics_daily",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("petitions", sa.Integer(), nullable=False),
+        sa.Column("active_users", sa.Integer(), nullable=False),
+        sa.Column("new_users", sa.Integer(), nullable=False),
+        sa.Column("premium_conversions", sa.Integer(), nullable=False),
+        sa.Column("generation_ms_p50", sa.Integer(), nullable=True),
+        sa.Column("generation_ms_p95", sa.Integer(), nullable=True),
+        sa.Column("generation_ms_p99", sa.Integer(), nullable=True),
+        sa.Column("tokens_p50", sa.Integer(), nullable=True),
+        sa.Column("tokens_p95", sa.Integer(), nullable=True),
+        sa.Column("tokens_p99", sa.Integer(), nullable=True),
+    )
+    op.create_table(
+        "analytics_daily_petition_types",
+        sa.Column("day", sa.Date(), primary_key=True),
+        # petitions tablosunun enum tipi PostgreSQL'de zaten mevcut
+        sa.Column(
+            "petition_type",
+            postgresql.ENUM(PetitionType, name="petitiontype", create_type=False),
+            primary_key=True,
+        ),
+        sa.Column("petitions", sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        "analytics_watermarks",
+        sa.Column("name", sa.String(), primary_key=True),
+        sa.Column("processed_until", sa.Date(), nullable=False),
+    )
+
+    # Büyük tablolarda yazmaları kilitlememek için CONCURRENTLY (transaction dışında)
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
+
+    op.drop_table("analytics_watermarks")
+    op.drop_table("analytics_daily_petition_types")
+    op.drop_table("analytics_daily")
+
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("premium_activated_at")
+    with op.batch_alter_table("petitions") as batch_op:
+        batch_op.drop_column("total_tokens")
+        batch_op.drop_column("generation_ms")
@@ -0,0 +1,63 @@
+"""petition archive
+
+Eski dilekçelerin içeriğinin taşındığı petition_archive tablosu,
+petitions.archived_at kolonu ve arşivleme adayları için kısmi indeks.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_petitions_archive_candidates"
+
+
+def upgrade() -> None:
+    op.add_column("petitions", sa.Column("archived_at", sa.DateTime(), nullable=True))
+    op.create_table(
+        "petition_archive",
+        sa.Column("id", sa.Integer(), sa.ForeignKey("petitions.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("content", sa.LargeBinary(), nullable=False),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+    )
+
+    # Büyük tabloda yazmaları kilitlememek için CONCURRENTLY (transaction dışında)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "petitions",
+            ["updated_at"],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+            postgresql_where=sa.text("archived_at IS NULL"),
+            sqlite_where=sa.text("archived_at IS NULL"),
+        )
+
+
+def downgrade() -> None:
+    # Arşivdeki içerik geri taşınmadan tablo kaldırılamaz
+    bind = op.get_bind()
+    if bind.execute(sa.text("SELECT COUNT(*) FROM petition_archive")).scalar():
+        raise RuntimeError("petition_archive is not empty; restore archived petitions before downgrading")
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="petitions",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+    op.drop_table("petition_archive")
+    with op.batch_alter_table("petitions") as batch_op:
+        batch_op.drop_column("archived_at")
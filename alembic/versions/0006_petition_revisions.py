@@ -0,0 +1,43 @@
+"""petition revisions
+
+PATCH /petitions/{id} için petitions.version kolonu ve önceki sürümlerin
+delta/snapshot olarak saklandığı petition_revisions tablosu.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Sabit varsayılanlı kolon eklemek PostgreSQL'de tabloyu yeniden yazmaz
+    op.add_column(
+        "petitions",
+        sa.Column("version", sa.Integer(), nullable=False, server_default=sa.text("1")),
+    )
+    op.create_table(
+        "petition_revisions",
+        sa.Column("petition_id", sa.Integer(), sa.ForeignKey("petitions.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("version", sa.Integer(), primary_key=True),
+        sa.Column("kind", sa.String(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("petition_revisions")
+    with op.batch_alter_table("petitions") as batch_op:
+        batch_op.drop_column("version")
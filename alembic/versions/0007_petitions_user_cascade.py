@@ -0,0 +1,65 @@
+"""petitions.user_id ON DELETE CASCADE
+
+Kullanıcı silindiğinde dilekçeleri veritabanında silinir; ORM dilekçeleri
+belleğe yüklemez (passive_deletes).
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# PostgreSQL'in create_all ile verdiği ad
+CONSTRAINT_NAME = "petitions_user_id_fkey"
+
+# SQLite'ta isimsiz foreign key'i batch modunda bulabilmek için
+SQLITE_NAMING = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+SQLITE_CONSTRAINT_NAME = "fk_petitions_user_id_users"
+
+
+def _replace_foreign_key(ondelete: Union[str, None]) -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        # create_all ile oluşan foreign key isimsizdir, bu revizyonun oluşturduğu isimlidir
+        existing = [
+            fk["name"] or SQLITE_CONSTRAINT_NAME
+            for fk in sa.inspect(bind).get_foreign_keys("petitions")
+            if fk["constrained_columns"] == ["user_id"]
+        ]
+        with op.batch_alter_table("petitions", naming_convention=SQLITE_NAMING) as batch_op:
+            for name in existing:
+                batch_op.drop_constraint(name, type_="foreignkey")
+            batch_op.create_foreign_key(CONSTRAINT_NAME, "users", ["user_id"], ["id"], ondelete=ondelete)
+        return
+
+    op.drop_constraint(CONSTRAINT_NAME, "petitions", type_="foreignkey")
+    # NOT VALID + VALIDATE: mevcut satırların kontrolü yazmaları kilitlemeden yapılır
+    op.create_foreign_key(
+        CONSTRAINT_NAME,
+        "petitions",
+        "users",
+        ["user_id"],
+        ["id"],
+        ondelete=ondelete,
+        postgresql_not_valid=True,
+    )
+    op.execute(f"ALTER TABLE petitions VALIDATE CONSTRAINT {CONSTRAINT_NAME}")
+
+
+def upgrade() -> None:
+    _replace_foreign_key("CASCADE")
+
+
+def downgrade() -> None:
+    _replace_foreign_key(None)
@@ -0,0 +1,44 @@
+"""users updated_at index
+
+Kullanıcı önbelleğinin değişen kullanıcıları taraması için
+users.updated_at indeksi.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_users_updated_at"
+
+
+def upgrade() -> None:
+    # Büyük tabloda yazmaları kilitlememek için CONCURRENTLY (transaction dışında)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "users",
+            ["updated_at"],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="users",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
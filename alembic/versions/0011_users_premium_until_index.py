@@ -0,0 +1,44 @@
+"""users premium_until index
+
+Süresi dolan premium üyelikleri kapatan görev için
+users.premium_until indeksi.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_users_premium_until"
+
+
+def upgrade() -> None:
+    # Büyük tabloda yazmaları kilitlememek için CONCURRENTLY (transaction dışında)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "users",
+            ["premium_until"],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="users",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,31 @@
+"""petitions autosaved_at
+
+Worker'lar arası otomatik kayıt sıralaması için son yazılan taslağın
+alındığı zaman.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Varsayılansız nullable kolon eklemek PostgreSQL'de tabloyu yeniden yazmaz
+    op.add_column("petitions", sa.Column("autosaved_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("petitions") as batch_op:
+        batch_op.drop_column("autosaved_at")
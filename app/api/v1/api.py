@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, petitions
+from app.api.v1.endpoints import admin, auth, petitions
 from typing import List
 
 # API router tanımı
@@ -21,6 +21,15 @@ ROUTER_CONFIGS: List[dict] = [
             401: {"description": "Unauthorized"},
             403: {"description": "Forbidden - Premium required"}
         },
+    },
+    {
+        "router": admin.router,
+        "prefix": "/admin",
+        "tags": ["admin"],
+        "responses": {
+            401: {"description": "Unauthorized"},
+            403: {"description": "Forbidden - Admin required"}
+        },
     }
 ]
 
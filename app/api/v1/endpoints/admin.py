@@ -0,0 +1,91 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.security import get_current_admin_user
+from app.db import models
+from app.db.analytics import WATERMARK_NAME
+from app.db.replicas import get_read_db
+from app.schemas.analytics import AnalyticsDay, AnalyticsReport, Percentiles
+from app.core.exceptions import ValidationError, get_error_message
+from app.core.logger import api_logger
+
+router = APIRouter()
+
+DEFAULT_RANGE_DAYS = 30
+
+@router.get("/analytics", response_model=AnalyticsReport)
+async def get_analytics(
+    start: Optional[date] = Query(None, description="İlk gün (varsayılan: son 30 gün)"),
+    end: Optional[date] = Query(None, description="Son gün (dahil, varsayılan: dün)"),
+    current_user: models.User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Günlük analitik özetlerini döndürür.
+    Yalnızca toplama tablolarını okur; petitions ve users taranmaz.
+
+    Args:
+        start: İlk gün
+        end: Son gün (dahil)
+        current_user: Yönetici kullanıcı
+        db: Okuma oturumu
+
+    Returns:
+        AnalyticsReport: Günlük özetler
+
+    Raises:
+        ValidationError: Geçersiz tarih aralığı
+    """
+    end = end or datetime.utcnow().date() - timedelta(days=1)
+    start = start or end - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+    if start > end or (end - start).days >= settings.ANALYTICS_MAX_RANGE_DAYS:
+        raise ValidationError(detail=get_error_message("INVALID_DATE_RANGE"))
+
+    summaries = (await db.execute(
+        select(models.AnalyticsDaily)
+        .where(models.AnalyticsDaily.day >= start, models.AnalyticsDaily.day <= end)
+        .order_by(models.AnalyticsDaily.day)
+    )).scalars().all()
+    type_rows = (await db.execute(
+        select(models.AnalyticsDailyPetitionType)
+        .where(models.AnalyticsDailyPetitionType.day >= start, models.AnalyticsDailyPetitionType.day <= end)
+    )).scalars().all()
+    processed_until = (await db.execute(
+        select(models.AnalyticsWatermark.processed_until)
+        .where(models.AnalyticsWatermark.name == WATERMARK_NAME)
+    )).scalar()
+
+    by_type: Dict[date, Dict[str, int]] = {}
+    for row in type_rows:
+        by_type.setdefault(row.day, {})[row.petition_type.value] = row.petitions
+
+    api_logger.info("Analytics requested", user_id=current_user.id, start=start.isoformat(), end=end.isoformat())
+    return AnalyticsReport(
+        start=start,
+        end=end,
+        processed_until=processed_until,
+        days=[
+            AnalyticsDay(
+                day=summary.day,
+                petitions=summary.petitions,
+                petitions_by_type=by_type.get(summary.day, {}),
+                active_users=summary.active_users,
+                new_users=summary.new_users,
+                premium_conversions=summary.premium_conversions,
+                generation_ms=Percentiles(
+                    p50=summary.generation_ms_p50,
+                    p95=summary.generation_ms_p95,
+                    p99=summary.generation_ms_p99
+                ),
+                tokens=Percentiles(
+                    p50=summary.tokens_p50,
+                    p95=summary.tokens_p95,
+                    p99=summary.tokens_p99
+                )
+            )
+            for summary in summaries
+        ]
+    )
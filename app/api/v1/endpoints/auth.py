@@ -1,19 +1,27 @@
 from datetime import timedelta, datetime
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.security import (
     create_access_token,
-    get_password_hash,
-    verify_password,
-    get_current_user
+    create_refresh_token,
+    decode_refresh_token,
+    get_current_user,
+    get_current_user_for_update,
+    user_token_claims
 )
 from app.core.config import settings
 from app.db.database import get_db
-from app.db import models
+from app.db import models, search
+from app.core.storage import delete_unreferenced_pdfs
+from app.core.user_cache import user_cache
+from app.core.revocation import revocation_list
+from app.core.hashing import password_hasher, PASSWORD_REHASHED
 from app.schemas.user import UserCreate, User, UserUpdate
-from app.schemas.token import Token
+from app.schemas.token import RefreshTokenRequest, Token
 from app.core.exceptions import (
     AuthenticationError,
     ValidationError,
@@ -24,12 +32,45 @@ from app.core.logger import auth_logger
 
 router = APIRouter()
 
-def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[models.User]:
     """Veritabanından email ile kullanıcı bulur"""
-    return db.query(models.User).filter(models.User.email == email).first()
+    result = await db.execute(select(models.User).where(models.User.email == email))
+    return result.scalars().first()
+
+def issue_tokens(user: models.User) -> dict:
+    """Kullanıcı için access ve refresh token üretir"""
+    expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(data=user_token_claims(user), expires_delta=expires_delta)
+    refresh_token, refresh_expires_at = create_refresh_token(user)
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "expires_at": datetime.utcnow() + expires_delta,
+        "refresh_token": refresh_token,
+        "refresh_expires_at": refresh_expires_at
+    }
+
+async def revoke_user_tokens(db: AsyncSession, user_id: int) -> None:
+    """
+    Kullanıcının tüm access ve refresh token'larını geçersiz kılar
+    (token_version artırılır).
+
+    Args:
+        db: Veritabanı oturumu
+        user_id: Kullanıcı ID
+    """
+    token_version = (await db.execute(
+        update(models.User)
+        .where(models.User.id == user_id)
+        .values(token_version=models.User.token_version + 1)
+        .returning(models.User.token_version)
+        .execution_options(synchronize_session=False)
+    )).scalar()
+    await db.commit()
+    user_cache.invalidate(user_id, token_version)
 
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
-def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
     """
     Yeni kullanıcı kaydı oluşturur.
     
@@ -43,30 +84,31 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
     Raises:
         HTTPException: Email zaten kayıtlı veya veritabanı hatası
     """
-    if get_user_by_email(db, user.email):
+    if await get_user_by_email(db, user.email):
         auth_logger.warning("Registration attempt with existing email", email=user.email)
         raise ValidationError(detail=get_error_message("EMAIL_EXISTS"))
     
     try:
         db_user = models.User(
             email=user.email,
-            hashed_password=get_password_hash(user.password),
+            hashed_password=await password_hasher.hash(user.password),
             full_name=user.full_name,
             is_premium=False
         )
         db.add(db_user)
-        db.commit()
+        await db.commit()
+        await db.refresh(db_user)
         auth_logger.info("User registered successfully", user_id=db_user.id)
         return db_user
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         auth_logger.error("Registration failed", error=str(e))
         raise DatabaseError(detail=get_error_message("DATABASE_ERROR"))
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Kullanıcı girişi yapar ve token döndürür.
@@ -81,20 +123,118 @@ def login(
     Raises:
         HTTPException: Geçersiz kimlik bilgileri
     """
-    user = get_user_by_email(db, form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    user = await get_user_by_email(db, form_data.username)
+    valid, new_hash = False, None
+    if user:
+        valid, new_hash = await password_hasher.verify(form_data.password, user.hashed_password)
+    if not valid:
         auth_logger.warning("Login failed", email=form_data.username)
         raise AuthenticationError(detail=get_error_message("INVALID_CREDENTIALS"))
     
     auth_logger.info("User logged in successfully", user_id=user.id)
-    access_token = create_access_token(data={"sub": user.email})
-    return {"access_token": access_token, "token_type": "bearer"}
+    tokens = issue_tokens(user)
+    if new_hash:
+        # Maliyeti güncel olmayan hash kademeli olarak yenilenir; hata girişi engellemez
+        try:
+            user.hashed_password = new_hash
+            await db.commit()
+            user_cache.invalidate(user.id)
+            PASSWORD_REHASHED.inc()
+            auth_logger.info("Password rehashed", user_id=user.id)
+        except Exception as e:
+            await db.rollback()
+            auth_logger.warning("Password rehash failed", user_id=user.id, error=str(e))
+    return tokens
+
+@router.post("/refresh", response_model=Token)
+async def refresh_tokens(
+    token_request: RefreshTokenRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Refresh token ile yeni token çifti verir; şifre doğrulanmaz.
+
+    Refresh token tek kullanımlıktır: kullanılan token iptal listesine
+    eklenir ve yerine yenisi verilir. İptal edilmiş bir token yeniden
+    kullanılırsa token ele geçirilmiş sayılır ve kullanıcının tüm
+    token'ları geçersiz kılınır.
+
+    Args:
+        token_request: Refresh token
+        db: Veritabanı oturumu
+
+    Returns:
+        Yeni access ve refresh token
+
+    Raises:
+        AuthenticationError: Geçersiz, süresi dolmuş veya iptal edilmiş token
+    """
+    payload = decode_refresh_token(token_request.refresh_token)
+    user_id, jti = payload["uid"], payload["jti"]
+
+    reused = await revocation_list.is_revoked(db, jti)
+    if not reused:
+        user = await user_cache.load(payload["sub"])
+        if (
+            user is None
+            or user.id != user_id
+            or not user.is_active
+            or payload.get("ver", 0) != (user.token_version or 0)
+        ):
+            auth_logger.warning("Refresh token rejected", user_id=user_id)
+            raise AuthenticationError(detail=get_error_message("REFRESH_TOKEN_INVALID"))
+        try:
+            db.add(models.RevokedToken(jti=jti, user_id=user_id, expires_at=datetime.utcfromtimestamp(payload["exp"])))
+            await db.commit()
+        except IntegrityError:
+            # Aynı token eşzamanlı bir istekte kullanıldı
+            await db.rollback()
+            reused = True
+
+    if reused:
+        auth_logger.warning("Refresh token reuse detected", user_id=user_id)
+        await revoke_user_tokens(db, user_id)
+        raise AuthenticationError(detail=get_error_message("TOKEN_REVOKED"))
+
+    revocation_list.add(jti)
+    auth_logger.info("Tokens refreshed", user_id=user_id)
+    return issue_tokens(user)
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    token_request: RefreshTokenRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Refresh token'ı iptal eder. Access token süresi dolana kadar geçerlidir.
+
+    Args:
+        token_request: Refresh token
+        db: Veritabanı oturumu
+
+    Raises:
+        AuthenticationError: Geçersiz veya süresi dolmuş token
+    """
+    payload = decode_refresh_token(token_request.refresh_token)
+    try:
+        db.add(models.RevokedToken(
+            jti=payload["jti"],
+            user_id=payload["uid"],
+            expires_at=datetime.utcfromtimestamp(payload["exp"])
+        ))
+        await db.commit()
+    except IntegrityError:
+        # Token zaten iptal edilmiş veya kullanıcı silinmiş
+        await db.rollback()
+    revocation_list.add(payload["jti"])
+    auth_logger.info("User logged out", user_id=payload["uid"])
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 @router.post("/premium/activate", response_model=User)
 async def activate_premium(
     duration_days: int,
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: models.User = Depends(get_current_user_for_update),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Premium üyeliği aktifleştirir.
@@ -119,10 +259,13 @@ async def activate_premium(
         raise ValidationError(detail=get_error_message("INVALID_DURATION"))
     
     try:
+        if not current_user.is_premium_active():
+            current_user.premium_activated_at = datetime.utcnow()
         current_user.is_premium = True
         current_user.premium_until = datetime.utcnow() + timedelta(days=duration_days)
-        db.commit()
-        db.refresh(current_user)
+        await db.commit()
+        user_cache.invalidate(current_user.id)
+        await db.refresh(current_user)
         auth_logger.info(
             "Premium activated successfully",
             user_id=current_user.id,
@@ -131,7 +274,7 @@ async def activate_premium(
         )
         return current_user
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         auth_logger.error(
             "Premium activation failed",
             user_id=current_user.id,
@@ -144,11 +287,57 @@ async def read_users_me(current_user: models.User = Depends(get_current_user)):
     """Aktif kullanıcının bilgilerini döndürür"""
     return current_user
 
+@router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_user_me(
+    background_tasks: BackgroundTasks,
+    current_user: models.User = Depends(get_current_user_for_update),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Kullanıcı hesabını ve tüm dilekçelerini siler.
+
+    Dilekçeler, revizyonlar ve arşiv kayıtları veritabanında ON DELETE
+    CASCADE ile silinir; satırlar belleğe yüklenmez. PDF dosyaları yanıt
+    gönderildikten sonra partiler halinde temizlenir.
+
+    Args:
+        background_tasks: Yanıt sonrası görevler
+        current_user: Aktif kullanıcı
+        db: Veritabanı oturumu
+
+    Raises:
+        DatabaseError: Veritabanı hatası
+    """
+    user_id = current_user.id
+    try:
+        pdf_keys = list((await db.execute(
+            select(models.Petition.pdf_path)
+            .where(models.Petition.user_id == user_id, models.Petition.pdf_path.isnot(None))
+            .distinct()
+        )).scalars())
+        if db.bind.dialect.name == "sqlite":
+            # FTS5 tablosu foreign key ile bağlı değil
+            await db.execute(
+                text(f"DELETE FROM {search.FTS_TABLE} WHERE rowid IN (SELECT id FROM petitions WHERE user_id = :user_id)"),
+                {"user_id": user_id}
+            )
+        await db.delete(current_user)
+        await db.commit()
+        user_cache.invalidate(user_id)
+    except Exception as e:
+        await db.rollback()
+        auth_logger.error("Account deletion failed", user_id=user_id, error=str(e))
+        raise DatabaseError(detail=get_error_message("DATABASE_ERROR"))
+
+    background_tasks.add_task(delete_unreferenced_pdfs, pdf_keys)
+    auth_logger.info("Account deleted", user_id=user_id, pdf_count=len(pdf_keys))
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
 @router.put("/me", response_model=User)
 async def update_user_me(
     user_update: UserUpdate,
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: models.User = Depends(get_current_user_for_update),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Kullanıcı bilgilerini günceller.
@@ -164,10 +353,10 @@ async def update_user_me(
     try:
         updates = {}
         if user_update.password:
-            current_user.hashed_password = get_password_hash(user_update.password)
+            current_user.hashed_password = await password_hasher.hash(user_update.password)
             updates["password"] = True
         if user_update.email:
-            if get_user_by_email(db, user_update.email):
+            if await get_user_by_email(db, user_update.email):
                 auth_logger.warning(
                     "Update attempt with existing email",
                     user_id=current_user.id,
@@ -179,9 +368,13 @@ async def update_user_me(
         if user_update.full_name:
             current_user.full_name = user_update.full_name
             updates["full_name"] = True
+        if "password" in updates or "email" in updates:
+            # Önceki token'lar geçersiz olur
+            current_user.token_version = (current_user.token_version or 0) + 1
         
-        db.commit()
-        db.refresh(current_user)
+        await db.commit()
+        user_cache.invalidate(current_user.id, current_user.token_version)
+        await db.refresh(current_user)
         auth_logger.info(
             "User profile updated",
             user_id=current_user.id,
@@ -191,7 +384,7 @@ async def update_user_me(
     except ValidationError:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         auth_logger.error(
             "Profile update failed",
             user_id=current_user.id,
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_db, check_db_connection
 from app.core.logger import api_logger
 from typing import Dict
@@ -7,7 +7,7 @@ from typing import Dict
 router = APIRouter()
 
 @router.get("/health")
-async def health_check(db: Session = Depends(get_db)) -> Dict[str, str]:
+async def health_check(db: AsyncSession = Depends(get_db)) -> Dict[str, str]:
     """
     Sistem sağlık durumunu kontrol eder.
     
@@ -16,7 +16,7 @@ async def health_check(db: Session = Depends(get_db)) -> Dict[str, str]:
     """
     try:
         # Database bağlantısını kontrol et
-        db_status = "healthy" if check_db_connection() else "unhealthy"
+        db_status = "healthy" if await check_db_connection() else "unhealthy"
         
         # Disk alanını kontrol et
         import shutil
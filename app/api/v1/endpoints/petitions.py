@@ -1,23 +1,63 @@
-import os
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
-from typing import List, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Float, LargeBinary, Select, and_, column, func, literal, literal_column, or_, select, table, tuple_, type_coerce, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+from datetime import datetime
+from typing import Any, List, Dict, Iterable, Iterator, Optional, Set, Tuple
 from app.db.database import get_db
-from app.schemas.petition import PetitionCreate, PetitionResponse, PetitionRequest
+from app.db.replicas import get_read_db, mark_request_write
+from app.db.archive import restore_petition
+from app.db.compression import decompress_prefix
+from app.db.revisions import add_unchanged_revisions, build_revision, get_revision_content
+from app.db import search
+from app.schemas.petition import (
+    AutosaveStatus,
+    PetitionAutosave,
+    PetitionCreate,
+    PetitionResponse,
+    PetitionRequest,
+    PetitionPage,
+    PetitionRevisionContent,
+    PetitionRevisionInfo,
+    PetitionSearchPage,
+    PetitionStatusBulkResult,
+    PetitionStatusBulkUpdate,
+    PetitionType,
+    PetitionUpdate
+)
 from app.core.ai_handler import AIHandler
 from app.core.pdf_generator import PDFGenerator
+from app.core.zip_stream import stream_zip
+from app.core.storage import pdf_storage
+from app.core.autosave import autosave_buffer
+from app.core.renderers import RENDERERS, negotiate_format, render_document
+from app.core.pagination import (
+    encode_cursor,
+    decode_cursor,
+    parse_cursor_datetime,
+    parse_cursor_float,
+    parse_cursor_int
+)
 from app.db import models
-from app.core.security import get_current_user
+from app.core.security import get_current_premium_user, get_current_user
+from app.core.config import settings
 from app.core.exceptions import (
+    LegalAssistantException,
     AIServiceError,
     PremiumRequiredError,
     DatabaseError,
     AuthorizationError,
     ValidationError,
+    PreconditionFailedError,
+    PreconditionRequiredError,
     get_error_message
 )
 from app.core.logger import api_logger
+from app.core.monitoring import PETITION_COUNTER
 
 router = APIRouter()
 
@@ -25,26 +65,289 @@ router = APIRouter()
 ai_handler = AIHandler()
 pdf_generator = PDFGenerator()
 
-# Constants
-PDF_DIR = "temp_pdfs"
-os.makedirs(PDF_DIR, exist_ok=True)
+# Liste özetinde seçilebilecek alanlar ve ihtiyaç duydukları kolonlar.
+# excerpt, sıkıştırılmış içeriğin yalnızca ilk kısmı açılarak üretilir.
+SUMMARY_FIELDS = {
+    "id": ("id",),
+    "title": ("petition_type",),
+    "petition_type": ("petition_type",),
+    "status": ("status",),
+    "created_at": ("created_at",),
+    "updated_at": ("updated_at",),
+    "excerpt": ("excerpt",),
+}
+
+def parse_summary_fields(fields: Optional[str]) -> Set[str]:
+    """
+    fields= sorgu parametresini çözer.
+
+    Args:
+        fields: Virgülle ayrılmış alan listesi, verilmezse tüm alanlar
+
+    Returns:
+        Set[str]: Seçilen alanlar (id her zaman dahildir)
+
+    Raises:
+        ValidationError: Bilinmeyen alan
+    """
+    if not fields:
+        return set(SUMMARY_FIELDS)
+    selected = {name.strip() for name in fields.split(",") if name.strip()}
+    if not selected or selected - SUMMARY_FIELDS.keys():
+        raise ValidationError(detail=get_error_message("INVALID_FIELDS"))
+    return selected | {"id"}
+
+def summary_columns(selected: Set[str]) -> List[Any]:
+    """
+    Seçilen alanlar için projeksiyon kolonlarını döndürür.
+    Sayfalama cursor'ı için id ve created_at her zaman seçilir.
+    """
+    names = {"id", "created_at"}
+    for field in selected:
+        names.update(SUMMARY_FIELDS[field])
+
+    columns = []
+    for name in sorted(names):
+        if name == "excerpt":
+            # Sıkıştırılmış içerik ham okunur, yalnızca başlangıcı açılır; arşivlenmiş
+            # dilekçenin içeriği arşiv tablosundan okunur (geri taşınmaz, bkz. summary_query)
+            columns.append(type_coerce(
+                func.coalesce(models.PetitionArchive.content, models.Petition.content),
+                LargeBinary
+            ).label("excerpt"))
+        else:
+            columns.append(getattr(models.Petition, name))
+    return columns
+
+def summary_query(selected: Set[str]) -> Select:
+    """Seçilen alanlar için liste sorgusunu döndürür"""
+    query = select(*summary_columns(selected)).select_from(models.Petition)
+    if "excerpt" in selected:
+        query = query.outerjoin(models.PetitionArchive, models.PetitionArchive.id == models.Petition.id)
+    return query
+
+def make_excerpt(text: str) -> str:
+    """İçerik başlangıcından tek satırlık özet üretir"""
+    excerpt = " ".join(text.split())
+    if len(text) <= settings.PETITION_EXCERPT_LENGTH:
+        return excerpt
+    cut = excerpt[:settings.PETITION_EXCERPT_LENGTH]
+    if " " in cut:
+        cut = cut[:cut.rindex(" ")]
+    return cut.rstrip(" ,.;:") + "…"
+
+def build_summary(row: Any, selected: Set[str]) -> Dict[str, Any]:
+    """Projeksiyon satırından liste özetini oluşturur"""
+    mapping = row._mapping
+    summary = {}
+    for field in selected:
+        if field == "title":
+            summary["title"] = PetitionType.get_description(mapping["petition_type"])
+        elif field == "excerpt":
+            # Kesildiğini anlayabilmek için bir karakter fazla açılır
+            summary["excerpt"] = make_excerpt(
+                decompress_prefix(bytes(mapping["excerpt"]), settings.PETITION_EXCERPT_LENGTH + 1)
+            )
+        else:
+            summary[field] = mapping[field]
+    return summary
 
-def get_petition_by_id(db: Session, petition_id: int) -> models.Petition:
+async def get_petition_by_id(db: AsyncSession, petition_id: int) -> Optional[models.Petition]:
     """Veritabanından ID ile dilekçe bulur"""
-    return db.query(models.Petition).filter(models.Petition.id == petition_id).first()
+    return await db.get(models.Petition, petition_id)
+
+async def get_owned_petition(db: AsyncSession, petition_id: int, current_user: models.User) -> models.Petition:
+    """
+    Kullanıcıya ait dilekçeyi döndürür.
+
+    Args:
+        db: Veritabanı oturumu
+        petition_id: Dilekçe ID
+        current_user: Aktif kullanıcı
+
+    Returns:
+        Petition: Dilekçe modeli
+
+    Raises:
+        ValidationError: Dilekçe bulunamadı
+        AuthorizationError: Dilekçe başka bir kullanıcıya ait
+    """
+    petition = await get_petition_by_id(db, petition_id)
+    if not petition:
+        api_logger.warning("Petition not found", petition_id=petition_id)
+        raise ValidationError(detail=get_error_message("PETITION_NOT_FOUND"))
+    
+    if petition.user_id != current_user.id:
+        api_logger.warning(
+            "Unauthorized petition access attempt",
+            user_id=current_user.id,
+            petition_id=petition_id
+        )
+        raise AuthorizationError(detail=get_error_message("UNAUTHORIZED_ACCESS"))
+
+    if petition.archived_at is not None:
+        # Arşivden geri taşınır; oturum okuma oturumu olabileceği için nesne kirli işaretlenmez
+        set_committed_value(petition, "content", await restore_petition(petition.id))
+        set_committed_value(petition, "archived_at", None)
+    return petition
+
+def make_etag(petition: models.Petition) -> str:
+    """Dilekçe sürümünün ETag değeri"""
+    return f'"{petition.version}"'
+
+def parse_if_match(value: str) -> Optional[int]:
+    """
+    If-Match başlığından beklenen sürümü okur.
+
+    Returns:
+        Optional[int]: Sürüm, "*" için None
+
+    Raises:
+        PreconditionFailedError: Başlık bir dilekçe sürümü değil
+    """
+    value = value.strip()
+    if value == "*":
+        return None
+    if value.startswith("W/"):
+        value = value[2:]
+    try:
+        return int(value.strip('"'))
+    except ValueError:
+        raise PreconditionFailedError(detail=get_error_message("VERSION_CONFLICT"))
+
+def get_pdf_metadata(petition: models.Petition) -> Dict[str, object]:
+    """Dilekçe PDF'i için metadata bilgilerini döndürür"""
+    return {"date": petition.created_at}
+
+async def get_cached_pdf_key(db: AsyncSession, petition: models.Petition) -> str:
+    """
+    Dilekçenin filigransız PDF'inin depo anahtarını döndürür, yoksa oluşturur.
+
+    Args:
+        db: Veritabanı oturumu
+        petition: Dilekçe modeli
+
+    Returns:
+        str: Depo anahtarı
+    """
+    if pdf_storage.exists(petition.pdf_path):
+        return petition.pdf_path
+
+    # Render CPU yoğun olduğu için event loop dışında çalışır
+    data = await run_in_threadpool(
+        pdf_generator.render_bytes, petition.content, get_pdf_metadata(petition)
+    )
+    key = await run_in_threadpool(pdf_storage.save, data)
+    petition.set_pdf_path(key)
+    await db.commit()
+    return key
+
+async def _pdf_response(db: AsyncSession, petition: models.Petition, current_user: models.User) -> Response:
+    """
+    Dilekçenin PDF yanıtını oluşturur.
+    Premium olmayan kullanıcılar filigranlı önizleme alır.
+
+    Args:
+        db: Veritabanı oturumu
+        petition: Dilekçe modeli
+        current_user: Aktif kullanıcı
+
+    Returns:
+        Response: PDF yanıtı
+    """
+    filename = f"dilekce_{petition.id}.pdf"
+    pdf_key = await get_cached_pdf_key(db, petition)
+    
+    if not current_user.is_premium_active():
+        data = await run_in_threadpool(
+            lambda: pdf_generator.watermark_bytes(pdf_storage.read(pdf_key), settings.PDF_WATERMARK_TEXT)
+        )
+        return Response(
+            content=data,
+            media_type="application/pdf",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+    
+    return pdf_storage.file_response(pdf_key, filename)
+
+def _load_or_render_pdf(
+    petition_id: int,
+    content: str,
+    pdf_path: Optional[str],
+    created_at: Optional[datetime],
+    watermark_text: Optional[str]
+) -> Tuple[str, bytes]:
+    """
+    Dilekçe PDF'ini depodan okur veya bellekte oluşturur.
+
+    Args:
+        petition_id: Dilekçe ID
+        content: Dilekçe içeriği
+        pdf_path: Depo anahtarı
+        created_at: Dilekçe oluşturma tarihi
+        watermark_text: Filigran metni (None ise filigran eklenmez)
+
+    Returns:
+        Tuple[str, bytes]: Arşivdeki dosya adı ve PDF içeriği
+    """
+    if pdf_storage.exists(pdf_path):
+        data = pdf_storage.read(pdf_path)
+    else:
+        data = pdf_generator.render_bytes(content, {"date": created_at})
+
+    if watermark_text:
+        data = pdf_generator.watermark_bytes(data, watermark_text)
+    return f"dilekce_{petition_id}.pdf", data
+
+def _render_export_entries(
+    rows: Iterable[Tuple[int, str, Optional[str], Optional[datetime]]],
+    watermark_text: Optional[str]
+) -> Iterator[Tuple[str, bytes]]:
+    """
+    Dilekçe PDF'lerini sınırlı bir iş havuzunda paralel oluşturur.
+
+    Aynı anda en fazla iki iş havuzu dolusu PDF bellekte tutulur; her PDF
+    hazır olduğu anda, oluşturulma sırasına bakılmaksızın döndürülür.
+
+    Args:
+        rows: (id, içerik, depo anahtarı, oluşturma tarihi) satırları
+        watermark_text: Filigran metni
+
+    Yields:
+        Tuple[str, bytes]: Dosya adı ve PDF içeriği
+    """
+    workers = settings.PDF_EXPORT_WORKERS
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pdf-export")
+    pending = set()
+    try:
+        for petition_id, content, pdf_path, created_at in rows:
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(
+                _load_or_render_pdf, petition_id, content, pdf_path, created_at, watermark_text
+            ))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        # İstemci bağlantıyı keserse bekleyen işleri iptal et
+        executor.shutdown(wait=False, cancel_futures=True)
 
 @router.post("/generate", response_model=PetitionResponse, status_code=status.HTTP_201_CREATED)
 async def generate_petition(
     petition: PetitionCreate,
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: models.User = Depends(get_current_premium_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Yeni dilekçe oluşturur ve veritabanına kaydeder.
     
     Args:
         petition: Dilekçe bilgileri
-        current_user: Aktif kullanıcı
+        current_user: Premium kullanıcı (çoğunlukla yalnızca token claim'lerinden)
         db: Veritabanı oturumu
     
     Returns:
@@ -53,13 +356,11 @@ async def generate_petition(
     Raises:
         HTTPException: AI servisi veya veritabanı hatası
     """
-    if not current_user.is_premium:
-        api_logger.warning("Non-premium user attempted to generate petition", user_id=current_user.id)
-        raise PremiumRequiredError(detail=get_error_message("PREMIUM_REQUIRED"))
-    
     try:
         api_logger.info("Starting petition generation", user_id=current_user.id, type=petition.petition_type)
-        content = ai_handler.generate_petition(
+        started = time.perf_counter()
+        content, total_tokens = await run_in_threadpool(
+            ai_handler.generate_petition_with_usage,
             petition_type=petition.petition_type,
             data={
                 "full_name": petition.full_name,
@@ -72,57 +373,94 @@ async def generate_petition(
         db_petition = models.Petition(
             petition_type=petition.petition_type,
             content=content,
-            user_id=current_user.id
+            user_id=current_user.id,
+            generation_ms=int((time.perf_counter() - started) * 1000),
+            total_tokens=total_tokens
         )
         db.add(db_petition)
-        db.commit()
-        db.refresh(db_petition)
+        await db.commit()
+        await db.refresh(db_petition)
+        PETITION_COUNTER.labels(type=db_petition.petition_type.value, model=ai_handler.model).inc()
         
         api_logger.info("Petition generated successfully", petition_id=db_petition.id)
         return db_petition
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         api_logger.error("Petition generation failed", user_id=current_user.id, error=str(e))
         raise AIServiceError(detail=get_error_message("AI_SERVICE_ERROR"))
 
-@router.get("/list", response_model=List[PetitionResponse])
+@router.get("/list", response_model=PetitionPage, response_model_exclude_unset=True)
 async def list_petitions(
-    skip: int = 0,
-    limit: int = 10,
+    cursor: Optional[str] = Query(None, description="Önceki sayfanın next_cursor değeri"),
+    limit: int = Query(10, ge=1, le=100, description="Maksimum kayıt sayısı"),
+    fields: Optional[str] = Query(
+        None,
+        description="Virgülle ayrılmış alanlar: " + ", ".join(SUMMARY_FIELDS)
+    ),
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
-    Kullanıcının dilekçelerini listeler.
+    Kullanıcının dilekçelerini en yeniden eskiye özet olarak listeler.
+    
+    Sayfalama (created_at, id) üzerinden keyset ile yapılır; her sayfa
+    (user_id, created_at DESC, id DESC) indeksinde tek bir aralık taramasıdır.
+    Sorgu yalnızca seçilen kolonları okur ve ORM nesnesi oluşturmaz;
+    dilekçe içeriğinin tamamı GET /{petition_id} ile alınır.
     
     Args:
-        skip: Atlanacak kayıt sayısı
+        cursor: Sonraki sayfa cursor'ı
         limit: Maksimum kayıt sayısı
+        fields: Yanıta eklenecek alanlar
         current_user: Aktif kullanıcı
         db: Veritabanı oturumu
     
     Returns:
-        Dilekçe listesi
+        Dilekçe özetleri ve sonraki sayfa cursor'ı
     """
+    selected = parse_summary_fields(fields)
+    query = summary_query(selected).where(models.Petition.user_id == current_user.id)
+    if cursor:
+        created_at, petition_id = decode_cursor(cursor, 2)
+        # Değerler kolon tipleriyle bağlanır (tuple_ tip çıkarımı yapmaz)
+        query = query.where(
+            tuple_(models.Petition.created_at, models.Petition.id)
+            < tuple_(
+                literal(parse_cursor_datetime(created_at), models.Petition.created_at.type),
+                literal(parse_cursor_int(petition_id), models.Petition.id.type)
+            )
+        )
+    query = query.order_by(
+        models.Petition.created_at.desc(),
+        models.Petition.id.desc()
+    ).limit(limit + 1)
+    
     try:
         api_logger.info(
             "Listing petitions",
             user_id=current_user.id,
-            skip=skip,
-            limit=limit
+            has_cursor=cursor is not None,
+            limit=limit,
+            fields=",".join(sorted(selected))
         )
-        petitions = db.query(models.Petition)\
-            .filter(models.Petition.user_id == current_user.id)\
-            .offset(skip)\
-            .limit(limit)\
-            .all()
+        result = await db.execute(query)
+        rows = result.all()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor([last.created_at, last.id])
         
         api_logger.info(
             "Petitions listed successfully",
             user_id=current_user.id,
-            count=len(petitions)
+            count=len(rows)
         )
-        return petitions
+        return {
+            "items": [build_summary(row, selected) for row in rows],
+            "next_cursor": next_cursor
+        }
     except Exception as e:
         api_logger.error(
             "Failed to list petitions",
@@ -131,11 +469,198 @@ async def list_petitions(
         )
         raise DatabaseError(detail=get_error_message("DATABASE_ERROR"))
 
+@router.get("/search", response_model=PetitionSearchPage)
+async def search_petitions(
+    q: str = Query(..., min_length=1, max_length=200, description="Arama sorgusu"),
+    cursor: Optional[str] = Query(None, description="Önceki sayfanın next_cursor değeri"),
+    limit: int = Query(10, ge=1, le=50, description="Maksimum kayıt sayısı"),
+    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Kullanıcının dilekçelerinde tam metin araması yapar.
+    
+    PostgreSQL'de search_vector (GIN) üzerinde websearch_to_tsquery ve
+    ts_rank_cd, SQLite'ta petitions_fts (FTS5) üzerinde MATCH ve bm25
+    kullanılır. Sonuçlar ilgi puanına göre sıralanır ve (rank, id)
+    üzerinden keyset ile sayfalanır.
+    
+    Args:
+        q: Arama sorgusu
+        cursor: Sonraki sayfa cursor'ı
+        limit: Maksimum kayıt sayısı
+        current_user: Aktif kullanıcı
+        db: Veritabanı oturumu
+    
+    Returns:
+        Vurgulanmış arama sonuçları ve sonraki sayfa cursor'ı
+    """
+    columns = [
+        models.Petition.id,
+        models.Petition.petition_type,
+        models.Petition.status,
+        models.Petition.created_at,
+        models.Petition.updated_at,
+        models.Petition.content
+    ]
+    
+    if db.bind.dialect.name == "postgresql":
+        ts_query = search.to_search_query(q)
+        rank = func.ts_rank_cd(models.Petition.search_vector, ts_query)
+        query = select(*columns, rank.label("rank")).where(
+            models.Petition.search_vector.op("@@")(ts_query)
+        )
+    else:
+        match = search.fts_match_query(q)
+        if match is None:
+            return {"items": [], "next_cursor": None}
+        fts = table(search.FTS_TABLE, column("rowid"))
+        rank = literal_column(search.FTS_RANK, Float)
+        query = (
+            select(*columns, rank.label("rank"))
+            .join(fts, fts.c.rowid == models.Petition.id)
+            .where(literal_column(search.FTS_TABLE).op("MATCH")(match))
+        )
+    
+    query = query.where(models.Petition.user_id == current_user.id)
+    if cursor:
+        cursor_rank, petition_id = decode_cursor(cursor, 2)
+        cursor_rank = parse_cursor_float(cursor_rank)
+        petition_id = parse_cursor_int(petition_id)
+        query = query.where(or_(
+            rank < cursor_rank,
+            and_(rank == cursor_rank, models.Petition.id < petition_id)
+        ))
+    query = query.order_by(rank.desc(), models.Petition.id.desc()).limit(limit + 1)
+    
+    try:
+        api_logger.info("Searching petitions", user_id=current_user.id, has_cursor=cursor is not None)
+        rows = (await db.execute(query)).all()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor([rows[-1].rank, rows[-1].id])
+        
+        items = []
+        for row in rows:
+            item = build_summary(row, {"id", "title", "petition_type", "status", "created_at", "updated_at"})
+            item["rank"] = row.rank
+            item["highlight"] = search.highlight(row.content, q, settings.SEARCH_SNIPPET_WORDS)
+            items.append(item)
+        
+        api_logger.info("Petition search completed", user_id=current_user.id, count=len(items))
+        return {"items": items, "next_cursor": next_cursor}
+    except Exception as e:
+        api_logger.error("Petition search failed", user_id=current_user.id, error=str(e))
+        raise DatabaseError(detail=get_error_message("DATABASE_ERROR"))
+
+@router.get("/export.zip")
+async def export_petitions_zip(
+    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Kullanıcının tüm dilekçelerini PDF olarak ZIP arşivinde akıtır.
+    
+    Args:
+        current_user: Aktif kullanıcı
+        db: Veritabanı oturumu
+    
+    Returns:
+        ZIP arşivi (streaming)
+    """
+    try:
+        result = await db.execute(
+            select(
+                models.Petition.id,
+                # Arşivlenmiş dilekçeler geri taşınmadan arşivden okunur
+                func.coalesce(models.PetitionArchive.content, models.Petition.content),
+                models.Petition.pdf_path,
+                models.Petition.created_at
+            )
+            .outerjoin(models.PetitionArchive, models.PetitionArchive.id == models.Petition.id)
+            .where(models.Petition.user_id == current_user.id)
+            .order_by(models.Petition.id)
+        )
+        rows = result.all()
+    except Exception as e:
+        api_logger.error("Failed to load petitions for export", user_id=current_user.id, error=str(e))
+        raise DatabaseError(detail=get_error_message("DATABASE_ERROR"))
+    
+    watermark_text = None if current_user.is_premium_active() else settings.PDF_WATERMARK_TEXT
+    api_logger.info("Exporting petitions", user_id=current_user.id, count=len(rows))
+    
+    return StreamingResponse(
+        stream_zip(_render_export_entries(rows, watermark_text)),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="dilekceler.zip"'}
+    )
+
+@router.post("/status/bulk", response_model=PetitionStatusBulkResult)
+async def bulk_update_petition_status(
+    bulk_update: PetitionStatusBulkUpdate,
+    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Birden çok dilekçenin durumunu tek UPDATE ile değiştirir.
+
+    Yalnızca kullanıcıya ait ve durumu farklı olan dilekçeler güncellenir;
+    diğer ID'ler yok sayılır. Güncellenen dilekçelerin sürümü artar ve
+    önceki sürümleri revizyon geçmişine eklenir. Satırlar belleğe yüklenmez.
+
+    Args:
+        bulk_update: Dilekçe ID'leri ve yeni durum
+        current_user: Aktif kullanıcı
+        db: Veritabanı oturumu
+
+    Returns:
+        Durumu değiştirilen dilekçe ID'leri
+
+    Raises:
+        DatabaseError: Veritabanı hatası
+    """
+    petitions = models.Petition.__table__
+    ids = sorted(set(bulk_update.ids))
+    try:
+        rows = (await db.execute(
+            update(petitions)
+            .where(
+                petitions.c.id.in_(ids),
+                petitions.c.user_id == current_user.id,
+                petitions.c.status != bulk_update.status
+            )
+            .values(
+                status=bulk_update.status,
+                version=petitions.c.version + 1,
+                updated_at=datetime.utcnow()
+            )
+            .returning(petitions.c.id, petitions.c.version)
+        )).all()
+        if rows:
+            await add_unchanged_revisions(db, rows)
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        api_logger.error("Bulk status update failed", user_id=current_user.id, error=str(e))
+        raise DatabaseError(detail=get_error_message("DATABASE_ERROR"))
+
+    updated = sorted(row.id for row in rows)
+    api_logger.info(
+        "Petition statuses updated",
+        user_id=current_user.id,
+        status=bulk_update.status,
+        requested=len(ids),
+        updated=len(updated)
+    )
+    return PetitionStatusBulkResult(status=bulk_update.status, updated=updated)
+
 @router.get("/{petition_id}/pdf")
 async def get_petition_pdf(
     petition_id: int,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Dilekçenin PDF versiyonunu oluşturur ve döndürür.
@@ -152,32 +677,307 @@ async def get_petition_pdf(
         HTTPException: Dilekçe bulunamadı veya PDF oluşturma hatası
     """
     try:
-        petition = get_petition_by_id(db, petition_id)
-        if not petition:
-            api_logger.warning("Petition not found", petition_id=petition_id)
-            raise ValidationError(detail=get_error_message("PETITION_NOT_FOUND"))
-        
-        if petition.user_id != current_user.id:
-            api_logger.warning(
-                "Unauthorized petition access attempt",
-                user_id=current_user.id,
-                petition_id=petition_id
-            )
-            raise AuthorizationError(detail=get_error_message("UNAUTHORIZED_ACCESS"))
+        petition = await get_owned_petition(db, petition_id, current_user)
         
         api_logger.info("Generating PDF", petition_id=petition_id)
-        pdf_path = os.path.join(PDF_DIR, f"dilekce_{petition_id}.pdf")
         
         try:
-            pdf_generator.create_pdf(petition.content, pdf_path)
+            return await _pdf_response(db, petition, current_user)
         except Exception:
             raise AIServiceError(detail=get_error_message("PDF_GENERATION_ERROR"))
+    except Exception as e:
+        api_logger.error("PDF generation failed", petition_id=petition_id, error=str(e))
+        raise DatabaseError(detail=get_error_message("DATABASE_ERROR"))
+
+@router.get("/{petition_id}/document")
+async def get_petition_document(
+    petition_id: int,
+    format: Optional[str] = Query(None, description="Çıktı formatı: pdf, html, docx"),
+    accept: Optional[str] = Header(None),
+    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Dilekçeyi istenen formatta döndürür.
+    
+    Format sorgu parametresi ile, verilmezse Accept başlığına göre seçilir.
+    HTML uygulama içi önizleme içindir ve PDF oluşturmaz; DOCX düzenlenebilir
+    olduğu için premium kullanıcılara açıktır.
+    
+    Args:
+        petition_id: Dilekçe ID
+        format: Çıktı formatı
+        accept: Accept başlığı
+        current_user: Aktif kullanıcı
+        db: Veritabanı oturumu
+    
+    Returns:
+        Dilekçe çıktısı
+    
+    Raises:
+        HTTPException: Desteklenmeyen format, dilekçe bulunamadı veya oluşturma hatası
+    """
+    fmt = negotiate_format(format, accept)
+    if fmt is None:
+        api_logger.warning("Unsupported document format", petition_id=petition_id, format=format)
+        raise ValidationError(detail=get_error_message("UNSUPPORTED_FORMAT"))
+    
+    if fmt == "docx" and not current_user.is_premium_active():
+        raise PremiumRequiredError(detail=get_error_message("PREMIUM_REQUIRED"))
+    
+    try:
+        petition = await get_owned_petition(db, petition_id, current_user)
         
-        return FileResponse(
-            pdf_path,
-            media_type="application/pdf",
-            filename=f"dilekce_{petition_id}.pdf"
+        if fmt == "pdf":
+            return await _pdf_response(db, petition, current_user)
+        
+        renderer = RENDERERS[fmt]
+        data = render_document(fmt, petition.content, get_pdf_metadata(petition))
+        headers = {}
+        if fmt == "docx":
+            headers["Content-Disposition"] = f'attachment; filename="dilekce_{petition_id}.{renderer.extension}"'
+        return Response(content=data, media_type=renderer.media_type, headers=headers)
+    except LegalAssistantException:
+        raise
+    except Exception as e:
+        api_logger.error("Document rendering failed", petition_id=petition_id, format=fmt, error=str(e))
+        raise AIServiceError(detail=get_error_message("PDF_GENERATION_ERROR"))
+
+@router.patch("/{petition_id}", response_model=PetitionResponse)
+async def update_petition(
+    petition_id: int,
+    petition_update: PetitionUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Dilekçe içeriğini veya durumunu günceller.
+
+    İyimser eşzamanlılık: düzenlenen sürüm If-Match başlığı (GET yanıtındaki
+    ETag) veya version alanı ile bildirilmelidir; dilekçe bu arada
+    değiştiyse 412 döner. Önceki sürüm revizyon geçmişine eklenir.
+
+    Args:
+        petition_id: Dilekçe ID
+        petition_update: Güncellenecek alanlar
+        response: Yanıt (ETag başlığı)
+        if_match: Beklenen sürüm
+        current_user: Aktif kullanıcı
+        db: Veritabanı oturumu
+
+    Returns:
+        Güncellenmiş dilekçe
+
+    Raises:
+        PreconditionRequiredError: Sürüm bildirilmedi
+        PreconditionFailedError: Dilekçe başka bir istekle değişti
+    """
+    if if_match is not None:
+        expected_version = parse_if_match(if_match)
+    elif petition_update.version is not None:
+        expected_version = petition_update.version
+    else:
+        raise PreconditionRequiredError(detail=get_error_message("VERSION_REQUIRED"))
+
+    try:
+        await get_owned_petition(db, petition_id, current_user)
+        # Satır kilitlenir ve güncel değerlerle yeniden okunur
+        petition = (await db.execute(
+            select(models.Petition)
+            .where(models.Petition.id == petition_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )).scalar_one()
+
+        if expected_version is not None and petition.version != expected_version:
+            api_logger.warning(
+                "Petition version conflict",
+                petition_id=petition_id,
+                expected=expected_version,
+                current=petition.version
+            )
+            raise PreconditionFailedError(detail=get_error_message("VERSION_CONFLICT"))
+
+        content_changed = petition_update.content is not None and petition_update.content != petition.content
+        status_changed = petition_update.status is not None and petition_update.status != petition.status
+        if content_changed or status_changed:
+            new_content = petition_update.content if content_changed else petition.content
+            db.add(build_revision(petition.id, petition.version, petition.content, new_content))
+            if content_changed:
+                petition.content = new_content
+                # Eski PDF artık içerikle eşleşmiyor; dosyayı çöp toplayıcı siler
+                petition.set_pdf_path(None)
+            if status_changed:
+                petition.update_status(petition_update.status)
+            petition.version += 1
+            await db.commit()
+            await db.refresh(petition)
+            api_logger.info("Petition updated", petition_id=petition_id, version=petition.version)
+
+        response.headers["ETag"] = make_etag(petition)
+        return petition
+    except LegalAssistantException:
+        raise
+    except Exception as e:
+        await db.rollback()
+        api_logger.error("Petition update failed", petition_id=petition_id, error=str(e))
+        raise DatabaseError(detail=get_error_message("DATABASE_ERROR"))
+
+@router.put("/{petition_id}/autosave", response_model=AutosaveStatus, status_code=status.HTTP_202_ACCEPTED)
+async def autosave_petition(
+    petition_id: int,
+    draft: PetitionAutosave,
+    request: Request,
+    response: Response,
+    current_user: models.User = Depends(get_current_user)
+):
+    """
+    Editör taslağını otomatik kayıt tamponuna yazar.
+    Taslak veritabanına en fazla AUTOSAVE_FLUSH_SECONDS'da bir yazılır;
+    sürüm numarası değişmez.
+
+    Args:
+        petition_id: Dilekçe ID
+        draft: Taslak içerik ve düzenlenen sürüm
+        request: İstek
+        response: Yanıt (read-your-writes cookie'si)
+        current_user: Aktif kullanıcı
+
+    Returns:
+        Otomatik kayıt durumu
+
+    Raises:
+        PreconditionFailedError: Dilekçe başka bir istekle değişti
+    """
+    saved = await autosave_buffer.put(petition_id, current_user.id, draft.version, draft.content)
+    if saved:
+        mark_request_write(request, response)
+    return AutosaveStatus(petition_id=petition_id, version=draft.version, saved=saved)
+
+@router.post("/{petition_id}/autosave/flush", response_model=AutosaveStatus)
+async def flush_petition_autosave(
+    petition_id: int,
+    request: Request,
+    response: Response,
+    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Editör oturumu kapanırken bekleyen taslağı hemen yazar. Taslak
+    yazıldıysa kullanıcının sonraki okumaları primary'ye gider.
+
+    Args:
+        petition_id: Dilekçe ID
+        request: İstek
+        response: Yanıt (read-your-writes cookie'si)
+        current_user: Aktif kullanıcı
+        db: Veritabanı oturumu
+
+    Returns:
+        Otomatik kayıt durumu
+    """
+    petition = await get_owned_petition(db, petition_id, current_user)
+    saved = await autosave_buffer.flush(petition_id)
+    if saved:
+        mark_request_write(request, response)
+    return AutosaveStatus(petition_id=petition_id, version=petition.version, saved=saved)
+
+@router.get("/{petition_id}/revisions", response_model=List[PetitionRevisionInfo])
+async def list_petition_revisions(
+    petition_id: int,
+    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Dilekçenin önceki sürümlerini yeniden eskiye listeler.
+
+    Args:
+        petition_id: Dilekçe ID
+        current_user: Aktif kullanıcı
+        db: Veritabanı oturumu
+
+    Returns:
+        Sürüm listesi
+    """
+    await get_owned_petition(db, petition_id, current_user)
+    rows = (await db.execute(
+        select(models.PetitionRevision.version, models.PetitionRevision.created_at)
+        .where(models.PetitionRevision.petition_id == petition_id)
+        .order_by(models.PetitionRevision.version.desc())
+    )).all()
+    return [PetitionRevisionInfo(version=version, replaced_at=created_at) for version, created_at in rows]
+
+@router.get("/{petition_id}/revisions/{version}", response_model=PetitionRevisionContent)
+async def get_petition_revision(
+    petition_id: int,
+    version: int,
+    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Dilekçenin belirli bir sürümünün içeriğini döndürür.
+
+    Args:
+        petition_id: Dilekçe ID
+        version: Sürüm numarası
+        current_user: Aktif kullanıcı
+        db: Veritabanı oturumu
+
+    Returns:
+        Sürüm içeriği
+
+    Raises:
+        ValidationError: Sürüm bulunamadı
+        DatabaseError: Revizyon zinciri bozuk
+    """
+    petition = await get_owned_petition(db, petition_id, current_user)
+    try:
+        content = await get_revision_content(db, petition, version)
+    except (ValueError, KeyError) as e:
+        api_logger.error(
+            "Petition revision reconstruction failed",
+            petition_id=petition_id,
+            version=version,
+            current_version=petition.version,
+            error=str(e)
         )
+        raise DatabaseError(detail=get_error_message("DATABASE_ERROR"))
+    if content is None:
+        raise ValidationError(detail=get_error_message("REVISION_NOT_FOUND"))
+    return PetitionRevisionContent(version=version, content=content)
+
+# Parametreli yol diğer GET yollarını (/list, /export.zip) gölgelememesi için en sonda tanımlanır
+@router.get("/{petition_id}", response_model=PetitionResponse)
+async def get_petition(
+    petition_id: int,
+    response: Response,
+    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Dilekçenin içerik dahil tüm bilgilerini döndürür.
+    
+    Args:
+        petition_id: Dilekçe ID
+        response: Yanıt (ETag başlığı)
+        current_user: Aktif kullanıcı
+        db: Veritabanı oturumu
+    
+    Returns:
+        Dilekçe detayı
+    
+    Raises:
+        HTTPException: Dilekçe bulunamadı veya veritabanı hatası
+    """
+    try:
+        petition = await get_owned_petition(db, petition_id, current_user)
+        api_logger.info("Petition retrieved", petition_id=petition_id, user_id=current_user.id)
+        response.headers["ETag"] = make_etag(petition)
+        return petition
+    except LegalAssistantException:
+        raise
     except Exception as e:
-        api_logger.error("PDF generation failed", petition_id=petition_id, error=str(e))
-        raise DatabaseError(detail=get_error_message("DATABASE_ERROR")) 
\ No newline at end of file
+        api_logger.error("Failed to retrieve petition", petition_id=petition_id, error=str(e))
+        raise DatabaseError(detail=get_error_message("DATABASE_ERROR"))
@@ -2,7 +2,7 @@ from openai import OpenAI, OpenAIError
 from app.core.config import settings
 from app.core.exceptions import AIServiceError, ValidationError, get_error_message
 from app.schemas.petition import PetitionType
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from app.core.logger import ai_logger
 import logging
 import json
@@ -31,6 +31,28 @@ class AIHandler:
         Returns:
             str: Oluşturulan dilekçe içeriği
 
+        Raises:
+            ValidationError: Geçersiz veri
+            AIServiceError: AI servisi hatası
+        """
+        content, _ = self.generate_petition_with_usage(petition_type, data)
+        return content
+
+    def generate_petition_with_usage(
+        self,
+        petition_type: PetitionType,
+        data: Dict[str, Any]
+    ) -> Tuple[str, Optional[int]]:
+        """
+        AI ile dilekçe içeriği oluşturur ve token kullanımını döndürür.
+
+        Args:
+            petition_type: Dilekçe tipi
+            data: Dilekçe verileri
+
+        Returns:
+            Tuple[str, Optional[int]]: Dilekçe içeriği ve toplam token sayısı
+
         Raises:
             ValidationError: Geçersiz veri
             AIServiceError: AI servisi hatası
@@ -49,8 +71,9 @@ class AIHandler:
             )
             
             content = response.choices[0].message.content
-            ai_logger.info("Petition generated successfully")
-            return self._format_response(content)
+            total_tokens = response.usage.total_tokens if response.usage else None
+            ai_logger.info("Petition generated successfully", total_tokens=total_tokens)
+            return self._format_response(content), total_tokens
             
         except ValidationError as e:
             ai_logger.error("Validation error", error=str(e))
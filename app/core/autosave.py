@@ -0,0 +1,278 @@
+"""
+Editör taslakları için yazma birleştiren otomatik kayıt tamponu.
+
+Her dilekçenin son taslağı worker belleğinde tutulur; veritabanına en
+fazla AUTOSAVE_FLUSH_SECONDS'da bir, editör oturumu kapandığında veya
+uygulama kapanırken yazılır. Aradaki taslaklar yalnızca bellekte üzerine
+yazılır. Otomatik kayıt sürüm numarasını değiştirmez; düzenlenen sürüm
+başka bir istekle (PATCH) değiştiyse taslak yazılmaz ve editör bir sonraki
+otomatik kayıtta 412 alır. Önceki sürümün revizyon kaydı yeni içeriğe göre
+aynı transaction'da yeniden yazılır (app.db.revisions).
+
+Tampon worker başınadır; aynı editör oturumunun istekleri farklı
+worker'lara düşebilir. Her taslak alındığı zamanla (saved_at) tutulur ve
+petitions.autosaved_at'tan yeni değilse yazılmaz; koşullu UPDATE sayesinde
+bir worker'daki eski taslak başka bir worker'ın yazdığı yeni taslağı ezmez.
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import or_, select, update
+from app.core.config import settings
+from app.core.exceptions import (
+    AuthorizationError,
+    PreconditionFailedError,
+    ValidationError,
+    get_error_message
+)
+from app.core.logger import db_logger
+from app.db import models
+from app.db.archive import restore_petition
+from app.db.database import AsyncSessionLocal
+from app.db.revisions import rebase_previous_revision
+
+AUTOSAVE_REQUESTS = Counter(
+    "autosave_requests_total",
+    "Accepted autosave requests"
+)
+
+AUTOSAVE_WRITES = Counter(
+    "autosave_db_writes_total",
+    "Database writes performed by the autosave buffer",
+    ["reason"]  # interval, session_end, shutdown, overflow
+)
+
+AUTOSAVE_COALESCED = Histogram(
+    "autosave_coalesced_requests",
+    "Autosave requests merged into a single database write",
+    buckets=(1, 2, 5, 10, 20, 50, 100)
+)
+
+AUTOSAVE_CONFLICTS = Counter(
+    "autosave_conflicts_total",
+    "Buffered drafts dropped because the petition version changed"
+)
+
+AUTOSAVE_SUPERSEDED = Counter(
+    "autosave_superseded_total",
+    "Buffered drafts skipped because a newer draft was already written"
+)
+
+AUTOSAVE_PENDING = Gauge(
+    "autosave_pending_drafts",
+    "Drafts buffered in memory and not yet written"
+)
+
+@dataclass
+class Draft:
+    """Tampondaki dilekçe taslağı"""
+    user_id: int
+    version: int  # Taslağın dayandığı sürüm
+    content: Optional[str] = None  # None: yazılmamış değişiklik yok
+    saved_at: Optional[datetime] = None  # İçeriğin alındığı zaman (worker'lar arası sıralama)
+    requests: int = 0  # Son yazmadan bu yana birleşen istek sayısı
+    last_write: float = 0.0
+    last_seen: float = 0.0
+
+class AutosaveBuffer:
+    """Worker başına otomatik kayıt tamponu"""
+
+    def __init__(self):
+        self._drafts: Dict[int, Draft] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Yazılmayı bekleyen taslak sayısı"""
+        return sum(1 for draft in self._drafts.values() if draft.content is not None)
+
+    async def _load(self, petition_id: int, user_id: int, version: int) -> Draft:
+        """Tamponda olmayan dilekçe için sahiplik ve sürüm kontrolü (primary)"""
+        async with AsyncSessionLocal() as db:
+            petition = await db.get(models.Petition, petition_id)
+        if petition is None:
+            raise ValidationError(detail=get_error_message("PETITION_NOT_FOUND"))
+        if petition.user_id != user_id:
+            raise AuthorizationError(detail=get_error_message("UNAUTHORIZED_ACCESS"))
+        if petition.version != version:
+            raise PreconditionFailedError(detail=get_error_message("VERSION_CONFLICT"))
+        now = time.monotonic()
+        return Draft(user_id=user_id, version=version, last_write=now, last_seen=now)
+
+    async def put(self, petition_id: int, user_id: int, version: int, content: str) -> bool:
+        """
+        Taslağı tampona yazar. Yalnızca dilekçe tamponda yoksa veya editör
+        farklı bir sürüm bildirdiyse veritabanına bakılır.
+
+        Args:
+            petition_id: Dilekçe ID
+            user_id: İstek yapan kullanıcı
+            version: Editörün düzenlediği sürüm
+            content: Taslak içerik
+
+        Returns:
+            bool: Taslak hemen yazıldı mı (tampon dolu)
+
+        Raises:
+            ValidationError: Dilekçe bulunamadı
+            AuthorizationError: Dilekçe başka bir kullanıcıya ait
+            PreconditionFailedError: Sürüm değişmiş
+        """
+        draft = self._drafts.get(petition_id)
+        if draft is None or draft.user_id != user_id or draft.version != version:
+            draft = await self._load(petition_id, user_id, version)
+
+        async with self._lock:
+            # Bekleme sırasında aynı sürüm için eklenmiş veya yazılıp çıkarılmış olabilir
+            existing = self._drafts.get(petition_id)
+            if existing is not None and existing.user_id == user_id and existing.version == version:
+                draft = existing
+            else:
+                self._drafts[petition_id] = draft
+            draft.content = content
+            draft.saved_at = datetime.utcnow()
+            draft.requests += 1
+            draft.last_seen = time.monotonic()
+            overflow = self.pending > settings.AUTOSAVE_MAX_PENDING
+            AUTOSAVE_PENDING.set(self.pending)
+        AUTOSAVE_REQUESTS.inc()
+
+        # Bellek sınırı aşıldıysa taslak beklemeden yazılır
+        if overflow:
+            return await self.flush(petition_id, reason="overflow")
+        return False
+
+    async def flush(self, petition_id: int, reason: str = "session_end") -> bool:
+        """
+        Dilekçenin bekleyen taslağını hemen yazar.
+
+        Args:
+            petition_id: Dilekçe ID
+            reason: Metrik etiketi
+
+        Returns:
+            bool: Taslak veritabanına yazıldı mı (bekleyen taslak yoksa,
+            sürüm değiştiyse, daha yeni bir taslak yazılmışsa veya yazma
+            başarısızsa False)
+        """
+        async with self._lock:
+            draft = self._drafts.get(petition_id)
+            if draft is None:
+                return False
+            content, saved_at, requests = draft.content, draft.saved_at, draft.requests
+            draft.content, draft.requests = None, 0
+            draft.last_write = time.monotonic()
+            if reason in ("session_end", "shutdown"):
+                self._drafts.pop(petition_id, None)
+            AUTOSAVE_PENDING.set(self.pending)
+
+        if content is None:
+            return False
+        return await self._write(petition_id, draft, content, saved_at, requests, reason)
+
+    async def _write(
+        self,
+        petition_id: int,
+        draft: Draft,
+        content: str,
+        saved_at: datetime,
+        requests: int,
+        reason: str
+    ) -> bool:
+        """
+        Taslağı dilekçe içeriğine yazar. Sürüm değiştiyse taslak bırakılır;
+        başka bir worker daha yeni bir taslak yazdıysa yazılmaz.
+        """
+        petitions = models.Petition.__table__
+        try:
+            async with AsyncSessionLocal() as db:
+                petition = await db.get(models.Petition, petition_id)
+                if petition is not None and petition.archived_at is not None:
+                    await restore_petition(petition_id)
+                # Koşullu UPDATE satırı kilitler; yalnızca daha yeni taslak yazılabilir
+                claimed = (await db.execute(
+                    update(petitions)
+                    .where(
+                        petitions.c.id == petition_id,
+                        petitions.c.version == draft.version,
+                        or_(petitions.c.autosaved_at.is_(None), petitions.c.autosaved_at < saved_at)
+                    )
+                    .values(autosaved_at=saved_at)
+                )).rowcount
+                petition = (await db.execute(
+                    select(models.Petition)
+                    .where(models.Petition.id == petition_id)
+                    .execution_options(populate_existing=True)
+                )).scalar_one_or_none()
+
+                if petition is None or petition.version != draft.version:
+                    AUTOSAVE_CONFLICTS.inc()
+                    async with self._lock:
+                        if self._drafts.get(petition_id) is draft:
+                            del self._drafts[petition_id]
+                    db_logger.warning("Autosave draft dropped", petition_id=petition_id, version=draft.version)
+                    return False
+                if not claimed:
+                    AUTOSAVE_SUPERSEDED.inc()
+                    db_logger.info("Autosave draft superseded", petition_id=petition_id, version=draft.version)
+                    return False
+
+                if petition.content != content:
+                    try:
+                        await rebase_previous_revision(db, petition, content)
+                    except ValueError as e:
+                        # Zincir zaten bozuk; taslak yine de yazılır
+                        db_logger.error(
+                            "Revision rebase failed",
+                            petition_id=petition_id,
+                            version=petition.version,
+                            error=str(e)
+                        )
+                    petition.content = content
+                    # Eski PDF artık içerikle eşleşmiyor; dosyayı çöp toplayıcı siler
+                    petition.set_pdf_path(None)
+                await db.commit()
+            AUTOSAVE_WRITES.labels(reason=reason).inc()
+            AUTOSAVE_COALESCED.observe(requests)
+            return True
+        except Exception as e:
+            # Yazılamayan taslak, yerine yenisi gelmediyse tekrar denenmek üzere geri konur
+            async with self._lock:
+                self._drafts.setdefault(petition_id, draft)
+                if draft.content is None:
+                    draft.content = content
+                    draft.saved_at = saved_at
+                    draft.requests += requests
+                AUTOSAVE_PENDING.set(self.pending)
+            db_logger.error("Autosave write failed", petition_id=petition_id, error=str(e))
+            return False
+
+    async def flush_due(self) -> None:
+        """
+        Son yazmasının üzerinden AUTOSAVE_FLUSH_SECONDS geçmiş taslakları yazar;
+        AUTOSAVE_IDLE_SECONDS boyunca kullanılmayan temiz kayıtları bırakır.
+        Arka plan görevi olarak periyodik çalıştırılır.
+        """
+        now = time.monotonic()
+        async with self._lock:
+            due = [
+                petition_id for petition_id, draft in self._drafts.items()
+                if draft.content is not None and now - draft.last_write >= settings.AUTOSAVE_FLUSH_SECONDS
+            ]
+            for petition_id, draft in list(self._drafts.items()):
+                if draft.content is None and now - draft.last_seen >= settings.AUTOSAVE_IDLE_SECONDS:
+                    del self._drafts[petition_id]
+        for petition_id in due:
+            await self.flush(petition_id, reason="interval")
+
+    async def flush_all(self) -> None:
+        """Tüm bekleyen taslakları yazar (uygulama kapanırken)"""
+        for petition_id in list(self._drafts):
+            await self.flush(petition_id, reason="shutdown")
+        db_logger.info("Autosave buffer flushed")
+
+# Worker başına tampon
+autosave_buffer = AutosaveBuffer()
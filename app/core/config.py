@@ -19,16 +19,39 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    PASSWORD_BCRYPT_ROUNDS: int = 12  # Değiştirilirse eski hash'ler girişte yeniden hash'lenir
+    PASSWORD_HASH_WORKERS: int = 2  # Worker başına hash thread'i
+    PASSWORD_HASH_MAX_QUEUE: int = 32  # Aşılırsa giriş/kayıt istekleri 429 alır
+    REVOCATION_BLOOM_CAPACITY: int = 100000  # Aşılırsa filtre yeniden oluşturulur
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    REVOCATION_POLL_SECONDS: float = 2.0  # İptal edilen token'ların filtreye eklenme aralığı
+    REVOCATION_REBUILD_SECONDS: int = 3600  # Süresi dolan kayıtların silinip filtrenin yeniden oluşturulma aralığı
     ALLOWED_HOSTS: list = ["api.dilekce.com"]
+    ADMIN_EMAILS: list = []  # /admin endpoint'lerine erişebilen kullanıcılar (JSON liste)
+    USER_CACHE_TTL_SECONDS: int = 60  # Kimliği doğrulanmış kullanıcı önbelleği (worker başına)
+    USER_CACHE_MAX_ENTRIES: int = 10000
+    USER_CACHE_POLL_SECONDS: float = 2.0  # Diğer worker'lardaki değişikliklerin taranma aralığı
+    PREMIUM_EXPIRY_INTERVAL_SECONDS: int = 300  # Süresi dolan premium üyeliklerin kapatılma aralığı
     
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
     
     # Veritabanı
     SQLALCHEMY_DATABASE_URI: str
-    DB_POOL_SIZE: int = 20
-    DB_MAX_OVERFLOW: int = 10
+    SQLALCHEMY_ASYNC_DATABASE_URI: Optional[str] = None  # Verilmezse SQLALCHEMY_DATABASE_URI'den türetilir
+    DB_POOL_SIZE: int = 20  # Tüm worker'lar için toplam
+    DB_MAX_OVERFLOW: int = 10  # Tüm worker'lar için toplam
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_SYNC_POOL_SIZE: int = 2  # Arka plan görevleri (worker başına)
+    WEB_CONCURRENCY: int = 1  # Gunicorn worker sayısı
     DB_ECHO: bool = False
+    DB_REPLICA_URLS: list = []  # Okuma replikaları (JSON liste)
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DB_REPLICA_LAG_CHECK_SECONDS: int = 5
+    DB_READ_YOUR_WRITES_SECONDS: int = 10  # Yazma sonrası okumalar bu süre primary'ye gider
+    CONTENT_COMPRESSION_LEVEL: int = 9  # zlib seviyesi (1-9)
     
     # OpenAI
     OPENAI_API_KEY: str
@@ -41,6 +64,7 @@ class Settings(BaseSettings):
     SENTRY_DSN: Optional[str] = None
     LOG_LEVEL: str = "INFO"
     ENABLE_METRICS: bool = True
+    STATS_REFRESH_SECONDS: int = 60  # /metrics tablo sayılarının yenilenme aralığı
     
     # CORS
     BACKEND_CORS_ORIGINS: list = [
@@ -54,6 +78,41 @@ class Settings(BaseSettings):
     PDF_DIR: str = "/var/www/dilekce/pdfs"
     LOG_DIR: str = "/var/log/dilekce"
     
+    # PDF
+    PDF_WATERMARK_TEXT: str = "ÖNİZLEME"
+    PDF_EXPORT_WORKERS: int = 4
+    PDF_GC_INTERVAL_SECONDS: int = 3600
+    PDF_GC_GRACE_SECONDS: int = 3600
+    PDF_ACCEL_REDIRECT_PREFIX: Optional[str] = None  # ör. "/protected-pdfs/" (nginx internal location)
+    RENDER_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    PDF_DELETE_BATCH_SIZE: int = 500  # Hesap silmede PDF referans kontrolü parti boyutu
+    
+    # Listeleme
+    PETITION_EXCERPT_LENGTH: int = 160
+    SEARCH_SNIPPET_WORDS: int = 24
+    
+    # Revizyonlar
+    REVISION_SNAPSHOT_INTERVAL: int = 20  # Her N sürümde bir tam içerik saklanır
+    
+    # Otomatik kayıt
+    AUTOSAVE_FLUSH_SECONDS: int = 10  # Bir dilekçenin taslağı en fazla bu aralıkla yazılır
+    AUTOSAVE_CHECK_SECONDS: float = 1.0
+    AUTOSAVE_IDLE_SECONDS: int = 300  # Kullanılmayan tampon kayıtları bu süre sonra bırakılır
+    AUTOSAVE_MAX_PENDING: int = 10000  # Aşılırsa taslaklar beklemeden yazılır
+    
+    # Arşivleme
+    ARCHIVE_AFTER_DAYS: int = 90  # Bu süre boyunca değişmeyen dilekçeler arşivlenir
+    ARCHIVE_INTERVAL_SECONDS: int = 3600
+    ARCHIVE_BATCH_SIZE: int = 500
+    ARCHIVE_BATCH_PAUSE_SECONDS: float = 1.0  # Partiler arası bekleme (primary yükünü sınırlar)
+    ARCHIVE_MAX_BATCHES: int = 20  # Tek çalıştırmada işlenen en fazla parti
+    
+    # Analitik
+    ANALYTICS_ROLLUP_INTERVAL_SECONDS: int = 3600
+    ANALYTICS_ROLLUP_GRACE_SECONDS: int = 900  # Gün bittikten sonra geç gelen yazmalar için bekleme
+    ANALYTICS_ROLLUP_MAX_DAYS: int = 31  # Tek çalıştırmada işlenen en fazla gün
+    ANALYTICS_MAX_RANGE_DAYS: int = 366
+    
     # Test ayarları
     TESTING: bool = False
     TEST_DB_URL: Optional[str] = None
@@ -69,6 +128,35 @@ class Settings(BaseSettings):
             return self.TEST_DB_URL
         return self.SQLALCHEMY_DATABASE_URI
 
+    def get_worker_pool_size(self) -> int:
+        """Worker başına bağlantı havuzu boyutunu döndürür"""
+        return max(1, self.DB_POOL_SIZE // max(1, self.WEB_CONCURRENCY))
+
+    def get_worker_max_overflow(self) -> int:
+        """Worker başına ek bağlantı sınırını döndürür"""
+        return max(0, self.DB_MAX_OVERFLOW // max(1, self.WEB_CONCURRENCY))
+
+    def get_async_db_url(self) -> str:
+        """
+        Asenkron sürücülü veritabanı URL'ini döndürür.
+        postgresql -> postgresql+asyncpg, sqlite -> sqlite+aiosqlite
+        """
+        if self.SQLALCHEMY_ASYNC_DATABASE_URI:
+            return self.SQLALCHEMY_ASYNC_DATABASE_URI
+        return self.to_async_db_url(self.get_db_url())
+
+    @staticmethod
+    def to_async_db_url(url: str) -> str:
+        """Senkron sürücülü URL'i asenkron sürücüye çevirir"""
+        scheme, separator, rest = url.partition("://")
+        driver_map = {
+            "postgresql": "postgresql+asyncpg",
+            "postgresql+psycopg2": "postgresql+asyncpg",
+            "postgres": "postgresql+asyncpg",
+            "sqlite": "sqlite+aiosqlite",
+        }
+        return f"{driver_map.get(scheme, scheme)}{separator}{rest}"
+
     def ensure_directories(self) -> None:
         """Gerekli dizinleri oluşturur"""
         directories = [
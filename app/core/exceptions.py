@@ -60,6 +60,22 @@ class PremiumRequiredError(LegalAssistantException):
             detail=detail
         )
 
+class PreconditionFailedError(LegalAssistantException):
+    """Optimistic concurrency conflicts (stale version)"""
+    def __init__(self, detail: str = "Precondition failed"):
+        super().__init__(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=detail
+        )
+
+class PreconditionRequiredError(LegalAssistantException):
+    """Conditional request required (missing version)"""
+    def __init__(self, detail: str = "Precondition required"):
+        super().__init__(
+            status_code=status.HTTP_428_PRECONDITION_REQUIRED,
+            detail=detail
+        )
+
 class RateLimitError(LegalAssistantException):
     """Rate limiting errors"""
     def __init__(self, detail: str = "Too many requests"):
@@ -75,9 +91,12 @@ ERROR_MESSAGES = {
     "INVALID_CREDENTIALS": "Invalid email or password",
     "TOKEN_EXPIRED": "Token has expired",
     "TOKEN_INVALID": "Invalid token",
+    "TOKEN_REVOKED": "Token has been revoked",
+    "REFRESH_TOKEN_INVALID": "Invalid or expired refresh token",
     "USER_NOT_FOUND": "User not found",
     "EMAIL_EXISTS": "Email already registered",
     "INACTIVE_USER": "User is inactive",
+    "ADMIN_REQUIRED": "This endpoint requires admin privileges",
     
     # Premium errors
     "PREMIUM_REQUIRED": "This feature requires premium subscription",
@@ -87,6 +106,13 @@ ERROR_MESSAGES = {
     "INVALID_EMAIL": "Invalid email format",
     "WEAK_PASSWORD": "Password is too weak",
     "INVALID_DATE": "Invalid date format",
+    "UNSUPPORTED_FORMAT": "Unsupported document format",
+    "INVALID_CURSOR": "Invalid pagination cursor",
+    "INVALID_FIELDS": "Invalid field selection",
+    "INVALID_DATE_RANGE": "Invalid date range",
+    "VERSION_CONFLICT": "Petition was modified by another request; reload and retry",
+    "VERSION_REQUIRED": "If-Match header or version is required",
+    "REVISION_NOT_FOUND": "Revision not found",
     
     # Service errors
     "AI_SERVICE_ERROR": "AI service is temporarily unavailable",
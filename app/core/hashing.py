@@ -0,0 +1,125 @@
+"""
+Şifre hash'leme için sınırlı executor.
+
+bcrypt istek thread havuzunda değil, PASSWORD_HASH_WORKERS thread'lik ayrı
+bir havuzda çalışır; giriş yoğunluğu diğer endpoint'lerin thread'lerini
+tüketmez. Çalışan ve bekleyen işlerin toplamı PASSWORD_HASH_WORKERS +
+PASSWORD_HASH_MAX_QUEUE'yu aşarsa yeni istekler RateLimitError (429) ile
+reddedilir.
+
+Hash maliyeti PASSWORD_BCRYPT_ROUNDS ile ayarlanır. Maliyeti farklı eski
+hash'ler başarılı girişte yeniden hash'lenir (passlib needs_update), böylece
+maliyet değişikliği kademeli olarak uygulanır.
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+from passlib.context import CryptContext
+from prometheus_client import Counter, Gauge, Histogram
+from app.core.config import settings
+from app.core.exceptions import RateLimitError, get_error_message
+from app.core.logger import auth_logger
+
+# Password hashing
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS)
+
+PASSWORD_HASH_QUEUE_TIME = Histogram(
+    "password_hash_queue_seconds",
+    "Time password hashing jobs wait for a hashing thread",
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Password hashing CPU time",
+    ["operation"],  # hash, verify
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5)
+)
+
+PASSWORD_HASH_PENDING = Gauge(
+    "password_hash_pending",
+    "Password hashing jobs running or queued"
+)
+
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hashing jobs rejected because the queue was full",
+    ["operation"]
+)
+
+PASSWORD_REHASHED = Counter(
+    "password_rehashed_total",
+    "Password hashes upgraded to the current cost on login"
+)
+
+class PasswordHasher:
+    """Şifre hash'leme ve doğrulama için sınırlı thread havuzu"""
+
+    def __init__(self, workers: int, max_queue: int):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._limit = workers + max_queue
+        self._pending = 0
+
+    async def _run(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self._limit:
+            PASSWORD_HASH_REJECTED.labels(operation=operation).inc()
+            auth_logger.warning("Password hashing queue full", operation=operation, pending=self._pending)
+            raise RateLimitError(detail=get_error_message("RATE_LIMIT_EXCEEDED"))
+
+        submitted = time.perf_counter()
+
+        def job() -> Any:
+            started = time.perf_counter()
+            PASSWORD_HASH_QUEUE_TIME.observe(started - submitted)
+            try:
+                return func(*args)
+            finally:
+                PASSWORD_HASH_DURATION.labels(operation=operation).observe(time.perf_counter() - started)
+
+        self._pending += 1
+        PASSWORD_HASH_PENDING.set(self._pending)
+        try:
+            # İstek iptal edilirse henüz başlamamış iş de iptal edilir
+            return await asyncio.wrap_future(self._executor.submit(job))
+        finally:
+            self._pending -= 1
+            PASSWORD_HASH_PENDING.set(self._pending)
+
+    async def hash(self, password: str) -> str:
+        """
+        Şifreyi hash'ler.
+
+        Args:
+            password: Ham şifre
+
+        Returns:
+            str: Hash'lenmiş şifre
+
+        Raises:
+            RateLimitError: Hash kuyruğu dolu
+        """
+        return await self._run("hash", pwd_context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Şifreyi doğrular; hash'in maliyeti güncel değilse yeni hash üretir.
+
+        Args:
+            password: Ham şifre
+            hashed_password: Kayıtlı hash
+
+        Returns:
+            Tuple[bool, Optional[str]]: Şifre doğru mu ve varsa kaydedilecek yeni hash
+
+        Raises:
+            RateLimitError: Hash kuyruğu dolu
+        """
+        return await self._run("verify", pwd_context.verify_and_update, password, hashed_password)
+
+    def shutdown(self) -> None:
+        """Havuzu kapatır (uygulama kapanırken)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+# Worker başına hash havuzu
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_QUEUE)
@@ -1,9 +1,7 @@
 from prometheus_fastapi_instrumentator import Instrumentator
-from prometheus_client import Counter, Gauge, generate_latest, Histogram
-from fastapi.responses import PlainTextResponse
+from prometheus_client import Counter, Gauge, Histogram
 from app.core.config import settings
-from sqlalchemy import text
-from app.db.database import SessionLocal
+from app.core.stats import stats_cache
 from fastapi import FastAPI
 import sentry_sdk
 from sentry_sdk.integrations.fastapi import FastApiIntegration
@@ -15,6 +13,17 @@ PETITION_COUNTER = Counter(
     ["type", "model"]  # labels
 )
 
+PETITIONS_STORED = Gauge(
+    "petitions_stored_total",
+    "Number of stored petitions",
+    ["type"]
+)
+
+STATS_REFRESHED = Gauge(
+    "stats_refreshed_timestamp_seconds",
+    "Time of the last table statistics refresh"
+)
+
 USER_GAUGE = Gauge(
     "users_total",
     "Total number of users",
@@ -53,6 +62,12 @@ PREMIUM_USERS = Gauge(
     'Total number of premium users'
 )
 
+PREMIUM_AUTH_CHECKS = Counter(
+    'premium_auth_checks_total',
+    'Premium authorization decisions',
+    ['source']  # claims, database
+)
+
 def init_monitoring(app: FastAPI) -> None:
     """
     Monitoring servislerini başlatır.
@@ -76,38 +91,18 @@ def init_monitoring(app: FastAPI) -> None:
 
     Instrumentator().instrument(app).expose(app, include_in_schema=False)
 
-    @app.get("/metrics", include_in_schema=False)
-    async def metrics():
-        db = SessionLocal()
-        try:
-            # Toplam dilekçe sayısı
-            petition_count = db.execute(
-                text("SELECT petition_type, COUNT(*) FROM petitions GROUP BY petition_type")
-            ).fetchall()
-            
-            for p_type, count in petition_count:
-                PETITION_COUNTER.labels(type=p_type, model="gpt-4").inc(count)
-            
-            # Kullanıcı sayıları
-            user_stats = db.execute(
-                text("""
-                    SELECT 
-                        is_premium,
-                        COUNT(*) as count
-                    FROM users
-                    GROUP BY is_premium
-                """)
-            ).fetchall()
-            
-            for is_premium, count in user_stats:
-                user_type = "premium" if is_premium else "normal"
-                USER_GAUGE.labels(type=user_type).set(count)
-                
-            # Prometheus formatında metrikleri döndür
-            return PlainTextResponse(generate_latest().decode())
-            
-        finally:
-            db.close()
+async def refresh_stats() -> None:
+    """
+    Tablo sayılarını yeniler ve gauge'lara yazar (periyodik görev).
+    /metrics yalnızca kayıtlı değerleri okur; scrape sırasında sorgu çalışmaz.
+    """
+    snapshot = await stats_cache.refresh()
+    for p_type, count in snapshot.petitions_by_type.items():
+        PETITIONS_STORED.labels(type=p_type).set(count)
+    for user_type, count in snapshot.users_by_tier.items():
+        USER_GAUGE.labels(type=user_type).set(count)
+    update_user_metrics(snapshot.active_users, snapshot.users_by_tier.get("premium", 0))
+    STATS_REFRESHED.set(snapshot.refreshed_at)
 
 def record_metrics(method: str, endpoint: str, status_code: int, duration: float) -> None:
     """
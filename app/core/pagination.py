@@ -0,0 +1,63 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Sequence
+from app.core.exceptions import ValidationError, get_error_message
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Keyset sayfalama için opak cursor üretir.
+
+    Args:
+        values: Son satırın sıralama anahtarı değerleri
+
+    Returns:
+        str: URL güvenli cursor
+    """
+    payload = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str, length: int) -> List[Any]:
+    """
+    Cursor'ı çözer.
+
+    Args:
+        cursor: encode_cursor ile üretilmiş değer
+        length: Beklenen değer sayısı
+
+    Returns:
+        List[Any]: Sıralama anahtarı değerleri
+
+    Raises:
+        ValidationError: Geçersiz cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise ValidationError(detail=get_error_message("INVALID_CURSOR"))
+    if not isinstance(values, list) or len(values) != length:
+        raise ValidationError(detail=get_error_message("INVALID_CURSOR"))
+    return values
+
+def parse_cursor_datetime(value: Any) -> datetime:
+    """Cursor içindeki ISO tarih değerini çözer"""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValidationError(detail=get_error_message("INVALID_CURSOR"))
+
+def parse_cursor_int(value: Any) -> int:
+    """Cursor içindeki tam sayı değerini doğrular"""
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValidationError(detail=get_error_message("INVALID_CURSOR"))
+    return value
+
+def parse_cursor_float(value: Any) -> float:
+    """Cursor içindeki sayı değerini doğrular"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValidationError(detail=get_error_message("INVALID_CURSOR"))
+    return float(value)
@@ -5,25 +5,81 @@ from reportlab.lib.units import cm
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
+from pypdf import PdfReader, PdfWriter, PageObject
 from datetime import datetime
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from io import BytesIO
+from typing import Optional, Dict, Any, Tuple, Union, BinaryIO
 import os
 from app.core.logger import api_logger  # Yeni import
 
+# Türkçe karakter destekli font
+FONT_NAME = "DejaVuSerif"
+FONT_PATH = os.path.join(os.path.dirname(__file__), "fonts", "DejaVuSerif.ttf")
+
+# Filigran ayarları
+WATERMARK_FORM_NAME = "Watermark"
+WATERMARK_CACHE_SIZE = 32
+
+@lru_cache(maxsize=WATERMARK_CACHE_SIZE)
+def _get_watermark_overlay(text: str, page_size: Tuple[float, float]) -> bytes:
+    """
+    Filigran katmanını oluşturur ve önbellekte tutar.
+
+    Filigran, tek bir form XObject olarak çizilir; katman sayfası yalnızca
+    bu formu çağırır. Böylece her (metin, sayfa boyutu) için yerleşim bir
+    kez yapılır ve damgalanan tüm sayfalar aynı XObject'i paylaşır.
+
+    Önbellekte katmanın PDF baytları tutulur. PdfReader'a bağlı PageObject
+    nesneleri tembel çözümlendiği için thread'ler arasında paylaşılamaz;
+    her damgalama kendi okuyucusunu oluşturur.
+
+    Args:
+        text: Filigran metni
+        page_size: Sayfa boyutu (genişlik, yükseklik)
+
+    Returns:
+        bytes: Tek sayfalık katman PDF'i
+    """
+    width, height = page_size
+    buffer = BytesIO()
+    overlay = canvas.Canvas(buffer, pagesize=page_size, invariant=1)
+
+    # Metni sayfa köşegenine sığacak şekilde ölçekle
+    diagonal = (width ** 2 + height ** 2) ** 0.5
+    font_size = min(120, 0.7 * diagonal / max(pdfmetrics.stringWidth(text, FONT_NAME, 1), 1))
+
+    overlay.beginForm(WATERMARK_FORM_NAME)
+    overlay.saveState()
+    overlay.setFont(FONT_NAME, font_size)
+    overlay.setFillColor(colors.grey, alpha=0.25)
+    overlay.translate(width / 2, height / 2)
+    overlay.rotate(45)
+    overlay.drawCentredString(0, -font_size / 3, text)
+    overlay.restoreState()
+    overlay.endForm()
+
+    overlay.doForm(WATERMARK_FORM_NAME)
+    overlay.showPage()
+    overlay.save()
+
+    api_logger.info("Watermark overlay created", text=text, page_size=page_size)
+    return buffer.getvalue()
+
 class PDFGenerator:
     """PDF oluşturma sınıfı"""
 
     def __init__(self):
         """Font ve stil ayarlarını başlat"""
         # Türkçe karakter desteği için font ekle
-        font_path = os.path.join(os.path.dirname(__file__), "fonts", "DejaVuSans.ttf")
-        pdfmetrics.registerFont(TTFont("DejaVuSans", font_path))
+        pdfmetrics.registerFont(TTFont(FONT_NAME, FONT_PATH))
 
         # Stiller
         self.styles = getSampleStyleSheet()
         self.styles.add(ParagraphStyle(
             name='Turkish',
-            fontName='DejaVuSans',
+            fontName=FONT_NAME,
             fontSize=11,
             leading=14,
             alignment=4  # Justified alignment
@@ -32,7 +88,7 @@ class PDFGenerator:
     def create_pdf(
         self,
         content: str,
-        output_path: str,
+        output_path: Union[str, BinaryIO],
         metadata: Optional[Dict[str, Any]] = None
     ) -> None:
         """
@@ -40,7 +96,7 @@ class PDFGenerator:
 
         Args:
             content: Dilekçe içeriği
-            output_path: Çıktı dosya yolu
+            output_path: Çıktı dosya yolu veya yazılabilir dosya nesnesi
             metadata: PDF metadata bilgileri
 
         Raises:
@@ -56,14 +112,15 @@ class PDFGenerator:
                 rightMargin=2*cm,
                 leftMargin=2*cm,
                 topMargin=2*cm,
-                bottomMargin=2*cm
+                bottomMargin=2*cm,
+                invariant=1  # Aynı içerik için aynı baytlar (içerik adresli depolama)
             )
 
             # Metadata ekle
             if metadata:
-                doc.setAuthor(metadata.get("author", ""))
-                doc.setTitle(metadata.get("title", ""))
-                doc.setSubject(metadata.get("subject", ""))
+                doc.author = metadata.get("author", "")
+                doc.title = metadata.get("title", "")
+                doc.subject = metadata.get("subject", "")
 
             # İçerik elemanları
             elements = []
@@ -74,7 +131,8 @@ class PDFGenerator:
             elements.append(Spacer(1, 12))
 
             # Tarih
-            date_str = datetime.now().strftime("%d/%m/%Y")
+            date = metadata.get("date") if metadata else None
+            date_str = (date or datetime.now()).strftime("%d/%m/%Y")
             elements.append(Paragraph(f"Tarih: {date_str}", self.styles["Normal"]))
             elements.append(Spacer(1, 12))
 
@@ -95,7 +153,7 @@ class PDFGenerator:
                 colWidths=[100, 200],
                 style=TableStyle([
                     ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, -1), 'DejaVuSans'),
+                    ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
                     ('FONTSIZE', (0, 0), (-1, -1), 11),
                     ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
                 ])
@@ -111,17 +169,82 @@ class PDFGenerator:
             api_logger.error("PDF creation failed", error=str(e))  # Güncellendi
             raise Exception(f"PDF oluşturma hatası: {str(e)}")
 
-    def add_watermark(self, pdf_path: str, watermark_text: str) -> None:
+    def render_bytes(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        PDF'i diske yazmadan bellekte oluşturur.
+
+        Args:
+            content: Dilekçe içeriği
+            metadata: PDF metadata bilgileri
+
+        Returns:
+            bytes: PDF içeriği
+        """
+        buffer = BytesIO()
+        self.create_pdf(content, buffer, metadata)
+        return buffer.getvalue()
+
+    def add_watermark(
+        self,
+        pdf_path: str,
+        watermark_text: str,
+        output_path: Optional[str] = None
+    ) -> None:
         """
         PDF'e filigran ekler.
 
+        Sayfalar yeniden dizilmez; önbellekteki filigran katmanı mevcut
+        sayfaların üzerine damgalanır.
+
         Args:
             pdf_path: PDF dosya yolu
             watermark_text: Filigran metni
-        
-        Not: Bu metod henüz implement edilmedi
+            output_path: Çıktı dosya yolu (verilmezse dosyanın üzerine yazılır)
+
+        Raises:
+            Exception: Filigran ekleme hatası
+        """
+        try:
+            with open(pdf_path, "rb") as source:
+                data = self.watermark_bytes(source.read(), watermark_text)
+            with open(output_path or pdf_path, "wb") as target:
+                target.write(data)
+        except Exception as e:
+            api_logger.error("Watermark failed", pdf_path=pdf_path, error=str(e))
+            raise Exception(f"Filigran ekleme hatası: {str(e)}")
+
+    def watermark_bytes(self, pdf_data: bytes, watermark_text: str) -> bytes:
         """
-        pass  # TODO: Implement watermark functionality
+        Bellekteki PDF içeriğine filigran ekler.
+
+        Args:
+            pdf_data: PDF içeriği
+            watermark_text: Filigran metni
+
+        Returns:
+            bytes: Filigranlı PDF içeriği
+        """
+        reader = PdfReader(BytesIO(pdf_data))
+        writer = PdfWriter()
+        overlays: Dict[Tuple[float, float], PageObject] = {}
+        for source in reader.pages:
+            page_size = (float(source.mediabox.width), float(source.mediabox.height))
+            overlay = overlays.get(page_size)
+            if overlay is None:
+                overlay = PdfReader(BytesIO(_get_watermark_overlay(watermark_text, page_size))).pages[0]
+                overlays[page_size] = overlay
+            # Damgalama yazıcıya eklemeden önce yapılır; yazıcıdaki sayfada yapılsaydı
+            # eski içerik akışları da dosyaya yazılırdı
+            source.merge_page(overlay)
+            page = writer.add_page(source)
+            # merge_page içerik akışını sıkıştırmadan yeniden yazar
+            page.compress_content_streams()
+        if reader.metadata:
+            writer.add_metadata(reader.metadata)
+
+        output = BytesIO()
+        writer.write(output)
+        return output.getvalue()
 
     def merge_pdfs(self, pdf_paths: list, output_path: str) -> None:
         """
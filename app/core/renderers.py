@@ -0,0 +1,245 @@
+import hashlib
+import threading
+import zipfile
+from collections import OrderedDict
+from datetime import datetime
+from html import escape as html_escape
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape as xml_escape
+from app.core.config import settings
+from app.core.logger import api_logger
+
+class DocumentRenderer:
+    """
+    Dilekçe çıktı formatları için temel sınıf.
+    PDF çıktısı PDFGenerator ve içerik adresli depo tarafından üretilir.
+    """
+
+    format: str = ""
+    media_type: str = ""
+    extension: str = ""
+
+    def render(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Dilekçeyi ilgili formatta oluşturur.
+
+        Args:
+            content: Dilekçe içeriği
+            metadata: Başlık, tarih gibi bilgiler
+
+        Returns:
+            bytes: Çıktı içeriği
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _prepare(content: str, metadata: Optional[Dict[str, Any]]) -> Tuple[str, str, List[str]]:
+        """Başlık, tarih ve paragrafları PDF çıktısıyla aynı kurallarla hazırlar"""
+        metadata = metadata or {}
+        title = metadata.get("title") or "DİLEKÇE"
+        date_str = (metadata.get("date") or datetime.now()).strftime("%d/%m/%Y")
+        paragraphs = [p for p in content.split("\n") if p.strip()]
+        return title, date_str, paragraphs
+
+class HTMLRenderer(DocumentRenderer):
+    """Uygulama içi önizleme için hafif HTML çıktısı"""
+
+    format = "html"
+    media_type = "text/html"
+    extension = "html"
+
+    TEMPLATE = (
+        '<!DOCTYPE html><html lang="tr"><head><meta charset="utf-8">'
+        "<title>{title}</title></head><body>"
+        '<article class="dilekce"><h1>{title}</h1>'
+        '<p class="tarih">Tarih: {date}</p>{body}'
+        '<table class="imza"><tr><td>Ad Soyad:</td><td>_________________</td></tr>'
+        "<tr><td>İmza:</td><td>_________________</td></tr></table>"
+        "</article></body></html>"
+    )
+
+    def render(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> bytes:
+        title, date_str, paragraphs = self._prepare(content, metadata)
+        body = "".join(f"<p>{html_escape(p)}</p>" for p in paragraphs)
+        return self.TEMPLATE.format(
+            title=html_escape(title),
+            date=date_str,
+            body=body
+        ).encode("utf-8")
+
+class DOCXRenderer(DocumentRenderer):
+    """
+    Word (DOCX) çıktısı.
+    Ek bağımlılık gerektirmemesi için minimal WordprocessingML paketi üretir.
+    """
+
+    format = "docx"
+    media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    extension = "docx"
+
+    CONTENT_TYPES = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        "</Types>"
+    )
+    RELS = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="word/document.xml"/>'
+        "</Relationships>"
+    )
+    DOCUMENT = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        "<w:body>{body}</w:body></w:document>"
+    )
+
+    @staticmethod
+    def _paragraph(text: str, bold: bool = False, justify: bool = False) -> str:
+        """Tek bir Word paragrafı oluşturur"""
+        properties = '<w:pPr><w:jc w:val="both"/></w:pPr>' if justify else ""
+        run_properties = "<w:rPr><w:b/></w:rPr>" if bold else ""
+        return (
+            f"<w:p>{properties}<w:r>{run_properties}"
+            f'<w:t xml:space="preserve">{xml_escape(text)}</w:t></w:r></w:p>'
+        )
+
+    def render(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> bytes:
+        title, date_str, paragraphs = self._prepare(content, metadata)
+        body = [self._paragraph(title, bold=True), self._paragraph(f"Tarih: {date_str}")]
+        body.extend(self._paragraph(p, justify=True) for p in paragraphs)
+        body.append(self._paragraph("Ad Soyad: _________________"))
+        body.append(self._paragraph("İmza: _________________"))
+
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as package:
+            package.writestr("[Content_Types].xml", self.CONTENT_TYPES)
+            package.writestr("_rels/.rels", self.RELS)
+            package.writestr("word/document.xml", self.DOCUMENT.format(body="".join(body)))
+        return buffer.getvalue()
+
+class RenderCache:
+    """
+    Oluşturulan çıktılar için bayt bütçeli LRU önbellek.
+    Anahtar, format ve içerik özetinden oluşur; içerik değişince eski
+    girdiler kullanılmaz ve zamanla önbellekten düşer.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: Önbellekte tutulacak toplam bayt sınırı
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(fmt: str, content: str, metadata: Optional[Dict[str, Any]]) -> str:
+        """Format, içerik ve metadata için önbellek anahtarı üretir"""
+        digest = hashlib.sha256(content.encode("utf-8"))
+        digest.update(repr(sorted((metadata or {}).items())).encode("utf-8"))
+        return f"{fmt}:{digest.hexdigest()}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Önbellekteki çıktıyı döndürür"""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def set(self, key: str, data: bytes) -> None:
+        """Çıktıyı önbelleğe ekler, bütçe aşılırsa en eski girdileri çıkarır"""
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = data
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+# Format kayıtları
+RENDERERS: Dict[str, DocumentRenderer] = {
+    HTMLRenderer.format: HTMLRenderer(),
+    DOCXRenderer.format: DOCXRenderer(),
+}
+
+# Accept başlığındaki media type -> format eşleşmeleri
+MEDIA_TYPE_FORMATS = {
+    "application/pdf": "pdf",
+    "text/html": "html",
+    DOCXRenderer.media_type: "docx",
+}
+
+SUPPORTED_FORMATS = {"pdf", *RENDERERS.keys()}
+DEFAULT_FORMAT = "pdf"
+
+render_cache = RenderCache(settings.RENDER_CACHE_MAX_BYTES)
+
+def negotiate_format(requested: Optional[str], accept: Optional[str]) -> Optional[str]:
+    """
+    Çıktı formatını belirler.
+    Sorgu parametresi Accept başlığına göre önceliklidir.
+
+    Args:
+        requested: Sorgu parametresindeki format
+        accept: Accept başlığı
+
+    Returns:
+        Optional[str]: Format adı, desteklenmiyorsa None
+    """
+    if requested:
+        requested = requested.lower()
+        return requested if requested in SUPPORTED_FORMATS else None
+
+    if accept:
+        candidates = []
+        for index, item in enumerate(accept.split(",")):
+            parts = [part.strip() for part in item.split(";")]
+            quality = 1.0
+            for param in parts[1:]:
+                if param.startswith("q="):
+                    try:
+                        quality = float(param[2:])
+                    except ValueError:
+                        quality = 0.0
+            fmt = MEDIA_TYPE_FORMATS.get(parts[0].lower())
+            if fmt and quality > 0:
+                candidates.append((-quality, index, fmt))
+        if candidates:
+            return min(candidates)[2]
+
+    return DEFAULT_FORMAT
+
+def render_document(fmt: str, content: str, metadata: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Dilekçeyi istenen formatta oluşturur, sonucu önbellekte tutar.
+
+    Args:
+        fmt: Format adı (html, docx)
+        content: Dilekçe içeriği
+        metadata: Başlık, tarih gibi bilgiler
+
+    Returns:
+        bytes: Çıktı içeriği
+    """
+    key = RenderCache.make_key(fmt, content, metadata)
+    data = render_cache.get(key)
+    if data is None:
+        data = RENDERERS[fmt].render(content, metadata)
+        render_cache.set(key, data)
+        api_logger.info("Document rendered", format=fmt, size=len(data))
+    return data
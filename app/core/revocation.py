@@ -0,0 +1,184 @@
+"""
+Refresh token iptal listesi.
+
+İptal edilen (rotasyonla kullanılmış veya çıkışta iptal edilmiş) refresh
+token'ların jti değerleri revoked_tokens tablosunda tutulur. Her worker bu
+tablonun Bloom filtresini bellekte tutar: filtrede olmayan token kesinlikle
+iptal edilmemiştir ve veritabanına bakılmaz; filtrede olan token için
+(yanlış pozitif olabilir) tabloya bakılır.
+
+Filtre, tablonun revoked_at kolonu REVOCATION_POLL_SECONDS aralıkla
+taranarak artımlı güncellenir; REVOCATION_REBUILD_SECONDS'da bir (veya
+filtre dolunca) süresi dolmuş kayıtlar silinip filtre baştan oluşturulur.
+Yeniden oluşturulan filtre kayıt sayısının iki katından küçük olmaz;
+REVOCATION_BLOOM_CAPACITY aşılırsa uyarı loglanır. Tarama aralığında başka
+bir worker'da iptal edilen token filtrede görünmeyebilir; rotasyonda jti
+birincil anahtar olarak eklendiği için aynı token iki kez kullanılamaz.
+"""
+import hashlib
+import math
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, Optional, Set, Tuple
+from prometheus_client import Counter, Gauge
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.logger import auth_logger
+from app.db import models
+from app.db.database import AsyncSessionLocal
+
+REVOCATION_CHECKS = Counter(
+    "revocation_checks_total",
+    "Refresh token revocation checks",
+    ["result"]  # filter_negative, false_positive, revoked
+)
+
+REVOCATION_FILTER_ENTRIES = Gauge(
+    "revocation_filter_entries",
+    "Revoked token ids in this worker's Bloom filter"
+)
+
+REVOCATION_FILTER_CAPACITY = Gauge(
+    "revocation_filter_capacity",
+    "Capacity of this worker's Bloom filter (grows past REVOCATION_BLOOM_CAPACITY when needed)"
+)
+
+# Geç commit edilen transaction'ların revoked_at değerleri için tarama payı
+POLL_OVERLAP = timedelta(seconds=5)
+
+class BloomFilter:
+    """Sabit boyutlu Bloom filtresi (çift hash ile k konum)"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = max(1, capacity)
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key: str) -> None:
+        """Anahtarı filtreye ekler"""
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+class RevocationList:
+    """Worker başına iptal listesi filtresi"""
+
+    def __init__(self):
+        self._filter = self._new_filter()
+        self._ready = False  # İlk yükleme yapılana kadar her kontrol veritabanına gider
+        self._rebuilt_at = 0.0
+        self._watermark: Optional[datetime] = None
+        self._seen: Set[Tuple[str, datetime]] = set()  # Tarama payındaki işlenmiş kayıtlar
+
+    @staticmethod
+    def _new_filter(entries: int = 0) -> BloomFilter:
+        # Kayıt sayısı kapasiteye yakınsa filtre payla büyütülür; aksi halde
+        # her taramada yeniden oluşturulurdu
+        capacity = max(settings.REVOCATION_BLOOM_CAPACITY, entries * 2)
+        return BloomFilter(capacity, settings.REVOCATION_BLOOM_ERROR_RATE)
+
+    def _add_all(self, jtis: Iterable[str]) -> None:
+        for jti in jtis:
+            self._filter.add(jti)
+        REVOCATION_FILTER_ENTRIES.set(self._filter.count)
+
+    def add(self, jti: str) -> None:
+        """
+        Bu worker'da iptal edilen token'ı filtreye ekler.
+
+        Args:
+            jti: Token ID
+        """
+        self._add_all([jti])
+
+    async def is_revoked(self, db: AsyncSession, jti: str) -> bool:
+        """
+        Token iptal edilmiş mi kontrol eder. Filtrede olmayan token için
+        veritabanına gidilmez.
+
+        Args:
+            db: Veritabanı oturumu
+            jti: Token ID
+
+        Returns:
+            bool: Token iptal edilmiş mi
+        """
+        if self._ready and jti not in self._filter:
+            REVOCATION_CHECKS.labels(result="filter_negative").inc()
+            return False
+
+        revoked = (await db.execute(
+            select(models.RevokedToken.jti).where(models.RevokedToken.jti == jti)
+        )).first() is not None
+        REVOCATION_CHECKS.labels(result="revoked" if revoked else "false_positive").inc()
+        return revoked
+
+    async def rebuild(self) -> None:
+        """
+        Süresi dolmuş kayıtları siler ve filtreyi tablodan baştan oluşturur.
+        """
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(models.RevokedToken).where(models.RevokedToken.expires_at < datetime.utcnow()))
+            await db.commit()
+            rows = (await db.execute(select(models.RevokedToken.jti, models.RevokedToken.revoked_at))).all()
+
+        if len(rows) > settings.REVOCATION_BLOOM_CAPACITY:
+            auth_logger.warning(
+                "Revoked tokens exceed configured Bloom filter capacity",
+                entries=len(rows),
+                capacity=settings.REVOCATION_BLOOM_CAPACITY
+            )
+        bloom = self._new_filter(len(rows))
+        for jti, _ in rows:
+            bloom.add(jti)
+        self._filter = bloom
+        self._watermark = max((revoked_at for _, revoked_at in rows), default=None)
+        self._seen = set()
+        self._ready = True
+        self._rebuilt_at = time.monotonic()
+        REVOCATION_FILTER_ENTRIES.set(bloom.count)
+        REVOCATION_FILTER_CAPACITY.set(bloom.capacity)
+        auth_logger.info("Revocation filter rebuilt", entries=bloom.count, capacity=bloom.capacity)
+
+    async def poll_changes(self) -> None:
+        """
+        Son taramadan bu yana iptal edilen token'ları filtreye ekler; gerekirse
+        filtreyi yeniden oluşturur. Arka plan görevi olarak periyodik çalıştırılır.
+        """
+        if (
+            not self._ready
+            or self._filter.count > self._filter.capacity
+            or time.monotonic() - self._rebuilt_at >= settings.REVOCATION_REBUILD_SECONDS
+        ):
+            await self.rebuild()
+            return
+
+        query = select(models.RevokedToken.jti, models.RevokedToken.revoked_at)
+        if self._watermark is not None:
+            query = query.where(models.RevokedToken.revoked_at > self._watermark - POLL_OVERLAP)
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(query)).all()
+
+        # Tarama payında tekrar dönen kayıtlar yeniden eklenmez
+        changes = {(jti, revoked_at) for jti, revoked_at in rows}
+        new_changes = changes - self._seen
+        self._add_all(jti for jti, _ in new_changes)
+        for _, revoked_at in new_changes:
+            if self._watermark is None or revoked_at > self._watermark:
+                self._watermark = revoked_at
+        self._seen = changes
+
+# Worker başına iptal listesi
+revocation_list = RevocationList()
@@ -1,29 +1,32 @@
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, Tuple
 from jose import JWTError, jwt
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.db.database import get_db
 from app.db import models
 from app.core.exceptions import (
     AuthenticationError,
     AuthorizationError,
+    PremiumRequiredError,
     get_error_message
 )
 from app.core.logger import auth_logger
-
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.hashing import pwd_context
+from app.core.user_cache import user_cache
+from app.core.monitoring import PREMIUM_AUTH_CHECKS
+from app.schemas.token import TokenData
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    Şifre doğrulama.
+    Şifre doğrulama (senkron; istek yolunda app.core.hashing.password_hasher kullanılır).
 
     Args:
         plain_password: Ham şifre
@@ -36,7 +39,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     """
-    Şifreyi hash'ler.
+    Şifreyi hash'ler (senkron; istek yolunda app.core.hashing.password_hasher kullanılır).
 
     Args:
         password: Ham şifre
@@ -74,19 +77,93 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
         algorithm=settings.ALGORITHM
     )
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> models.User:
+def create_refresh_token(user: models.User) -> Tuple[str, datetime]:
+    """
+    Refresh token oluşturur. Her token tek kullanımlıktır (jti); yenileme
+    sırasında iptal listesine eklenir ve yerine yenisi verilir.
+
+    Args:
+        user: Kullanıcı modeli
+
+    Returns:
+        Tuple[str, datetime]: JWT token ve son geçerlilik zamanı
+    """
+    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    to_encode = {
+        "sub": user.email,
+        "uid": user.id,
+        "ver": user.token_version or 0,
+        "jti": uuid.uuid4().hex,
+        "exp": expire,
+        "iat": datetime.utcnow(),
+        "type": "refresh_token"
+    }
+    token = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return token, expire
+
+def decode_refresh_token(token: str) -> Dict[str, Any]:
+    """
+    Refresh token'ı doğrular (imza, süre, tip). İptal listesi kontrolü
+    çağıran tarafa bırakılır.
+
+    Args:
+        token: JWT refresh token
+
+    Returns:
+        Dict[str, Any]: Token payload
+
+    Raises:
+        AuthenticationError: Geçersiz veya süresi dolmuş token
+    """
+    try:
+        payload = jwt.decode(
+            token,
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM]
+        )
+    except JWTError as e:
+        auth_logger.warning("Refresh token decode error", error=str(e))
+        raise AuthenticationError(detail=get_error_message("REFRESH_TOKEN_INVALID"))
+
+    if payload.get("type") != "refresh_token" or not all(payload.get(key) for key in ("sub", "uid", "jti")):
+        auth_logger.warning("Invalid refresh token claims")
+        raise AuthenticationError(detail=get_error_message("REFRESH_TOKEN_INVALID"))
+    return payload
+
+def user_token_claims(user: models.User) -> Dict[str, Any]:
+    """
+    Kullanıcının access token'a imzalanan claim'lerini döndürür. Premium ve
+    aktiflik claim'leri, premium gerektiren isteklerin kullanıcıyı
+    yüklemeden yetkilendirilmesini sağlar; token_version artırıldığında
+    eski token'lar geçersiz olur.
+
+    Args:
+        user: Kullanıcı modeli
+
+    Returns:
+        Dict[str, Any]: Token payload
+    """
+    premium_until = None
+    if user.premium_until is not None:
+        premium_until = int(user.premium_until.replace(tzinfo=timezone.utc).timestamp())
+    return {
+        "sub": user.email,
+        "uid": user.id,
+        "is_premium": bool(user.is_premium),
+        "premium_until": premium_until,
+        "is_active": bool(user.is_active),
+        "ver": user.token_version or 0
+    }
+
+def _decode_claims(token: str) -> TokenData:
     """
-    Token'dan kullanıcıyı bulur.
+    Token'ı doğrular ve claim'lerini döndürür.
 
     Args:
         token: JWT token
-        db: Veritabanı oturumu
 
     Returns:
-        User: Kullanıcı modeli
+        TokenData: Token claim'leri
 
     Raises:
         AuthenticationError: Geçersiz token
@@ -97,48 +174,170 @@ async def get_current_user(
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]
         )
-        email: str = payload.get("sub")
-        if email is None:
-            auth_logger.warning("Token missing email claim")
-            raise AuthenticationError(detail=get_error_message("INVALID_TOKEN"))
-        
-        user = db.query(models.User).filter(models.User.email == email).first()
-        if not user:
-            auth_logger.warning("User not found", email=email)
-            raise AuthenticationError(detail=get_error_message("USER_NOT_FOUND"))
-        
-        auth_logger.info("User authenticated", user_id=user.id)
-        return user
-        
     except JWTError as e:
         auth_logger.error("JWT decode error", error=str(e))
         raise AuthenticationError(detail=get_error_message("INVALID_TOKEN"))
 
-async def check_premium_status(user: models.User, db: Session) -> models.User:
+    if payload.get("sub") is None:
+        auth_logger.warning("Token missing email claim")
+        raise AuthenticationError(detail=get_error_message("INVALID_TOKEN"))
+    try:
+        claims = TokenData.from_payload(payload)
+    except (KeyError, TypeError, ValueError) as e:
+        auth_logger.warning("Invalid token claims", error=str(e))
+        raise AuthenticationError(detail=get_error_message("INVALID_TOKEN"))
+    # Refresh token'lar access token yerine kullanılamaz
+    if not claims.is_valid_type("access_token"):
+        auth_logger.warning("Wrong token type", type=claims.type)
+        raise AuthenticationError(detail=get_error_message("INVALID_TOKEN"))
+    return claims
+
+async def _authenticate(token: str, request: Request, db: Optional[AsyncSession] = None) -> models.User:
     """
-    Premium durumunu kontrol eder.
+    Token'ı doğrular ve kullanıcıyı yükler.
 
     Args:
-        user: Kullanıcı modeli
+        token: JWT token
+        request: İstek (okuma yönlendirmesi için kullanıcı anahtarı kaydedilir)
+        db: Verilirse kullanıcı bu oturumla yüklenir, verilmezse önbellekten gelir
+
+    Returns:
+        User: Kullanıcı modeli
+
+    Raises:
+        AuthenticationError: Geçersiz veya geçersiz kılınmış token
+    """
+    claims = _decode_claims(token)
+    email = claims.email
+    # Okuma oturumu ilk sorguda açılır; yazma sonrası yapışkanlık bu anahtara göre belirlenir
+    request.state.db_user = email
+    if db is None:
+        user = await user_cache.load(email)
+    else:
+        result = await db.execute(select(models.User).where(models.User.email == email))
+        user = result.scalars().first()
+    if not user:
+        auth_logger.warning("User not found", email=email)
+        raise AuthenticationError(detail=get_error_message("USER_NOT_FOUND"))
+    if claims.token_version != (user.token_version or 0):
+        auth_logger.warning("Revoked token used", user_id=user.id, token_version=claims.token_version)
+        raise AuthenticationError(detail=get_error_message("TOKEN_REVOKED"))
+
+    auth_logger.info("User authenticated", user_id=user.id)
+    return user
+
+async def get_current_user(
+    request: Request,
+    token: str = Depends(oauth2_scheme)
+) -> models.User:
+    """
+    Token'dan kullanıcıyı bulur. Kullanıcı worker önbelleğinden gelir
+    (app.core.user_cache); önbellekte yoksa primary'den yüklenir.
+    Dönen nesne bir oturuma bağlı değildir; kullanıcıyı değiştiren
+    endpoint'ler get_current_user_for_update kullanır.
+
+    Args:
+        request: İstek
+        token: JWT token
+
+    Returns:
+        User: Kullanıcı modeli
+
+    Raises:
+        AuthenticationError: Geçersiz token
+    """
+    return await _authenticate(token, request)
+
+async def get_current_user_for_update(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+) -> models.User:
+    """
+    Token'dan kullanıcıyı primary veritabanından, endpoint ile aynı
+    oturumda yükler. Kullanıcıyı değiştiren endpoint'ler içindir;
+    değişiklikten sonra user_cache.invalidate çağrılmalıdır.
+
+    Args:
+        request: İstek
+        token: JWT token
         db: Veritabanı oturumu
 
     Returns:
-        User: Güncellenmiş kullanıcı modeli
+        User: Kullanıcı modeli
+
+    Raises:
+        AuthenticationError: Geçersiz token
     """
-    try:
-        if user.is_premium and user.premium_until:
-            if user.premium_until < datetime.utcnow():
-                user.is_premium = False
-                user.premium_until = None
-                db.commit()
-                auth_logger.info("Premium status expired", user_id=user.id)
-            else:
-                auth_logger.info("Premium status active", user_id=user.id)
-        return user
-    except Exception as e:
-        auth_logger.error("Premium status check failed", user_id=user.id, error=str(e))
-        db.rollback()
-        return user
+    return await _authenticate(token, request, db)
+
+async def get_current_premium_user(
+    request: Request,
+    token: str = Depends(oauth2_scheme)
+) -> models.User:
+    """
+    Premium gerektiren endpoint'ler için kullanıcıyı doğrular.
+
+    Token claim'leri aktif ve süresi dolmamış premium üyelik gösteriyorsa ve
+    worker'ın bildiği token sürümüyle çelişmiyorsa veritabanına gidilmez;
+    dönen kullanıcıda yalnızca claim'lerdeki alanlar doludur. Aksi halde
+    (süresi dolmuş veya premium olmayan claim'ler, sürüm uyuşmazlığı,
+    eski token'lar) kullanıcı get_current_user ile yüklenir.
+
+    Args:
+        request: İstek
+        token: JWT token
+
+    Returns:
+        User: Premium kullanıcı
+
+    Raises:
+        AuthenticationError: Geçersiz token veya inaktif kullanıcı
+        PremiumRequiredError: Premium üyelik yok
+    """
+    claims = _decode_claims(token)
+    request.state.db_user = claims.email
+    if claims.user_id is not None and claims.is_active and claims.is_premium_active():
+        known_version = user_cache.known_token_version(claims.user_id)
+        if known_version is None or known_version == claims.token_version:
+            PREMIUM_AUTH_CHECKS.labels(source="claims").inc()
+            return models.User(
+                id=claims.user_id,
+                email=claims.email,
+                is_active=True,
+                is_premium=True,
+                premium_until=claims.premium_until,
+                token_version=claims.token_version
+            )
+
+    PREMIUM_AUTH_CHECKS.labels(source="database").inc()
+    user = await _authenticate(token, request)
+    if not user.is_active:
+        raise AuthenticationError(detail=get_error_message("INACTIVE_USER"))
+    if not user.is_premium_active():
+        auth_logger.warning("Non-premium user attempted premium access", user_id=user.id)
+        raise PremiumRequiredError(detail=get_error_message("PREMIUM_REQUIRED"))
+    return user
+
+async def get_current_admin_user(
+    current_user: models.User = Depends(get_current_user)
+) -> models.User:
+    """
+    Yönetici kullanıcıyı doğrular (ADMIN_EMAILS).
+
+    Args:
+        current_user: Aktif kullanıcı
+
+    Returns:
+        User: Yönetici kullanıcı
+
+    Raises:
+        AuthorizationError: Kullanıcı yönetici değil
+    """
+    if current_user.email not in settings.ADMIN_EMAILS:
+        auth_logger.warning("Non-admin user attempted admin access", user_id=current_user.id)
+        raise AuthorizationError(detail=get_error_message("ADMIN_REQUIRED"))
+    return current_user
 
 async def get_current_active_user(
     current_user: models.User = Depends(get_current_user)
@@ -158,10 +357,3 @@ async def get_current_active_user(
     if not current_user.is_active:
         raise AuthenticationError(detail=get_error_message("INACTIVE_USER"))
     return current_user
-
-async def get_current_active_user(
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-) -> models.User:
-    """Aktif ve premium durumu güncel kullanıcıyı döndürür"""
-    return await check_premium_status(current_user, db) 
\ No newline at end of file
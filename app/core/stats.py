@@ -0,0 +1,78 @@
+"""
+/metrics için önbelleğe alınmış tablo istatistikleri.
+
+Dilekçe ve kullanıcı sayıları her scrape'te tam tablo GROUP BY ile
+hesaplanmaz; STATS_REFRESH_SECONDS aralığıyla arka planda (replika
+varsa replikadan) yenilenir. /metrics yalnızca son anlık görüntüyü okur,
+böylece scrape maliyeti tablo boyutundan bağımsızdır.
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from sqlalchemy import func, select
+from app.core.logger import db_logger
+from app.db import models
+from app.db.replicas import replica_router
+from app.schemas.petition import PetitionType
+
+@dataclass
+class StatsSnapshot:
+    """Belirli bir andaki tablo sayıları"""
+    petitions_by_type: Dict[str, int] = field(default_factory=dict)
+    users_by_tier: Dict[str, int] = field(default_factory=dict)
+    active_users: int = 0
+    refreshed_at: Optional[float] = None  # None: henüz hesaplanmadı
+
+class StatsCache:
+    """Worker başına istatistik önbelleği"""
+
+    def __init__(self):
+        self.snapshot = StatsSnapshot()
+
+    @property
+    def ready(self) -> bool:
+        """En az bir kez yenilendi mi"""
+        return self.snapshot.refreshed_at is not None
+
+    async def refresh(self) -> StatsSnapshot:
+        """
+        Sayıları veritabanından yeniden hesaplar.
+        Yeni anlık görüntü tek atamayla yayınlanır; okuyucular hiçbir zaman
+        yarım hesaplanmış değer görmez.
+
+        Returns:
+            StatsSnapshot: Güncel sayılar
+        """
+        start = time.perf_counter()
+        async with replica_router.read_session() as db:
+            petition_rows = (await db.execute(
+                select(models.Petition.petition_type, func.count())
+                .group_by(models.Petition.petition_type)
+            )).all()
+            user_rows = (await db.execute(
+                select(models.User.is_premium, models.User.is_active, func.count())
+                .group_by(models.User.is_premium, models.User.is_active)
+            )).all()
+
+        # Kaydı kalmayan tipler de sıfır olarak yayınlanır
+        petitions_by_type = {petition_type.value: 0 for petition_type in PetitionType}
+        for petition_type, count in petition_rows:
+            petitions_by_type[petition_type.value] = count
+
+        users_by_tier = {"premium": 0, "normal": 0}
+        active_users = 0
+        for is_premium, is_active, count in user_rows:
+            users_by_tier["premium" if is_premium else "normal"] += count
+            if is_active:
+                active_users += count
+
+        self.snapshot = StatsSnapshot(
+            petitions_by_type=petitions_by_type,
+            users_by_tier=users_by_tier,
+            active_users=active_users,
+            refreshed_at=time.time()
+        )
+        db_logger.debug("Stats refreshed", duration=round(time.perf_counter() - start, 3))
+        return self.snapshot
+
+stats_cache = StatsCache()
@@ -0,0 +1,265 @@
+import hashlib
+import os
+import re
+import tempfile
+import time
+from typing import Iterable, Iterator, Optional, Set, Tuple
+from fastapi.responses import FileResponse, Response
+from sqlalchemy import select
+from app.core.config import settings
+from app.core.logger import api_logger
+from app.db.database import SessionLocal
+from app.db import models
+
+# SHA-256 hex anahtar formatı
+KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+TEMP_PREFIX = ".tmp-"
+
+class PDFStorage:
+    """
+    İçerik adresli PDF deposu.
+
+    Dosyalar içeriklerinin SHA-256 özetiyle saklanır ve özetin ilk
+    karakterlerine göre alt dizinlere dağıtılır (ör. ab/cd/abcd....pdf).
+    Aynı içerik yalnızca bir kez saklanır.
+    """
+
+    def __init__(self, root: str, shard_depth: int = 2, shard_width: int = 2):
+        """
+        Depoyu başlatır.
+
+        Args:
+            root: Depo kök dizini
+            shard_depth: Alt dizin seviyesi sayısı
+            shard_width: Her seviyedeki dizin adı uzunluğu
+        """
+        self.root = root
+        self.shard_depth = shard_depth
+        self.shard_width = shard_width
+
+    @staticmethod
+    def key_for(data: bytes) -> str:
+        """İçeriğin depo anahtarını hesaplar"""
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def is_valid_key(key: Optional[str]) -> bool:
+        """Anahtarın geçerli bir içerik özeti olup olmadığını kontrol eder"""
+        return bool(key) and KEY_PATTERN.match(key) is not None
+
+    def relative_path(self, key: str) -> str:
+        """
+        Anahtarın depo köküne göre dosya yolunu döndürür.
+
+        Args:
+            key: Depo anahtarı
+
+        Returns:
+            str: Göreli dosya yolu
+
+        Raises:
+            ValueError: Geçersiz anahtar
+        """
+        if not self.is_valid_key(key):
+            raise ValueError(f"Invalid storage key: {key}")
+        shards = [
+            key[i * self.shard_width:(i + 1) * self.shard_width]
+            for i in range(self.shard_depth)
+        ]
+        return os.path.join(*shards, f"{key}.pdf")
+
+    def path_for(self, key: str) -> str:
+        """Anahtarın mutlak dosya yolunu döndürür"""
+        return os.path.join(self.root, self.relative_path(key))
+
+    def exists(self, key: Optional[str]) -> bool:
+        """Anahtara ait dosya depoda var mı"""
+        return self.is_valid_key(key) and os.path.exists(self.path_for(key))
+
+    def save(self, data: bytes) -> str:
+        """
+        İçeriği depoya atomik olarak yazar.
+
+        Dosya önce aynı dizinde geçici bir dosyaya yazılır, ardından yeniden
+        adlandırılır. İçerik zaten varsa tekrar yazılmaz.
+
+        Args:
+            data: PDF içeriği
+
+        Returns:
+            str: Depo anahtarı
+        """
+        key = self.key_for(data)
+        path = self.path_for(key)
+
+        if os.path.exists(path):
+            # Çöp toplayıcının yeni referans verilen dosyayı silmemesi için
+            os.utime(path)
+            return key
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=TEMP_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(data)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+        api_logger.info("PDF stored", key=key, size=len(data))
+        return key
+
+    def read(self, key: str) -> bytes:
+        """Anahtara ait içeriği okur"""
+        with open(self.path_for(key), "rb") as pdf_file:
+            return pdf_file.read()
+
+    def delete(self, key: str) -> bool:
+        """
+        Anahtara ait dosyayı siler.
+
+        Returns:
+            bool: Dosya silindi mi
+        """
+        try:
+            os.unlink(self.path_for(key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def iter_files(self) -> Iterator[Tuple[str, str]]:
+        """
+        Depodaki dosyaları dolaşır.
+
+        Yields:
+            Tuple[str, str]: Dosya adı ve mutlak yolu
+        """
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                yield name, os.path.join(directory, name)
+
+    def collect_garbage(self, referenced: Set[str], grace_seconds: int) -> int:
+        """
+        Hiçbir kaydın referans vermediği dosyaları siler.
+
+        Son grace_seconds içinde yazılmış dosyalara dokunulmaz; böylece henüz
+        veritabanına kaydedilmemiş yeni dosyalar silinmez.
+
+        Args:
+            referenced: Kullanımdaki anahtarlar
+            grace_seconds: Dokunulmayacak dosya yaşı (saniye)
+
+        Returns:
+            int: Silinen dosya sayısı
+        """
+        cutoff = time.time() - grace_seconds
+        deleted = 0
+        for name, path in self.iter_files():
+            key = name[:-len(".pdf")] if name.endswith(".pdf") else None
+            is_orphan = name.startswith(TEMP_PREFIX) or (
+                self.is_valid_key(key) and key not in referenced
+            )
+            if not is_orphan:
+                continue
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.unlink(path)
+                    deleted += 1
+            except FileNotFoundError:
+                # Başka bir worker aynı dosyayı silmiş olabilir
+                continue
+        return deleted
+
+    def file_response(self, key: str, filename: str) -> Response:
+        """
+        Dosyayı sunan yanıtı oluşturur.
+
+        PDF_ACCEL_REDIRECT_PREFIX tanımlıysa dosya nginx'e X-Accel-Redirect
+        ile devredilir ve nginx tarafından sendfile ile kopyalanmadan
+        gönderilir. Aksi halde dosya uygulama tarafından sunulur.
+
+        Args:
+            key: Depo anahtarı
+            filename: İndirme dosya adı
+
+        Returns:
+            Response: Dosya yanıtı
+        """
+        if settings.PDF_ACCEL_REDIRECT_PREFIX:
+            accel_path = settings.PDF_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + \
+                self.relative_path(key).replace(os.sep, "/")
+            return Response(
+                media_type="application/pdf",
+                headers={
+                    "X-Accel-Redirect": accel_path,
+                    "Content-Disposition": f'attachment; filename="{filename}"'
+                }
+            )
+        return FileResponse(
+            self.path_for(key),
+            media_type="application/pdf",
+            filename=filename
+        )
+
+# Global depo instance'ı
+pdf_storage = PDFStorage(settings.PDF_DIR)
+
+def collect_orphan_pdfs() -> int:
+    """
+    Hiçbir dilekçenin referans vermediği PDF'leri depodan siler.
+    Arka plan görevi olarak periyodik çalıştırılır.
+
+    Returns:
+        int: Silinen dosya sayısı
+    """
+    db = SessionLocal()
+    try:
+        referenced = {
+            path for (path,) in db.query(models.Petition.pdf_path)
+            .filter(models.Petition.pdf_path.isnot(None))
+            .distinct()
+        }
+    finally:
+        db.close()
+
+    deleted = pdf_storage.collect_garbage(referenced, settings.PDF_GC_GRACE_SECONDS)
+    api_logger.info("PDF garbage collection finished", deleted=deleted, referenced=len(referenced))
+    return deleted
+
+def delete_unreferenced_pdfs(keys: Iterable[str]) -> int:
+    """
+    Verilen PDF'lerden artık hiçbir dilekçenin referans vermediklerini siler
+    (ör. hesap silindikten sonra). Depo içerik adresli olduğundan aynı dosyayı
+    başka kullanıcıların dilekçeleri de kullanıyor olabilir; referanslar
+    PDF_DELETE_BATCH_SIZE'lık partilerle tek sorguda kontrol edilir.
+    Kontrolden hemen sonra aynı içerik için yeniden referans verilirse dosya
+    ilk erişimde tekrar oluşturulur.
+
+    Args:
+        keys: Depo anahtarları
+
+    Returns:
+        int: Silinen dosya sayısı
+    """
+    keys = sorted({key for key in keys if pdf_storage.is_valid_key(key)})
+    deleted = 0
+    db = SessionLocal()
+    try:
+        for start in range(0, len(keys), settings.PDF_DELETE_BATCH_SIZE):
+            batch = keys[start:start + settings.PDF_DELETE_BATCH_SIZE]
+            referenced = set(db.execute(
+                select(models.Petition.pdf_path).where(models.Petition.pdf_path.in_(batch))
+            ).scalars())
+            for key in batch:
+                if key not in referenced and pdf_storage.delete(key):
+                    deleted += 1
+    finally:
+        db.close()
+
+    api_logger.info("Unreferenced PDFs deleted", requested=len(keys), deleted=deleted)
+    return deleted
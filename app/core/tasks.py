@@ -0,0 +1,78 @@
+import asyncio
+from typing import Any, Callable, List, Optional
+from app.core.logger import api_logger
+
+class PeriodicTask:
+    """
+    Uygulama yaşam döngüsüne bağlı periyodik arka plan görevi.
+
+    Senkron görev fonksiyonları event loop'u bloklamaması için thread
+    havuzunda, coroutine fonksiyonları doğrudan çalıştırılır. Hatalar
+    loglanır, döngü devam eder.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        interval_seconds: float,
+        initial_delay: Optional[float] = None
+    ):
+        """
+        Görevi tanımlar.
+
+        Args:
+            name: Görev adı
+            func: Çalıştırılacak fonksiyon (senkron veya async)
+            interval_seconds: Çalıştırma aralığı (saniye)
+            initial_delay: İlk çalıştırmadan önceki bekleme (varsayılan: interval_seconds)
+        """
+        self.name = name
+        self.func = func
+        self.interval_seconds = interval_seconds
+        self.initial_delay = interval_seconds if initial_delay is None else initial_delay
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self) -> None:
+        """Görevi bir kez çalıştırır"""
+        try:
+            if asyncio.iscoroutinefunction(self.func):
+                await self.func()
+            else:
+                await asyncio.to_thread(self.func)
+        except Exception as e:
+            api_logger.error("Background task failed", task=self.name, error=str(e))
+
+    async def _loop(self) -> None:
+        await asyncio.sleep(self.initial_delay)
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """Görevi başlatır"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name=self.name)
+            api_logger.info("Background task started", task=self.name, interval=self.interval_seconds)
+
+    async def stop(self) -> None:
+        """Görevi durdurur"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        api_logger.info("Background task stopped", task=self.name)
+
+def start_tasks(tasks: List[PeriodicTask]) -> None:
+    """Görev listesini başlatır"""
+    for task in tasks:
+        task.start()
+
+async def stop_tasks(tasks: List[PeriodicTask]) -> None:
+    """Görev listesini durdurur"""
+    for task in tasks:
+        await task.stop()
@@ -0,0 +1,216 @@
+"""
+Kimliği doğrulanmış kullanıcılar için worker başına önbellek.
+
+Token'daki subject (email) anahtarıyla kullanıcı satırının kolon değerleri
+USER_CACHE_TTL_SECONDS boyunca, en fazla USER_CACHE_MAX_ENTRIES kayıt (LRU)
+tutulur; isabetli isteklerde veritabanına gidilmez. Kullanıcıyı değiştiren
+endpoint'ler kaydı aynı worker'da hemen siler. Diğer worker'lardaki kayıtlar,
+users.updated_at kolonunu USER_CACHE_POLL_SECONDS aralıkla tarayan görevle
+silinir (worker başına tek indeksli sorgu, trafikten bağımsız).
+
+Taramada görülen token sürümleri token ömrü boyunca saklanır; premium
+claim'leri kullanıcı yüklenmeden doğrulanırken geçersiz kılınmış token'lar
+bu sayede reddedilir.
+
+Silinen kullanıcılar updated_at ile görülemez; diğer worker'larda en fazla
+USER_CACHE_TTL_SECONDS önbellekte kalabilirler.
+"""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Set, Tuple
+from prometheus_client import Counter, Gauge
+from sqlalchemy import func, select
+from app.core.config import settings
+from app.core.logger import auth_logger
+from app.db import models
+from app.db.database import AsyncSessionLocal
+
+USER_CACHE_REQUESTS = Counter(
+    "user_cache_requests_total",
+    "Authenticated user lookups",
+    ["result"]  # hit, miss
+)
+
+USER_CACHE_EVICTIONS = Counter(
+    "user_cache_evictions_total",
+    "Entries removed from the authenticated user cache",
+    ["reason"]  # expired, lru, invalidated
+)
+
+USER_CACHE_ENTRIES = Gauge(
+    "user_cache_entries",
+    "Users cached in this worker"
+)
+
+# Geç commit edilen transaction'ların updated_at değerleri için tarama payı
+POLL_OVERLAP = timedelta(seconds=5)
+
+USER_COLUMNS = [column.key for column in models.User.__table__.columns]
+
+@dataclass
+class CachedUser:
+    """Önbellekteki kullanıcı satırı"""
+    values: Dict[str, Any]
+    expires_at: float
+
+class UserCache:
+    """Worker başına TTL + LRU kullanıcı önbelleği"""
+
+    def __init__(self):
+        self._entries: "OrderedDict[str, CachedUser]" = OrderedDict()
+        self._subjects: Dict[int, str] = {}  # Kullanıcı ID -> önbellek anahtarı
+        self._generation = 0  # Her geçersiz kılmada artar
+        self._watermark: Optional[datetime] = None
+        self._seen: Set[Tuple[int, datetime]] = set()  # Tarama payındaki işlenmiş değişiklikler
+        self._versions: Dict[int, Tuple[int, float]] = {}  # Kullanıcı ID -> (token sürümü, görülme zamanı)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, subject: str, reason: str) -> None:
+        entry = self._entries.pop(subject, None)
+        if entry is None:
+            return
+        user_id = entry.values["id"]
+        if self._subjects.get(user_id) == subject:
+            del self._subjects[user_id]
+        USER_CACHE_EVICTIONS.labels(reason=reason).inc()
+        USER_CACHE_ENTRIES.set(len(self._entries))
+
+    def get(self, subject: str) -> Optional[models.User]:
+        """
+        Önbellekteki kullanıcıyı döndürür.
+
+        Args:
+            subject: Token subject (email)
+
+        Returns:
+            Optional[User]: Oturuma bağlı olmayan kullanıcı, yoksa None
+        """
+        entry = self._entries.get(subject)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(subject, "expired")
+            entry = None
+        if entry is None:
+            USER_CACHE_REQUESTS.labels(result="miss").inc()
+            return None
+
+        self._entries.move_to_end(subject)
+        USER_CACHE_REQUESTS.labels(result="hit").inc()
+        # Her istek kendi nesnesini alır; endpoint'teki değişiklikler önbelleğe yansımaz
+        return models.User(**entry.values)
+
+    def put(self, subject: str, user: models.User, generation: int) -> None:
+        """
+        Kullanıcıyı önbelleğe ekler.
+
+        Args:
+            subject: Token subject (email)
+            user: Veritabanından yüklenen kullanıcı
+            generation: Yüklemeye başlanırken okunan generation değeri
+        """
+        if generation != self._generation:
+            # Yükleme sırasında bir kayıt geçersiz kılındı; satır eski olabilir
+            return
+        self._remove(subject, "invalidated")
+        self._entries[subject] = CachedUser(
+            values={key: getattr(user, key) for key in USER_COLUMNS},
+            expires_at=time.monotonic() + settings.USER_CACHE_TTL_SECONDS
+        )
+        self._subjects[user.id] = subject
+        while len(self._entries) > settings.USER_CACHE_MAX_ENTRIES:
+            self._remove(next(iter(self._entries)), "lru")
+        USER_CACHE_ENTRIES.set(len(self._entries))
+
+    def invalidate(self, user_id: int, token_version: Optional[int] = None) -> None:
+        """
+        Kullanıcının önbellek kaydını siler (kullanıcı değiştiğinde).
+
+        Args:
+            user_id: Kullanıcı ID
+            token_version: Biliniyorsa kullanıcının güncel token sürümü
+        """
+        self._generation += 1
+        if token_version is not None:
+            self._versions[user_id] = (token_version, time.monotonic())
+        subject = self._subjects.get(user_id)
+        if subject is not None:
+            self._remove(subject, "invalidated")
+
+    def known_token_version(self, user_id: int) -> Optional[int]:
+        """
+        Kullanıcının bu worker'da bilinen token sürümünü döndürür
+        (önbellek kaydı veya son değişiklikler). Veritabanına gidilmez.
+
+        Args:
+            user_id: Kullanıcı ID
+
+        Returns:
+            Optional[int]: Token sürümü, bilinmiyorsa None
+        """
+        subject = self._subjects.get(user_id)
+        entry = self._entries.get(subject) if subject is not None else None
+        if entry is not None:
+            return entry.values["token_version"]
+        version = self._versions.get(user_id)
+        return version[0] if version is not None else None
+
+    async def load(self, subject: str) -> Optional[models.User]:
+        """
+        Kullanıcıyı önbellekten, yoksa primary veritabanından döndürür.
+        Replika gecikmesi önbelleğe taşınmasın diye replikalar kullanılmaz.
+
+        Args:
+            subject: Token subject (email)
+
+        Returns:
+            Optional[User]: Oturuma bağlı olmayan kullanıcı, yoksa None
+        """
+        user = self.get(subject)
+        if user is not None:
+            return user
+
+        generation = self._generation
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(models.User).where(models.User.email == subject))
+            user = result.scalars().first()
+        if user is not None:
+            self.put(subject, user, generation)
+        return user
+
+    async def poll_changes(self) -> None:
+        """
+        Son taramadan bu yana değişen kullanıcıların kayıtlarını siler.
+        Arka plan görevi olarak periyodik çalıştırılır.
+        """
+        async with AsyncSessionLocal() as db:
+            if self._watermark is None:
+                self._watermark = (await db.execute(select(func.max(models.User.updated_at)))).scalar()
+                if self._watermark is None:
+                    return
+            rows = (await db.execute(
+                select(models.User.id, models.User.updated_at, models.User.token_version)
+                .where(models.User.updated_at > self._watermark - POLL_OVERLAP)
+            )).all()
+
+        # Tarama payında tekrar dönen değişiklikler yeniden geçersiz kılmaz
+        changes = {(user_id, updated_at) for user_id, updated_at, _ in rows}
+        versions = {user_id: token_version for user_id, _, token_version in rows}
+        new_changes = changes - self._seen
+        for user_id, updated_at in new_changes:
+            self.invalidate(user_id, versions[user_id])
+            if updated_at > self._watermark:
+                self._watermark = updated_at
+        if new_changes:
+            auth_logger.debug("User cache invalidated", count=len(new_changes))
+        self._seen = changes
+
+        # Bu süreden eski token'lar zaten geçersizdir
+        cutoff = time.monotonic() - settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        for user_id in [user_id for user_id, (_, seen) in self._versions.items() if seen < cutoff]:
+            del self._versions[user_id]
+
+# Worker başına önbellek
+user_cache = UserCache()
@@ -0,0 +1,49 @@
+import zipfile
+from typing import Iterable, Iterator, List, Tuple
+
+class _ChunkSink:
+    """
+    ZipFile için yazılabilir, seek desteklemeyen çıktı.
+    Yazılan veriler bir sonraki drain() çağrısına kadar tutulur.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        """Biriken veriyi döndürür ve tamponu boşaltır"""
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+def stream_zip(
+    entries: Iterable[Tuple[str, bytes]],
+    compression: int = zipfile.ZIP_STORED
+) -> Iterator[bytes]:
+    """
+    ZIP arşivini parça parça üretir.
+
+    Her girdi hazır olur olmaz arşive yazılır ve üretilen baytlar hemen
+    döndürülür; arşivin tamamı bellekte ya da diskte tutulmaz.
+
+    Args:
+        entries: (dosya adı, içerik) çiftleri
+        compression: Sıkıştırma yöntemi (PDF'ler zaten sıkıştırılmış olduğu için varsayılan STORED)
+
+    Yields:
+        bytes: Arşiv parçaları
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", compression=compression) as archive:
+        for name, data in entries:
+            archive.writestr(name, data)
+            yield sink.drain()
+    # Merkezi dizin kapanışta yazılır
+    yield sink.drain()
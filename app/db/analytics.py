@@ -0,0 +1,169 @@
+"""
+Günlük analitik toplamaları.
+
+Arka plan görevi, watermark'tan (analytics_watermarks) sonraki ve
+kapanmış (bitişinden ANALYTICS_ROLLUP_GRACE_SECONDS geçmiş) UTC günlerini
+sırayla işler: her gün için petitions ve users tablolarında yalnızca o
+günün aralığı indeks üzerinden taranır, sonuç analytics_daily ve
+analytics_daily_petition_types tablolarına yazılır. /admin/analytics
+yalnızca bu tabloları okur.
+"""
+import math
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.logger import db_logger
+from app.db import models
+from app.db.database import SessionLocal
+
+WATERMARK_NAME = "daily"
+
+def percentile(values: Sequence[int], q: float) -> Optional[int]:
+    """
+    Sıralı değerlerde en yakın sıra yöntemiyle yüzdelik.
+
+    Args:
+        values: Küçükten büyüğe sıralı değerler
+        q: Yüzdelik (0-100)
+
+    Returns:
+        Optional[int]: Değer, liste boşsa None
+    """
+    if not values:
+        return None
+    rank = max(1, math.ceil(q / 100 * len(values)))
+    return values[rank - 1]
+
+def _day_range(day: date) -> Tuple[datetime, datetime]:
+    start = datetime.combine(day, time.min)
+    return start, start + timedelta(days=1)
+
+def _count(db: Session, column, start: datetime, end: datetime) -> int:
+    return db.execute(
+        select(func.count()).where(column >= start, column < end)
+    ).scalar_one()
+
+def rollup_day(db: Session, day: date) -> models.AnalyticsDaily:
+    """
+    Bir günün toplamalarını hesaplar ve yazar. Günün mevcut satırları
+    yeniden yazılır; aynı gün tekrar işlenebilir. Commit çağıran tarafa bırakılır.
+
+    Args:
+        db: Veritabanı oturumu
+        day: UTC günü
+
+    Returns:
+        AnalyticsDaily: Günün özeti
+    """
+    start, end = _day_range(day)
+    created_at = models.Petition.created_at
+    in_day = (created_at >= start, created_at < end)
+
+    by_type = db.execute(
+        select(models.Petition.petition_type, func.count())
+        .where(*in_day)
+        .group_by(models.Petition.petition_type)
+    ).all()
+    active_users = db.execute(
+        select(func.count(func.distinct(models.Petition.user_id))).where(*in_day)
+    ).scalar_one()
+
+    # Yalnızca AI ile üretilmiş dilekçelerde ölçüm vardır
+    measurements = db.execute(
+        select(models.Petition.generation_ms, models.Petition.total_tokens)
+        .where(*in_day, models.Petition.generation_ms.isnot(None))
+    ).all()
+    latencies = sorted(row.generation_ms for row in measurements)
+    tokens = sorted(row.total_tokens for row in measurements if row.total_tokens is not None)
+
+    db.execute(delete(models.AnalyticsDailyPetitionType).where(models.AnalyticsDailyPetitionType.day == day))
+    db.execute(delete(models.AnalyticsDaily).where(models.AnalyticsDaily.day == day))
+
+    summary = models.AnalyticsDaily(
+        day=day,
+        petitions=sum(count for _, count in by_type),
+        active_users=active_users,
+        new_users=_count(db, models.User.created_at, start, end),
+        premium_conversions=_count(db, models.User.premium_activated_at, start, end),
+        generation_ms_p50=percentile(latencies, 50),
+        generation_ms_p95=percentile(latencies, 95),
+        generation_ms_p99=percentile(latencies, 99),
+        tokens_p50=percentile(tokens, 50),
+        tokens_p95=percentile(tokens, 95),
+        tokens_p99=percentile(tokens, 99)
+    )
+    db.add(summary)
+    db.add_all(
+        models.AnalyticsDailyPetitionType(day=day, petition_type=petition_type, petitions=count)
+        for petition_type, count in by_type
+    )
+    return summary
+
+def _first_day(db: Session) -> Optional[date]:
+    """İlk çalıştırmada toplamaya başlanacak gün (en eski kayıt)"""
+    first = db.execute(select(func.min(models.Petition.created_at))).scalar()
+    return first.date() if first else None
+
+def _lock_watermark(db: Session) -> Optional[models.AnalyticsWatermark]:
+    # Birden fazla worker aynı günü işlemesin diye satır kilitlenir (PostgreSQL)
+    return db.execute(
+        select(models.AnalyticsWatermark)
+        .where(models.AnalyticsWatermark.name == WATERMARK_NAME)
+        .with_for_update()
+    ).scalar_one_or_none()
+
+def run_rollups(max_days: Optional[int] = None, now: Optional[datetime] = None) -> List[date]:
+    """
+    Watermark'tan sonraki kapanmış günleri işler. Her gün ayrı
+    transaction'da işlenir ve watermark aynı transaction'da ilerletilir.
+    Arka plan görevi olarak periyodik çalıştırılır.
+
+    Args:
+        max_days: Tek çalıştırmada işlenecek en fazla gün (varsayılan: ANALYTICS_ROLLUP_MAX_DAYS)
+        now: Şimdiki zaman (UTC)
+
+    Returns:
+        List[date]: İşlenen günler
+    """
+    max_days = settings.ANALYTICS_ROLLUP_MAX_DAYS if max_days is None else max_days
+    now = now or datetime.utcnow()
+    # Bu günden önceki günler kapanmıştır
+    closed_until = (now - timedelta(seconds=settings.ANALYTICS_ROLLUP_GRACE_SECONDS)).date()
+
+    processed = []
+    db = SessionLocal()
+    try:
+        while len(processed) < max_days:
+            watermark = _lock_watermark(db)
+            if watermark is None:
+                first_day = _first_day(db)
+                if first_day is None:
+                    break
+                watermark = models.AnalyticsWatermark(name=WATERMARK_NAME, processed_until=first_day)
+                db.add(watermark)
+
+            day = watermark.processed_until
+            if day >= closed_until:
+                db.rollback()
+                break
+
+            rollup_day(db, day)
+            watermark.processed_until = day + timedelta(days=1)
+            db.commit()
+            processed.append(day)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    if processed:
+        db_logger.info(
+            "Analytics rollup finished",
+            days=len(processed),
+            first=processed[0].isoformat(),
+            last=processed[-1].isoformat()
+        )
+    return processed
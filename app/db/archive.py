@@ -0,0 +1,162 @@
+"""
+Eski dilekçelerin soğuk depoya (petition_archive) taşınması.
+
+ARCHIVE_AFTER_DAYS boyunca değişmeyen dilekçelerin sıkıştırılmış içeriği
+partiler halinde petition_archive tablosuna olduğu gibi kopyalanır;
+petitions tablosunda içeriği boşaltılmış, archived_at işaretli küçük bir
+kayıt kalır. Kimlik, sahiplik, tip, durum ve tarihler kayıtta kaldığı için
+listeleme ve yetki kontrolleri arşive bakmaz. Arşivlenen dilekçeler arama
+indeksinden çıkarılır; ID ile erişildiğinde restore_petition ile geri
+taşınır.
+"""
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+from prometheus_client import Counter
+from sqlalchemy import bindparam, delete, insert, literal, select, text, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.logger import db_logger
+from app.db import models, search
+from app.db.database import AsyncSessionLocal, SessionLocal
+
+# Arşivlenen kayıtta kalan içerik
+STUB_CONTENT = ""
+
+FTS_DELETE = text(
+    f"DELETE FROM {search.FTS_TABLE} WHERE rowid IN :ids"
+).bindparams(bindparam("ids", expanding=True))
+
+PETITIONS_ARCHIVED = Counter(
+    "petitions_archived_total",
+    "Petitions moved to the archive table"
+)
+
+PETITIONS_RESTORED = Counter(
+    "petitions_restored_total",
+    "Archived petitions restored on access"
+)
+
+def archive_batch(db: Session, cutoff: datetime, batch_size: int) -> List[int]:
+    """
+    En eski değişmemiş dilekçelerden bir partiyi arşivler.
+    Commit çağıran tarafa bırakılır.
+
+    Args:
+        db: Veritabanı oturumu
+        cutoff: Bu zamandan önce değişmiş dilekçeler arşivlenir
+        batch_size: Parti boyutu
+
+    Returns:
+        List[int]: Arşivlenen dilekçe ID'leri
+    """
+    petitions = models.Petition.__table__
+    # Diğer worker'ların kilitlediği satırlar atlanır (PostgreSQL)
+    ids = list(db.execute(
+        select(petitions.c.id)
+        .where(petitions.c.archived_at.is_(None), petitions.c.updated_at < cutoff)
+        .order_by(petitions.c.updated_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).scalars())
+    if not ids:
+        return ids
+
+    now = datetime.utcnow()
+    # Sıkıştırılmış içerik açılmadan veritabanı içinde kopyalanır
+    db.execute(
+        insert(models.PetitionArchive.__table__).from_select(
+            ["id", "content", "archived_at"],
+            select(petitions.c.id, petitions.c.content, literal(now, models.PetitionArchive.archived_at.type))
+            .where(petitions.c.id.in_(ids))
+        )
+    )
+    db.execute(
+        update(petitions)
+        .where(petitions.c.id.in_(ids))
+        .values(
+            content=STUB_CONTENT,
+            search_vector=None,
+            archived_at=now,
+            # Arşivleme kullanıcı açısından bir değişiklik değildir
+            updated_at=petitions.c.updated_at
+        )
+    )
+    if db.get_bind().dialect.name == "sqlite":
+        db.execute(FTS_DELETE, {"ids": ids})
+    return ids
+
+def archive_petitions(
+    max_batches: Optional[int] = None,
+    pause_seconds: Optional[float] = None,
+    now: Optional[datetime] = None
+) -> int:
+    """
+    Arşivleme görevi. Her parti ayrı transaction'da işlenir; partiler
+    arasında beklenerek primary üzerindeki yük sınırlanır.
+    Arka plan görevi olarak periyodik çalıştırılır.
+
+    Args:
+        max_batches: En fazla parti sayısı (varsayılan: ARCHIVE_MAX_BATCHES)
+        pause_seconds: Partiler arası bekleme (varsayılan: ARCHIVE_BATCH_PAUSE_SECONDS)
+        now: Şimdiki zaman (UTC)
+
+    Returns:
+        int: Arşivlenen dilekçe sayısı
+    """
+    max_batches = settings.ARCHIVE_MAX_BATCHES if max_batches is None else max_batches
+    pause_seconds = settings.ARCHIVE_BATCH_PAUSE_SECONDS if pause_seconds is None else pause_seconds
+    cutoff = (now or datetime.utcnow()) - timedelta(days=settings.ARCHIVE_AFTER_DAYS)
+
+    archived = 0
+    db = SessionLocal()
+    try:
+        for batch in range(max_batches):
+            if batch and pause_seconds:
+                time.sleep(pause_seconds)
+            ids = archive_batch(db, cutoff, settings.ARCHIVE_BATCH_SIZE)
+            db.commit()
+            archived += len(ids)
+            PETITIONS_ARCHIVED.inc(len(ids))
+            if len(ids) < settings.ARCHIVE_BATCH_SIZE:
+                break
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    if archived:
+        db_logger.info("Petitions archived", count=archived, cutoff=cutoff.isoformat())
+    return archived
+
+async def restore_petition(petition_id: int) -> str:
+    """
+    Arşivlenmiş dilekçeyi petitions tablosuna geri taşır (primary).
+    Arama indeksi ORM olaylarıyla yeniden oluşturulur. Dilekçe başka bir
+    istek tarafından zaten geri taşınmışsa mevcut içerik döner.
+
+    Args:
+        petition_id: Dilekçe ID
+
+    Returns:
+        str: Dilekçe içeriği
+    """
+    async with AsyncSessionLocal() as db:
+        petition = (await db.execute(
+            select(models.Petition)
+            .where(models.Petition.id == petition_id)
+            .with_for_update()
+        )).scalar_one()
+        if petition.archived_at is None:
+            return petition.content
+
+        archived = await db.get(models.PetitionArchive, petition_id)
+        petition.content = archived.content
+        petition.archived_at = None
+        await db.execute(delete(models.PetitionArchive).where(models.PetitionArchive.id == petition_id))
+        await db.commit()
+
+    PETITIONS_RESTORED.inc()
+    db_logger.info("Petition restored from archive", petition_id=petition_id)
+    return petition.content
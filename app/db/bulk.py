@@ -0,0 +1,111 @@
+from typing import Any, Dict, Iterable, List, Tuple
+from sqlalchemy import bindparam, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Insert
+from app.db import models, search
+from app.schemas.petition import PetitionType
+from app.core.logger import db_logger
+
+FTS_INSERT = text(
+    f"INSERT OR REPLACE INTO {search.FTS_TABLE}(rowid, title, content) VALUES (:id, :title, :content)"
+)
+
+def _prepare(
+    dialect_name: str,
+    rows: Iterable[Dict[str, Any]]
+) -> Tuple[Insert, List[Dict[str, Any]], List[Tuple[str, str]]]:
+    """
+    Toplu ekleme ifadesini ve parametrelerini hazırlar.
+
+    İfade executemany ile çalıştırılır; SQLAlchemy bunu RETURNING'li çok
+    satırlı INSERT ... VALUES partilerine çevirir (insertmanyvalues).
+    İçerik sıkıştırması kolon tipiyle uygulanır. ORM olayları çalışmadığı
+    için PostgreSQL'de search_vector ifadeye eklenir.
+
+    Returns:
+        Tuple: INSERT ifadesi, satır parametreleri ve arama için (başlık, içerik)
+    """
+    table = models.Petition.__table__
+    values = {
+        name: bindparam(name, type_=table.c[name].type)
+        for name in ("petition_type", "content", "user_id", "status")
+    }
+    if dialect_name == "postgresql":
+        values["search_vector"] = search.search_vector_expression(
+            bindparam("search_title"), bindparam("search_content")
+        )
+
+    params = []
+    documents = []
+    for row in rows:
+        petition_type = PetitionType(row["petition_type"])
+        title = PetitionType.get_description(petition_type)
+        item = {
+            "petition_type": petition_type,
+            "content": row["content"],
+            "user_id": row["user_id"],
+            "status": row.get("status", "draft"),
+        }
+        if dialect_name == "postgresql":
+            item["search_title"] = search.normalize_turkish(title)
+            item["search_content"] = search.normalize_turkish(row["content"])
+        params.append(item)
+        documents.append((title, row["content"]))
+
+    statement = (
+        insert(table)
+        .values(values)
+        .returning(table.c.id, sort_by_parameter_order=True)
+    )
+    return statement, params, documents
+
+def _fts_params(ids: List[int], documents: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    return [
+        {"id": petition_id, "title": search.fold(title), "content": search.fold(content)}
+        for petition_id, (title, content) in zip(ids, documents)
+    ]
+
+def bulk_insert_petitions(db: Session, rows: Iterable[Dict[str, Any]]) -> List[int]:
+    """
+    Çok sayıda dilekçeyi tek seferde ekler (senkron oturum: scriptler, importlar).
+    Commit çağıran tarafa bırakılır.
+
+    Args:
+        db: Veritabanı oturumu
+        rows: petition_type, content, user_id ve isteğe bağlı status alanları
+
+    Returns:
+        List[int]: Eklenen dilekçe ID'leri (girdi sırasıyla)
+    """
+    dialect_name = db.get_bind().dialect.name
+    statement, params, documents = _prepare(dialect_name, rows)
+    if not params:
+        return []
+    ids = list(db.execute(statement, params).scalars())
+    if dialect_name == "sqlite":
+        db.execute(FTS_INSERT, _fts_params(ids, documents))
+    db_logger.info("Petitions bulk inserted", count=len(ids))
+    return ids
+
+async def async_bulk_insert_petitions(db: AsyncSession, rows: Iterable[Dict[str, Any]]) -> List[int]:
+    """
+    Çok sayıda dilekçeyi tek seferde ekler (istek yolu).
+    Commit çağıran tarafa bırakılır.
+
+    Args:
+        db: Asenkron veritabanı oturumu
+        rows: petition_type, content, user_id ve isteğe bağlı status alanları
+
+    Returns:
+        List[int]: Eklenen dilekçe ID'leri (girdi sırasıyla)
+    """
+    dialect_name = db.bind.dialect.name
+    statement, params, documents = _prepare(dialect_name, rows)
+    if not params:
+        return []
+    ids = list((await db.execute(statement, params)).scalars())
+    if dialect_name == "sqlite":
+        await db.execute(FTS_INSERT, _fts_params(ids, documents))
+    db_logger.info("Petitions bulk inserted", count=len(ids))
+    return ids
@@ -0,0 +1,267 @@
+"""
+Dilekçe içeriği için sıkıştırma.
+
+İçerik veritabanında 2 baytlık başlık + sıkıştırılmış veri olarak saklanır:
+başlığın ilk baytı codec, ikinci baytı sözlük numarasıdır. Sözlükler
+app/db/dictionaries/petition_v{n}.zdict dosyalarından yüklenir ve hiçbir
+zaman değiştirilmez; yeni bir sözlük yeni numara ile eklenir, eski kayıtlar
+kendi sözlükleriyle açılmaya devam eder.
+
+Yeni sözlük eğitmek için:
+    python -m app.db.compression --output app/db/dictionaries/petition_v2.zdict
+"""
+import argparse
+import os
+import re
+import sys
+import zlib
+from collections import Counter as TokenCounter
+from typing import Dict, Iterable, Optional
+from prometheus_client import Counter, Histogram
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+from app.core.config import settings
+
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+
+NO_DICTIONARY = 0
+DICTIONARY_DIR = os.path.join(os.path.dirname(__file__), "dictionaries")
+DICTIONARY_PATTERN = re.compile(r"^petition_v(\d+)\.zdict$")
+
+# zlib ön tanımlı sözlük penceresi 32 KB ile sınırlıdır
+MAX_DICTIONARY_SIZE = 32 * 1024
+
+PETITION_CONTENT_BYTES = Counter(
+    "petition_content_bytes_total",
+    "Petition content bytes written, before (raw) and after (stored) compression",
+    ["kind"]
+)
+
+PETITION_COMPRESSION_RATIO = Histogram(
+    "petition_content_compression_ratio",
+    "Raw to stored size ratio of written petition content",
+    buckets=(1, 1.5, 2, 2.5, 3, 3.5, 4, 5, 6, 8)
+)
+
+def load_dictionaries(directory: str = DICTIONARY_DIR) -> Dict[int, bytes]:
+    """
+    Sözlük dosyalarını yükler.
+
+    Args:
+        directory: Sözlük dizini
+
+    Returns:
+        Dict[int, bytes]: Sözlük numarası -> sözlük içeriği
+    """
+    dictionaries = {}
+    if not os.path.isdir(directory):
+        return dictionaries
+    for name in os.listdir(directory):
+        match = DICTIONARY_PATTERN.match(name)
+        if match:
+            with open(os.path.join(directory, name), "rb") as source:
+                dictionaries[int(match.group(1))] = source.read()
+    return dictionaries
+
+DICTIONARIES = load_dictionaries()
+CURRENT_DICTIONARY = max(DICTIONARIES, default=NO_DICTIONARY)
+
+def _get_dictionary(dictionary_id: int) -> Optional[bytes]:
+    if dictionary_id == NO_DICTIONARY:
+        return None
+    try:
+        return DICTIONARIES[dictionary_id]
+    except KeyError:
+        raise ValueError(f"Unknown compression dictionary: {dictionary_id}")
+
+def _decompressor(dictionary_id: int):
+    dictionary = _get_dictionary(dictionary_id)
+    return zlib.decompressobj(zdict=dictionary) if dictionary else zlib.decompressobj()
+
+def compress_text(text: str, dictionary_id: Optional[int] = None) -> bytes:
+    """
+    Metni saklama formatına sıkıştırır.
+    Sıkıştırma kazanç sağlamazsa metin ham olarak saklanır.
+
+    Args:
+        text: Dilekçe içeriği
+        dictionary_id: Kullanılacak sözlük (varsayılan: en güncel sözlük)
+
+    Returns:
+        bytes: Başlık + veri
+    """
+    raw = text.encode("utf-8")
+    dictionary_id = CURRENT_DICTIONARY if dictionary_id is None else dictionary_id
+    dictionary = _get_dictionary(dictionary_id)
+
+    compressor = zlib.compressobj(
+        level=settings.CONTENT_COMPRESSION_LEVEL,
+        **({"zdict": dictionary} if dictionary else {})
+    )
+    compressed = compressor.compress(raw) + compressor.flush()
+
+    if len(compressed) + 2 < len(raw) + 1:
+        stored = bytes((CODEC_ZLIB, dictionary_id)) + compressed
+    else:
+        stored = bytes((CODEC_RAW,)) + raw
+
+    PETITION_CONTENT_BYTES.labels(kind="raw").inc(len(raw))
+    PETITION_CONTENT_BYTES.labels(kind="stored").inc(len(stored))
+    PETITION_COMPRESSION_RATIO.observe(len(raw) / len(stored))
+    return stored
+
+def decompress_text(data: bytes) -> str:
+    """
+    Saklama formatındaki veriyi metne açar.
+
+    Args:
+        data: compress_text çıktısı
+
+    Returns:
+        str: Dilekçe içeriği
+
+    Raises:
+        ValueError: Bilinmeyen codec veya sözlük
+    """
+    codec = data[0]
+    if codec == CODEC_RAW:
+        return data[1:].decode("utf-8")
+    if codec == CODEC_ZLIB:
+        decompressor = _decompressor(data[1])
+        return (decompressor.decompress(data[2:]) + decompressor.flush()).decode("utf-8")
+    raise ValueError(f"Unknown compression codec: {codec}")
+
+def decompress_prefix(data: bytes, max_chars: int) -> str:
+    """
+    Verinin yalnızca ilk kısmını açar; liste özetleri için tüm içeriğin
+    açılmasına gerek kalmaz.
+
+    Args:
+        data: compress_text çıktısı
+        max_chars: Döndürülecek en fazla karakter sayısı
+
+    Returns:
+        str: İçeriğin başlangıcı
+    """
+    # UTF-8'de bir karakter en fazla 4 bayt (CJK, tipografik tırnak, emoji);
+    # yarım kalan son karakter decode sırasında atılır
+    max_bytes = max_chars * 4
+    codec = data[0]
+    if codec == CODEC_RAW:
+        raw = data[1:1 + max_bytes]
+    elif codec == CODEC_ZLIB:
+        raw = _decompressor(data[1]).decompress(data[2:], max_bytes)
+    else:
+        raise ValueError(f"Unknown compression codec: {codec}")
+    return raw.decode("utf-8", errors="ignore")[:max_chars]
+
+class CompressedText(TypeDecorator):
+    """
+    Sıkıştırılmış saklanan metin kolonu.
+    Uygulama tarafında str olarak okunur ve yazılır.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        return compress_text(value)
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return decompress_text(bytes(value))
+
+def train_dictionary(samples: Iterable[str], size: int = MAX_DICTIONARY_SIZE) -> bytes:
+    """
+    Örnek metinlerden zlib ön tanımlı sözlüğü üretir.
+
+    Birden fazla örnekte geçen kelime dizileri (2-8 kelime) kazanç
+    sırasına göre seçilir. zlib sözlüğün sonuna yakın dizilere daha kısa
+    mesafe kodu verdiği için en kazançlı diziler sona yerleştirilir.
+
+    Args:
+        samples: Örnek dilekçe içerikleri
+        size: Sözlük boyutu sınırı (bayt)
+
+    Returns:
+        bytes: Sözlük içeriği
+    """
+    counts: TokenCounter = TokenCounter()
+    for sample in samples:
+        words = sample.split()
+        seen = set()
+        for length in range(2, 9):
+            for i in range(len(words) - length + 1):
+                seen.add(" ".join(words[i:i + length]))
+        # Aynı örnekteki tekrarlar zlib tarafından zaten yakalanır
+        counts.update(seen)
+
+    candidates = [
+        (count * len(phrase.encode("utf-8")), phrase)
+        for phrase, count in counts.items()
+        if count > 1
+    ]
+    candidates.sort(reverse=True)
+
+    selected = []
+    total = 0
+    for _, phrase in candidates:
+        if any(phrase in chosen for chosen in selected):
+            continue
+        encoded = phrase.encode("utf-8")
+        if total + len(encoded) + 1 > size:
+            break
+        selected.append(phrase)
+        total += len(encoded) + 1
+
+    return "\n".join(reversed(selected)).encode("utf-8")
+
+def _load_samples(limit: int) -> Iterable[str]:
+    """Veritabanındaki en yeni dilekçeleri örnek olarak okur"""
+    from app.db.database import SessionLocal
+    from app.db import models
+
+    db = SessionLocal()
+    try:
+        query = db.query(models.Petition.content).order_by(models.Petition.id.desc()).limit(limit)
+        for (content,) in query:
+            yield content
+    finally:
+        db.close()
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Dilekçe sıkıştırma sözlüğü eğitimi")
+    parser.add_argument("--output", required=True, help="sözlük dosyası (petition_v{n}.zdict)")
+    parser.add_argument("--samples", type=int, default=5000, help="örnek dilekçe sayısı")
+    parser.add_argument("--size", type=int, default=MAX_DICTIONARY_SIZE, help="sözlük boyutu (bayt)")
+    args = parser.parse_args()
+
+    if not DICTIONARY_PATTERN.match(os.path.basename(args.output)):
+        print("Dosya adı petition_v{n}.zdict formatında olmalı")
+        return 1
+    if os.path.exists(args.output):
+        print("Mevcut sözlükler değiştirilemez; yeni bir numara kullanın")
+        return 1
+
+    samples = list(_load_samples(args.samples))
+    dictionary = train_dictionary(samples, args.size)
+    with open(args.output, "wb") as output:
+        output.write(dictionary)
+
+    raw = sum(len(s.encode("utf-8")) for s in samples)
+    plain = sum(len(zlib.compress(s.encode("utf-8"), settings.CONTENT_COMPRESSION_LEVEL)) for s in samples)
+    with_dict = 0
+    for sample in samples:
+        compressor = zlib.compressobj(level=settings.CONTENT_COMPRESSION_LEVEL, zdict=dictionary)
+        with_dict += len(compressor.compress(sample.encode("utf-8")) + compressor.flush())
+    print(f"örnek: {len(samples)}, sözlük: {len(dictionary)} bayt")
+    if plain and with_dict:
+        print(f"oran (sözlüksüz): {raw / plain:.2f}, oran (sözlüklü): {raw / with_dict:.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
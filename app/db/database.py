@@ -1,12 +1,23 @@
-from sqlalchemy import create_engine, event
+from pathlib import Path
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from app.core.config import settings
 from app.core.exceptions import DatabaseError, get_error_message
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, AsyncGenerator, Callable, Dict, Optional
+from fastapi import Request, Response
 from app.core.logger import db_logger
+from app.db.pool import instrumented_pool_class, instrument_engine
+
+# Migration betikleri (ilk kurulumda sürüm işaretlemek için)
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
 
 # SQLite için FOREIGN KEY desteği
 @event.listens_for(Engine, "connect")
@@ -16,14 +27,17 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
 
-# Engine oluştur
+# Senkron engine: tablo oluşturma, scriptler ve thread havuzunda çalışan arka plan görevleri
 engine = create_engine(
     settings.SQLALCHEMY_DATABASE_URI,
+    poolclass=instrumented_pool_class(QueuePool, "sync"),
     pool_pre_ping=True,  # Bağlantı kontrolü
-    pool_size=5,  # Bağlantı havuzu boyutu
-    max_overflow=10,  # Maksimum ek bağlantı
+    pool_size=settings.DB_SYNC_POOL_SIZE,  # Bağlantı havuzu boyutu
+    max_overflow=0,  # Arka plan görevleri için ek bağlantı açılmaz
+    pool_recycle=settings.DB_POOL_RECYCLE,
     echo=settings.ENVIRONMENT == "development"  # Development'ta SQL logları
 )
+instrument_engine(engine, "sync")
 
 # SessionLocal factory
 SessionLocal = sessionmaker(
@@ -32,27 +46,107 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Asenkron engine: istek yolu (asyncpg / aiosqlite)
+# Havuz boyutları DB_POOL_SIZE / DB_MAX_OVERFLOW toplamlarının worker başına payıdır
+async_engine = create_async_engine(
+    settings.get_async_db_url(),
+    poolclass=instrumented_pool_class(AsyncAdaptedQueuePool, "async"),  # aiosqlite varsayılanı NullPool
+    pool_pre_ping=True,
+    pool_size=settings.get_worker_pool_size(),
+    max_overflow=settings.get_worker_max_overflow(),
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    echo=settings.ENVIRONMENT == "development"
+)
+instrument_engine(async_engine.sync_engine, "async")
+
+# AsyncSessionLocal factory
+# expire_on_commit=False: commit sonrası nitelik erişimi örtük (senkron) yükleme yapmasın
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Base class
 Base = declarative_base()
 
-def get_db() -> Generator:
+class LazyAsyncSession:
     """
-    Veritabanı oturumu sağlar.
+    İlk kullanımda oluşturulan AsyncSession vekili.
+    
+    Veritabanına hiç dokunmayan isteklerde oturum oluşturulmaz; bağlantı
+    havuzdan yalnızca ilk sorguda alınır.
+    """
+
+    __slots__ = ("_session", "_factory", "_info")
+
+    def __init__(
+        self,
+        factory: Optional[Callable[[], AsyncSession]] = None,
+        info: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Args:
+            factory: Oturum oluşturan fonksiyon (varsayılan: AsyncSessionLocal)
+            info: Oturumun info sözlüğüne eklenecek değerler
+        """
+        self._session: Optional[AsyncSession] = None
+        self._factory = factory or AsyncSessionLocal
+        self._info = info
+
+    @property
+    def session(self) -> AsyncSession:
+        """Gerçek oturumu döndürür, yoksa oluşturur"""
+        if self._session is None:
+            self._session = self._factory()
+            if self._info:
+                self._session.info.update(self._info)
+        return self._session
+
+    @property
+    def is_started(self) -> bool:
+        """Oturum oluşturuldu mu"""
+        return self._session is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    async def rollback(self) -> None:
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+async def get_db(request: Request, response: Response) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Asenkron veritabanı oturumu sağlar (primary).
+    Oturum ilk sorguda açılır (bkz. LazyAsyncSession). İstek ve yanıt,
+    yazma sonrası okumaların primary'ye yönlendirilmesi için oturuma
+    eklenir (bkz. app.db.replicas).
+    
+    Args:
+        request: İstek
+        response: Yanıt (cookie eklemek için)
     
     Yields:
-        Session: Veritabanı oturumu
+        AsyncSession: Veritabanı oturumu
     
     Raises:
         DatabaseError: Veritabanı bağlantı hatası
     """
-    db = SessionLocal()
+    db = LazyAsyncSession(info={"request": request, "response": response})
     try:
         yield db
     except SQLAlchemyError as e:
         db_logger.error("Database session error", error=str(e))
+        await db.rollback()
         raise DatabaseError(detail=get_error_message("DATABASE_ERROR"))
     finally:
-        db.close()
+        await db.close()
 
 @contextmanager
 def transaction():
@@ -77,16 +171,37 @@ def transaction():
 def init_db() -> None:
     """
     Veritabanını başlatır.
-    Tabloları oluşturur.
+    Veritabanı boşsa tablolar create_all ile şemanın son hâliyle oluşturulur
+    ve alembic sürümü head olarak işaretlenir. Mevcut veritabanının şemasına
+    dokunulmaz; migration'lar uygulama başlamadan önce `alembic upgrade head`
+    ile uygulanır (create_all eksik tabloları oluşturup migration'ları
+    bozardı). Şema head'de değilse uyarı loglanır.
     """
+    # env.py çalıştırılmaz (uygulama loglama ayarlarını değiştirmemesi için)
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    script = ScriptDirectory.from_config(config)
     try:
+        if any(inspect(engine).has_table(name) for name in Base.metadata.tables):
+            with engine.connect() as connection:
+                current = MigrationContext.configure(connection).get_current_revision()
+            if current != script.get_current_head():
+                db_logger.warning(
+                    "Database schema is not at alembic head; run `alembic upgrade head`",
+                    current=current,
+                    head=script.get_current_head()
+                )
+            return
+
         Base.metadata.create_all(bind=engine)
-        db_logger.info("Database tables created successfully")
+        with engine.begin() as connection:
+            MigrationContext.configure(connection).stamp(script, "head")
+        db_logger.info("Database tables created and stamped at alembic head", revision=script.get_current_head())
     except SQLAlchemyError as e:
         db_logger.error("Failed to initialize database", error=str(e))
         raise DatabaseError(detail=get_error_message("DATABASE_ERROR"))
 
-def check_db_connection() -> bool:
+async def check_db_connection() -> bool:
     """
     Veritabanı bağlantısını kontrol eder.
     
@@ -94,8 +209,8 @@ def check_db_connection() -> bool:
         bool: Bağlantı durumu
     """
     try:
-        with engine.connect() as conn:
-            conn.execute("SELECT 1")
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
         db_logger.info("Database connection successful")
         return True
     except SQLAlchemyError as e:
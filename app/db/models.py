@@ -1,11 +1,18 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Boolean, Date, DateTime, ForeignKey, Index, Text, DDL, event, text, Enum as SQLEnum
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import attributes, deferred, relationship
 from sqlalchemy.sql import func
 from app.db.database import Base
-from app.schemas.petition import PetitionType
+from app.db.compression import CompressedText
+from app.db import search
+from app.schemas.petition import PETITION_STATUSES, PetitionType
 from datetime import datetime
 from typing import Optional
 
+# SQLite'ta server_default (CURRENT_TIMESTAMP) ile aynı metin formatı;
+# aksi halde keyset karşılaştırmalarında bağlanan değerler mikro saniye içerir
+KeysetDateTime = DateTime().with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite")
+
 class User(Base):
     """Kullanıcı modeli"""
     __tablename__ = "users"
@@ -16,28 +23,24 @@ class User(Base):
     full_name = Column(String)
     is_active = Column(Boolean, default=True)
     is_premium = Column(Boolean, default=False)
-    premium_until = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    premium_until = Column(DateTime, nullable=True, index=True)  # Süresi dolan üyelik taraması
+    premium_activated_at = Column(DateTime, nullable=True, index=True)  # Son premium'a geçiş (analitik)
+    created_at = Column(DateTime, server_default=func.now(), index=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), index=True)  # Önbellek geçersiz kılma taraması
+    token_version = Column(Integer, nullable=False, default=0, server_default=text("0"))  # Artırılınca eski token'lar geçersiz olur
 
     # İlişkiler
-    petitions = relationship("Petition", back_populates="user", cascade="all, delete-orphan")
+    # Silme veritabanında ON DELETE CASCADE ile yapılır; dilekçeler belleğe yüklenmez
+    petitions = relationship("Petition", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
 
     def is_premium_active(self) -> bool:
-        """Premium üyelik durumunu kontrol eder"""
+        """Premium üyelik durumunu kontrol eder (süresi dolanlar app/db/premium.py ile kapatılır)"""
         if not self.is_premium:
             return False
         if not self.premium_until:
             return False
         return self.premium_until > datetime.utcnow()
 
-    def update_premium_status(self) -> None:
-        """Premium durumunu günceller"""
-        if self.is_premium and self.premium_until:
-            if self.premium_until < datetime.utcnow():
-                self.is_premium = False
-                self.premium_until = None
-
     def to_dict(self) -> dict:
         """Kullanıcı bilgilerini sözlük olarak döndürür"""
         return {
@@ -56,16 +59,43 @@ class Petition(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     petition_type = Column(SQLEnum(PetitionType), nullable=False)
-    content = Column(String, nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime, server_default=func.now())
+    content = Column(CompressedText, nullable=False)  # zlib + sözlük ile sıkıştırılmış
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    created_at = Column(KeysetDateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     status = Column(String, default="draft")  # draft, submitted, approved, rejected
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))  # PATCH ile artar (If-Match / ETag)
     pdf_path = Column(String, nullable=True)
+    generation_ms = Column(Integer, nullable=True)  # AI üretim süresi
+    total_tokens = Column(Integer, nullable=True)  # AI token kullanımı
+    archived_at = Column(DateTime, nullable=True)  # Doluysa içerik petition_archive tablosundadır (app.db.archive)
+    autosaved_at = Column(DateTime, nullable=True)  # Son yazılan otomatik kayıt taslağının alındığı zaman (app.core.autosave)
+    # Yalnızca PostgreSQL'de doldurulur; SQLite'ta arama petitions_fts (FTS5) tablosundadır
+    search_vector = deferred(Column(postgresql.TSVECTOR().with_variant(Text(), "sqlite"), nullable=True))
 
     # İlişkiler
     user = relationship("User", back_populates="petitions")
 
+    __table_args__ = (
+        # /petitions/list keyset sayfalaması: WHERE user_id = ? ORDER BY created_at DESC, id DESC
+        Index("ix_petitions_user_id_created_at_id", user_id, created_at.desc(), id.desc()),
+        # Analitik toplamaları gün aralığı taraması yapar
+        Index("ix_petitions_created_at", created_at),
+        # Arşivleme adayları; arşivlenmiş satırlar indekse girmez
+        Index(
+            "ix_petitions_archive_candidates",
+            updated_at,
+            postgresql_where=archived_at.is_(None),
+            sqlite_where=archived_at.is_(None)
+        ),
+        Index("ix_petitions_search_vector", search_vector, postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+
+    @property
+    def title(self) -> str:
+        """Dilekçe başlığı (tip açıklaması)"""
+        return PetitionType.get_description(self.petition_type)
+
     def to_dict(self) -> dict:
         """Dilekçe bilgilerini sözlük olarak döndürür"""
         return {
@@ -86,9 +116,8 @@ class Petition(Base):
         Args:
             new_status: Yeni durum
         """
-        valid_statuses = {"draft", "submitted", "approved", "rejected"}
-        if new_status not in valid_statuses:
-            raise ValueError(f"Invalid status. Must be one of: {valid_statuses}")
+        if new_status not in PETITION_STATUSES:
+            raise ValueError(f"Invalid status. Must be one of: {PETITION_STATUSES}")
         self.status = new_status
         self.updated_at = datetime.utcnow()
 
@@ -100,4 +129,96 @@ class Petition(Base):
             path: PDF dosya yolu
         """
         self.pdf_path = path
-        self.updated_at = datetime.utcnow() 
\ No newline at end of file
+        self.updated_at = datetime.utcnow() 
+
+class PetitionArchive(Base):
+    """Arşivlenmiş dilekçe içeriği (petitions tablosunda içeriksiz kayıt kalır)"""
+    __tablename__ = "petition_archive"
+
+    id = Column(Integer, ForeignKey("petitions.id", ondelete="CASCADE"), primary_key=True)
+    content = Column(CompressedText, nullable=False)
+    archived_at = Column(DateTime, nullable=False)
+
+class PetitionRevision(Base):
+    """Dilekçenin önceki bir sürümü (delta veya snapshot, bkz. app.db.revisions)"""
+    __tablename__ = "petition_revisions"
+
+    petition_id = Column(Integer, ForeignKey("petitions.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(Integer, primary_key=True)
+    kind = Column(String, nullable=False)  # delta, snapshot
+    data = Column(CompressedText, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+
+class AnalyticsDaily(Base):
+    """Günlük analitik özeti (app.db.analytics tarafından UTC günleri için doldurulur)"""
+    __tablename__ = "analytics_daily"
+
+    day = Column(Date, primary_key=True)
+    petitions = Column(Integer, nullable=False, default=0)
+    active_users = Column(Integer, nullable=False, default=0)  # O gün dilekçe oluşturan kullanıcılar
+    new_users = Column(Integer, nullable=False, default=0)
+    premium_conversions = Column(Integer, nullable=False, default=0)
+    generation_ms_p50 = Column(Integer, nullable=True)
+    generation_ms_p95 = Column(Integer, nullable=True)
+    generation_ms_p99 = Column(Integer, nullable=True)
+    tokens_p50 = Column(Integer, nullable=True)
+    tokens_p95 = Column(Integer, nullable=True)
+    tokens_p99 = Column(Integer, nullable=True)
+
+class AnalyticsDailyPetitionType(Base):
+    """Dilekçe tipine göre günlük dilekçe sayısı"""
+    __tablename__ = "analytics_daily_petition_types"
+
+    day = Column(Date, primary_key=True)
+    petition_type = Column(SQLEnum(PetitionType), primary_key=True)
+    petitions = Column(Integer, nullable=False, default=0)
+
+class AnalyticsWatermark(Base):
+    """Toplama işinin kaldığı yer"""
+    __tablename__ = "analytics_watermarks"
+
+    name = Column(String, primary_key=True)
+    processed_until = Column(Date, nullable=False)  # Bu günden önceki günler işlendi
+
+class RevokedToken(Base):
+    """Kullanılmış (rotasyonla yenilenmiş) veya iptal edilmiş refresh token (bkz. app.core.revocation)"""
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String(32), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    expires_at = Column(DateTime, nullable=False, index=True)  # Bu zamandan sonra kayıt silinebilir
+    revoked_at = Column(DateTime, nullable=False, server_default=func.now(), index=True)
+
+# Arama indeksinin bakımı
+event.listen(Petition.__table__, "after_create", DDL(search.CREATE_FTS_TABLE).execute_if(dialect="sqlite"))
+event.listen(Petition.__table__, "before_drop", DDL(search.DROP_FTS_TABLE).execute_if(dialect="sqlite"))
+
+def _search_fields_changed(target: Petition) -> bool:
+    return any(
+        attributes.get_history(target, name).has_changes()
+        for name in ("content", "petition_type")
+    )
+
+@event.listens_for(Petition, "before_insert")
+@event.listens_for(Petition, "before_update")
+def _update_search_vector(mapper, connection, target: Petition) -> None:
+    """PostgreSQL: başlık (A) ve içerik (B) ağırlıklı tsvector'ı yazma ile birlikte günceller"""
+    if connection.dialect.name != "postgresql" or not _search_fields_changed(target):
+        return
+    target.search_vector = search.to_search_vector(target.title, target.content)
+
+@event.listens_for(Petition, "after_insert")
+@event.listens_for(Petition, "after_update")
+def _update_fts_row(mapper, connection, target: Petition) -> None:
+    """SQLite: FTS5 satırını yazma ile birlikte günceller"""
+    if connection.dialect.name != "sqlite" or not _search_fields_changed(target):
+        return
+    connection.execute(
+        text(f"INSERT OR REPLACE INTO {search.FTS_TABLE}(rowid, title, content) VALUES (:id, :title, :content)"),
+        {"id": target.id, "title": search.fold(target.title), "content": search.fold(target.content)}
+    )
+
+@event.listens_for(Petition, "after_delete")
+def _delete_fts_row(mapper, connection, target: Petition) -> None:
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DELETE FROM {search.FTS_TABLE} WHERE rowid = :id"), {"id": target.id})
@@ -0,0 +1,119 @@
+import time
+from prometheus_client import Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Bağlantı havuzu metrikleri
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured connection pool size",
+    ["engine"]
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out from the pool",
+    ["engine"]
+)
+
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Overflow connections currently in use",
+    ["engine"]
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+
+DB_POOL_CONNECT_TIME = Histogram(
+    "db_pool_connect_seconds",
+    "Time spent opening new connections for the pool",
+    ["engine"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+
+DB_CONNECTION_AGE = Histogram(
+    "db_connection_age_seconds",
+    "Age of pooled connections at checkout",
+    ["engine"],
+    buckets=(1, 10, 60, 300, 900, 1800, 3600, 7200, 21600, 86400)
+)
+
+# Yeni açılan bağlantının açılış süresi (bekleme süresinden düşülür)
+CONNECT_DURATION_KEY = "connect_duration"
+
+class _CheckoutTimingMixin:
+    """
+    Havuzdan bağlantı alma süresini ölçer. Havuz boşken yeni bağlantı
+    açılırsa açılış süresi ayrı ölçülür ve bekleme süresine katılmaz.
+    """
+
+    metrics_label = "default"
+
+    def _create_connection(self):
+        start = time.perf_counter()
+        record = super()._create_connection()
+        duration = time.perf_counter() - start
+        # Süre bağlantı kaydında taşınır; eşzamanlı checkout'lar birbirini etkilemez
+        record.info[CONNECT_DURATION_KEY] = duration
+        DB_POOL_CONNECT_TIME.labels(engine=self.metrics_label).observe(duration)
+        return record
+
+    def _do_get(self):
+        start = time.perf_counter()
+        record = None
+        try:
+            record = super()._do_get()
+            return record
+        finally:
+            elapsed = time.perf_counter() - start
+            if record is not None:
+                elapsed -= record.info.pop(CONNECT_DURATION_KEY, 0.0)
+            DB_POOL_CHECKOUT_WAIT.labels(engine=self.metrics_label).observe(max(elapsed, 0.0))
+
+def instrumented_pool_class(base: type, label: str) -> type:
+    """
+    Bekleme süresi ölçümü eklenmiş havuz sınıfı oluşturur.
+
+    Args:
+        base: QueuePool veya AsyncAdaptedQueuePool
+        label: Metrik etiketi (engine adı)
+
+    Returns:
+        type: create_engine'e poolclass olarak verilecek sınıf
+    """
+    return type(
+        f"Instrumented{base.__name__}",
+        (_CheckoutTimingMixin, base),
+        {"metrics_label": label}
+    )
+
+def instrument_engine(engine: Engine, label: str) -> None:
+    """
+    Engine havuzuna Prometheus metriklerini bağlar.
+    Havuz doluluğu scrape anında okunur, bağlantı yaşı checkout'ta kaydedilir.
+
+    Args:
+        engine: Senkron engine (async engine için engine.sync_engine)
+        label: Metrik etiketi
+    """
+    pool = engine.pool
+    if isinstance(pool, (QueuePool, AsyncAdaptedQueuePool)):
+        DB_POOL_SIZE.labels(engine=label).set_function(pool.size)
+        DB_POOL_CHECKED_OUT.labels(engine=label).set_function(pool.checkedout)
+        DB_POOL_OVERFLOW.labels(engine=label).set_function(lambda: max(pool.overflow(), 0))
+
+    @event.listens_for(engine, "connect")
+    def _record_connect_time(dbapi_connection, connection_record):
+        connection_record.info["connected_at"] = time.time()
+
+    @event.listens_for(engine, "checkout")
+    def _observe_connection_age(dbapi_connection, connection_record, connection_proxy):
+        connected_at = connection_record.info.get("connected_at")
+        if connected_at is not None:
+            DB_CONNECTION_AGE.labels(engine=label).observe(time.time() - connected_at)
@@ -0,0 +1,64 @@
+"""
+Süresi dolan premium üyeliklerin kapatılması.
+
+İstek sırasında premium kontrolü yalnızca premium_until'ı şimdiki zamanla
+karşılaştırır (User.is_premium_active), veritabanına yazmaz. Süresi dolmuş
+kayıtların is_premium/premium_until kolonları PREMIUM_EXPIRY_INTERVAL_SECONDS
+aralıkla tek bir UPDATE ile temizlenir.
+
+Görev her worker'da çalışır. UPDATE idempotenttir; PostgreSQL'de başka bir
+worker'ın veya isteğin kilitlediği satırlar atlanır ve sonraki çalıştırmada
+işlenir. Değişen kullanıcıların updated_at'ı güncellendiği için önbellekteki
+kayıtları tarama görevleriyle silinir.
+"""
+from datetime import datetime
+from typing import Optional
+from prometheus_client import Counter
+from sqlalchemy import select, update
+from app.core.logger import db_logger
+from app.db import models
+from app.db.database import SessionLocal
+
+PREMIUMS_EXPIRED = Counter(
+    "premium_expired_total",
+    "Premium memberships closed by the expiry sweeper"
+)
+
+def expire_premiums(now: Optional[datetime] = None) -> int:
+    """
+    Süresi dolmuş premium üyelikleri kapatır.
+    Arka plan görevi olarak periyodik çalıştırılır.
+
+    Args:
+        now: Şimdiki zaman (UTC)
+
+    Returns:
+        int: Kapatılan üyelik sayısı
+    """
+    users = models.User.__table__
+    now = now or datetime.utcnow()
+    # Diğer worker'ların kilitlediği satırlar atlanır (PostgreSQL)
+    expired = (
+        select(users.c.id)
+        .where(users.c.is_premium.is_(True), users.c.premium_until < now)
+        .with_for_update(skip_locked=True)
+    )
+
+    db = SessionLocal()
+    try:
+        count = db.execute(
+            update(users)
+            .where(users.c.id.in_(expired))
+            .values(is_premium=False, premium_until=None)
+        ).rowcount
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    if count:
+        PREMIUMS_EXPIRED.inc(count)
+        db_logger.info("Expired premium memberships closed", count=count)
+    return count
@@ -0,0 +1,252 @@
+import itertools
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncGenerator, Dict, List, Optional, Tuple
+from fastapi import Request, Response
+from prometheus_client import Counter, Gauge
+from sqlalchemy import event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from app.core.config import settings
+from app.core.exceptions import DatabaseError, get_error_message
+from app.core.logger import db_logger
+from app.db.database import AsyncSessionLocal, LazyAsyncSession
+from app.db.pool import instrumented_pool_class, instrument_engine
+
+# Yazma sonrası okumaların primary'ye gitmesi için istemciye verilen cookie
+STICKY_COOKIE = "db_primary_until"
+
+# Kalıcı olmayan yapışkanlık kayıtları bu sayıyı aşınca süresi dolanlar temizlenir
+STICKY_PRUNE_THRESHOLD = 1024
+
+# Replikanın primary'den geride kaldığı süre (saniye)
+LAG_QUERIES = {
+    "postgresql": (
+        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+    ),
+    # Yerel testlerde replika yerine kullanılan SQLite dosyalarında gecikme yoktur
+    "sqlite": "SELECT 0",
+}
+
+DB_REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "Replication lag of read replicas (NaN when unreachable)",
+    ["replica"]
+)
+
+DB_READ_ROUTE = Counter(
+    "db_read_route_total",
+    "Read-only session routing decisions",
+    ["target", "reason"]
+)
+
+@dataclass
+class Replica:
+    """Okuma replikası"""
+    name: str
+    engine: AsyncEngine
+    lag: Optional[float] = None  # None: henüz ölçülmedi veya erişilemiyor
+
+class ReplicaRouter:
+    """
+    Salt okunur oturumları replikalara yönlendirir.
+
+    Gecikmesi max_lag_seconds altındaki replikalar sırayla kullanılır;
+    uygun replika yoksa primary'ye düşülür. Yazma yapan kullanıcının
+    okumaları sticky_seconds boyunca primary'ye gider (read-your-writes).
+    Yapışkanlık worker içinde bellekte, worker'lar arasında cookie ile taşınır.
+    """
+
+    def __init__(self, urls: List[str], max_lag_seconds: float, sticky_seconds: int):
+        """
+        Args:
+            urls: Replika veritabanı URL'leri
+            max_lag_seconds: Kabul edilen en yüksek replikasyon gecikmesi
+            sticky_seconds: Yazma sonrası primary'ye yönlendirme süresi
+        """
+        self.max_lag_seconds = max_lag_seconds
+        self.sticky_seconds = sticky_seconds
+        self.replicas = [
+            Replica(name=f"replica{index}", engine=self._create_engine(url, f"replica{index}"))
+            for index, url in enumerate(urls)
+        ]
+        self._sticky: Dict[str, float] = {}
+        self._round_robin = itertools.count()
+
+    @staticmethod
+    def _create_engine(url: str, label: str) -> AsyncEngine:
+        engine = create_async_engine(
+            settings.to_async_db_url(url),
+            poolclass=instrumented_pool_class(AsyncAdaptedQueuePool, label),
+            pool_pre_ping=True,
+            pool_size=settings.get_worker_pool_size(),
+            max_overflow=settings.get_worker_max_overflow(),
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE
+        )
+        instrument_engine(engine.sync_engine, label)
+        return engine
+
+    @property
+    def enabled(self) -> bool:
+        """Replika tanımlı mı"""
+        return bool(self.replicas)
+
+    async def check_lag(self) -> None:
+        """Replikaların gecikmesini ölçer; erişilemeyen replika devre dışı kalır"""
+        for replica in self.replicas:
+            query = LAG_QUERIES.get(replica.engine.dialect.name, "SELECT 0")
+            try:
+                async with replica.engine.connect() as conn:
+                    replica.lag = float((await conn.execute(text(query))).scalar() or 0)
+            except SQLAlchemyError as e:
+                replica.lag = None
+                db_logger.warning("Replica lag check failed", replica=replica.name, error=str(e))
+            DB_REPLICA_LAG.labels(replica=replica.name).set(
+                replica.lag if replica.lag is not None else float("nan")
+            )
+
+    def mark_write(self, key: Optional[str]) -> float:
+        """
+        Kullanıcının yazma yaptığını kaydeder.
+
+        Args:
+            key: Kullanıcı anahtarı (token subject)
+
+        Returns:
+            float: Primary'ye yönlendirmenin biteceği zaman (epoch)
+        """
+        until = time.time() + self.sticky_seconds
+        if key:
+            if len(self._sticky) > STICKY_PRUNE_THRESHOLD:
+                now = time.time()
+                self._sticky = {k: v for k, v in self._sticky.items() if v > now}
+            self._sticky[key] = until
+        return until
+
+    def is_sticky(self, key: Optional[str], cookie_until: Optional[float] = None) -> bool:
+        """Kullanıcı yakın zamanda yazma yaptı mı"""
+        now = time.time()
+        if cookie_until is not None and cookie_until > now:
+            return True
+        return key is not None and self._sticky.get(key, 0) > now
+
+    def choose(self, key: Optional[str] = None, cookie_until: Optional[float] = None) -> Tuple[Optional[Replica], str]:
+        """
+        Okuma için replika seçer.
+
+        Returns:
+            Tuple[Optional[Replica], str]: Replika (None ise primary) ve seçim nedeni
+        """
+        if not self.replicas:
+            return None, "no_replica"
+        if self.is_sticky(key, cookie_until):
+            return None, "read_your_writes"
+        healthy = [
+            replica for replica in self.replicas
+            if replica.lag is not None and replica.lag <= self.max_lag_seconds
+        ]
+        if not healthy:
+            return None, "lag"
+        return healthy[next(self._round_robin) % len(healthy)], "replica"
+
+    def session(self, key: Optional[str] = None, cookie_until: Optional[float] = None) -> AsyncSession:
+        """Seçilen replikaya (veya primary'ye) bağlı oturum oluşturur"""
+        replica, reason = self.choose(key, cookie_until)
+        DB_READ_ROUTE.labels(target=replica.name if replica else "primary", reason=reason).inc()
+        if replica is None:
+            return AsyncSessionLocal()
+        return AsyncSessionLocal(bind=replica.engine)
+
+    @asynccontextmanager
+    async def read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Kullanıcıya bağlı olmayan okumalar için (ör. /metrics) oturum"""
+        session = self.session()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+replica_router = ReplicaRouter(
+    settings.DB_REPLICA_URLS,
+    settings.DB_REPLICA_MAX_LAG_SECONDS,
+    settings.DB_READ_YOUR_WRITES_SECONDS
+)
+
+def _sticky_cookie_value(request: Request) -> Optional[float]:
+    value = request.cookies.get(STICKY_COOKIE)
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Salt okunur endpoint'ler için veritabanı oturumu sağlar.
+    Oturum ilk sorguda açılır; hedef o anda seçilir, böylece
+    get_current_user'ın kaydettiği kullanıcı yapışkanlıkta dikkate alınır.
+
+    Yields:
+        AsyncSession: Replika veya primary oturumu
+
+    Raises:
+        DatabaseError: Veritabanı bağlantı hatası
+    """
+    db = LazyAsyncSession(
+        factory=lambda: replica_router.session(
+            getattr(request.state, "db_user", None),
+            _sticky_cookie_value(request)
+        )
+    )
+    try:
+        yield db
+    except SQLAlchemyError as e:
+        db_logger.error("Read session error", error=str(e))
+        await db.rollback()
+        raise DatabaseError(detail=get_error_message("DATABASE_ERROR"))
+    finally:
+        await db.close()
+
+def mark_request_write(request: Request, response: Optional[Response] = None) -> None:
+    """
+    İsteğin yazma yaptığını kaydeder; kullanıcının okumaları sticky_seconds
+    boyunca primary'ye gider. İstek oturumu dışında yazan endpoint'ler
+    (ör. otomatik kayıt tamponu) tarafından doğrudan çağrılır.
+
+    Args:
+        request: İstek
+        response: Yanıt (cookie eklemek için)
+    """
+    if not replica_router.enabled:
+        return
+    until = replica_router.mark_write(getattr(request.state, "db_user", None))
+    if response is not None:
+        response.set_cookie(
+            STICKY_COOKIE,
+            str(int(until)),
+            max_age=replica_router.sticky_seconds,
+            httponly=True,
+            samesite="lax"
+        )
+
+# Primary oturumlarında yazma takibi (read-your-writes)
+@event.listens_for(Session, "after_flush")
+def _record_write(session: Session, flush_context) -> None:
+    session.info["has_writes"] = True
+
+@event.listens_for(Session, "after_commit")
+def _mark_sticky(session: Session) -> None:
+    if not session.info.pop("has_writes", False) or not replica_router.enabled:
+        return
+    request: Optional[Request] = session.info.get("request")
+    if request is None:
+        return
+    mark_request_write(request, session.info.get("response"))
+
+@event.listens_for(Session, "after_rollback")
+def _clear_write(session: Session) -> None:
+    session.info.pop("has_writes", None)
@@ -0,0 +1,234 @@
+"""
+Dilekçe revizyon geçmişi.
+
+Güncel içerik her zaman petitions.content'tedir (tek satır okuma). Her
+güncellemede önceki sürüm petition_revisions tablosuna, yeni içerikten
+eski içeriğe giden ters delta olarak yazılır; REVISION_SNAPSHOT_INTERVAL'in
+katı olan sürümler tam içerik (snapshot) olarak saklanır. Eski bir sürüm,
+kendisinden sonraki ilk snapshot'tan (yoksa güncel içerikten) geriye doğru
+en fazla REVISION_SNAPSHOT_INTERVAL - 1 delta uygulanarak oluşturulur.
+
+Delta, kelime (boşluklarıyla birlikte) dizileri üzerinde JSON işlem
+listesidir: [n] kaynaktan n kelime kopyala, [-n] n kelime atla, "metin"
+metni ekle. Boyutu belgeye değil değişikliğin büyüklüğüne bağlıdır.
+
+Toplu durum güncellemelerinde içerik değişmez; bu sürümler içerik
+okunmadan "unchanged" kaydı (boş delta) olarak yazılır.
+
+Otomatik kayıt güncel sürümün içeriğini sürüm artırmadan değiştirir. Önceki
+sürümün deltası güncel içerikten üretildiği için aynı transaction'da yeni
+içeriğe göre yeniden yazılır (rebase_previous_revision); daha eski kayıtlar
+kendilerinden sonraki sürüme göre tutulduğundan değişmez.
+"""
+import json
+import re
+from difflib import SequenceMatcher
+from typing import List, Optional, Sequence, Tuple, Union
+from sqlalchemy import func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.db import models
+
+KIND_SNAPSHOT = "snapshot"
+KIND_DELTA = "delta"
+KIND_UNCHANGED = "unchanged"  # İçerik sonraki sürümle aynı
+
+# Kelime ve ardından gelen boşluklar; birleştirildiğinde metnin kendisini verir
+TOKEN_PATTERN = re.compile(r"\s+|\S+\s*")
+
+DeltaOp = Union[int, str]
+
+def tokenize(text: str) -> List[str]:
+    """Metni birleştirildiğinde aynı metni veren parçalara ayırır"""
+    return TOKEN_PATTERN.findall(text)
+
+def make_delta(source: str, target: str) -> str:
+    """
+    source metnini target metnine çeviren deltayı üretir.
+
+    Args:
+        source: Kaynak metin
+        target: Hedef metin
+
+    Returns:
+        str: JSON delta
+    """
+    source_tokens = tokenize(source)
+    target_tokens = tokenize(target)
+    ops: List[DeltaOp] = []
+    matcher = SequenceMatcher(None, source_tokens, target_tokens, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(i2 - i1)
+            continue
+        if i2 > i1:
+            ops.append(-(i2 - i1))
+        if j2 > j1:
+            ops.append("".join(target_tokens[j1:j2]))
+    return json.dumps(ops, ensure_ascii=False, separators=(",", ":"))
+
+def apply_delta(source: str, delta: str) -> str:
+    """
+    Deltayı kaynak metne uygular.
+
+    Args:
+        source: Kaynak metin
+        delta: make_delta çıktısı
+
+    Returns:
+        str: Hedef metin
+
+    Raises:
+        ValueError: Delta kaynak metne uymuyor
+    """
+    tokens = tokenize(source)
+    position = 0
+    parts = []
+    for op in json.loads(delta):
+        if isinstance(op, str):
+            parts.append(op)
+        elif op >= 0:
+            parts.extend(tokens[position:position + op])
+            position += op
+        else:
+            position -= op
+        if position > len(tokens):
+            raise ValueError("Delta does not match source text")
+    if position != len(tokens):
+        raise ValueError("Delta does not match source text")
+    return "".join(parts)
+
+def build_revision(petition_id: int, version: int, content: str, next_content: str) -> models.PetitionRevision:
+    """
+    Güncellenmeden önceki sürümün revizyon kaydını oluşturur.
+
+    Args:
+        petition_id: Dilekçe ID
+        version: Önceki sürüm numarası
+        content: Önceki sürümün içeriği
+        next_content: Yeni sürümün içeriği
+
+    Returns:
+        PetitionRevision: Revizyon kaydı
+    """
+    if version % settings.REVISION_SNAPSHOT_INTERVAL == 0:
+        return models.PetitionRevision(petition_id=petition_id, version=version, kind=KIND_SNAPSHOT, data=content)
+    return models.PetitionRevision(
+        petition_id=petition_id,
+        version=version,
+        kind=KIND_DELTA,
+        data=make_delta(next_content, content)
+    )
+
+async def add_unchanged_revisions(db: AsyncSession, rows: Sequence[Tuple[int, int]]) -> None:
+    """
+    İçeriği değişmeden sürümü artırılan dilekçelerin önceki sürümlerini
+    toplu olarak kaydeder. Sürümleri artıran UPDATE'ten sonra aynı
+    transaction'da çağrılır; commit çağıran tarafa bırakılır.
+
+    Args:
+        db: Veritabanı oturumu
+        rows: (dilekçe ID, yeni sürüm) çiftleri
+    """
+    interval = settings.REVISION_SNAPSHOT_INTERVAL
+    unchanged = [
+        {"petition_id": petition_id, "version": version - 1, "kind": KIND_UNCHANGED, "data": ""}
+        for petition_id, version in rows
+        if (version - 1) % interval != 0
+    ]
+    snapshot_ids = [petition_id for petition_id, version in rows if (version - 1) % interval == 0]
+
+    revisions = models.PetitionRevision.__table__
+    if unchanged:
+        await db.execute(insert(revisions), unchanged)
+    if snapshot_ids:
+        petitions = models.Petition.__table__
+        archive = models.PetitionArchive.__table__
+        # Sıkıştırılmış içerik açılmadan kopyalanır; arşivlenmiş dilekçenin içeriği arşiv tablosundadır
+        await db.execute(
+            insert(revisions).from_select(
+                ["petition_id", "version", "kind", "data"],
+                select(
+                    petitions.c.id,
+                    petitions.c.version - 1,
+                    literal(KIND_SNAPSHOT),
+                    func.coalesce(archive.c.content, petitions.c.content)
+                )
+                .select_from(petitions.outerjoin(archive, archive.c.id == petitions.c.id))
+                .where(petitions.c.id.in_(snapshot_ids))
+            )
+        )
+
+async def rebase_previous_revision(db: AsyncSession, petition: models.Petition, new_content: str) -> None:
+    """
+    Güncel sürümün içeriği yerinde değiştirilmeden önce önceki sürümün
+    kaydını yeni içeriğe göre yeniden yazar. Dilekçe satırı kilitliyken
+    çağrılır; commit çağıran tarafa bırakılır.
+
+    Args:
+        db: Veritabanı oturumu
+        petition: Dilekçe (henüz değiştirilmemiş güncel içerikle)
+        new_content: Güncel sürümün yeni içeriği
+
+    Raises:
+        ValueError: Mevcut delta güncel içeriğe uymuyor
+    """
+    if petition.version <= 1:
+        return
+    revision = await db.get(models.PetitionRevision, (petition.id, petition.version - 1))
+    if revision is None or revision.kind == KIND_SNAPSHOT:
+        return
+
+    if revision.kind == KIND_UNCHANGED:
+        previous = petition.content
+    else:
+        previous = apply_delta(petition.content, revision.data)
+    revision.kind = KIND_DELTA
+    revision.data = make_delta(new_content, previous)
+
+async def get_revision_content(db: AsyncSession, petition: models.Petition, version: int) -> Optional[str]:
+    """
+    Dilekçenin belirli bir sürümünün içeriğini oluşturur.
+
+    Args:
+        db: Veritabanı oturumu
+        petition: Dilekçe (güncel içerikle)
+        version: Sürüm numarası
+
+    Returns:
+        Optional[str]: İçerik, sürüm yoksa None
+    """
+    if version == petition.version:
+        return petition.content
+    if version < 1 or version > petition.version:
+        return None
+
+    # version'dan itibaren ilk snapshot'a kadar (en fazla bir aralık) kayıtlar
+    revisions = (await db.execute(
+        select(models.PetitionRevision)
+        .where(
+            models.PetitionRevision.petition_id == petition.id,
+            models.PetitionRevision.version >= version
+        )
+        .order_by(models.PetitionRevision.version)
+        .limit(settings.REVISION_SNAPSHOT_INTERVAL)
+    )).scalars().all()
+    if not revisions or revisions[0].version != version:
+        return None
+
+    chain = []
+    content = petition.content
+    for revision in revisions:
+        if revision.kind == KIND_SNAPSHOT:
+            content = revision.data
+            break
+        chain.append(revision)
+    else:
+        if revisions[-1].version != petition.version - 1:
+            # Aralıkta snapshot olmalıydı; eksik kayıt
+            return None
+
+    for revision in reversed(chain):
+        if revision.kind == KIND_DELTA:
+            content = apply_delta(content, revision.data)
+    return content
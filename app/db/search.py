@@ -0,0 +1,137 @@
+"""
+Dilekçe tam metin araması için metin işleme yardımcıları.
+
+PostgreSQL'de petitions.search_vector (tsvector, 'turkish' yapılandırması,
+GIN indeksli), SQLite'ta petitions_fts (FTS5) kullanılır. İçerik
+sıkıştırılmış saklandığından arama belgesi yazma sırasında uygulama
+tarafından üretilir; vurgulama da açılmış içerik üzerinde yapılır.
+"""
+import re
+import unicodedata
+from html import escape
+from typing import Any, List, Optional
+from sqlalchemy import func, literal_column
+from sqlalchemy.sql.elements import ColumnElement
+
+# Sabitler bind parametresi yerine SQL'e gömülür (regconfig / "char" tipleri)
+SEARCH_CONFIG = literal_column("'turkish'::regconfig")
+FTS_TABLE = "petitions_fts"
+
+CREATE_FTS_TABLE = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+    "USING fts5(title, content, tokenize='unicode61 remove_diacritics 2')"
+)
+DROP_FTS_TABLE = f"DROP TABLE IF EXISTS {FTS_TABLE}"
+
+# Başlık eşleşmeleri içerik eşleşmelerinden daha değerlidir
+FTS_RANK = f"-bm25({FTS_TABLE}, 2.0, 1.0)"
+
+# Türkçe çekim eklerine karşı terimlerin ilk PREFIX_LENGTH harfi eşleştirilir
+PREFIX_LENGTH = 5
+
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Türkçe harfler için NFKD ayrıştırmasına gerek kalmadan hızlı dönüşüm
+# (str.translate Unicode metinde karakter başına çalıştığı için replace zinciri daha hızlı)
+TURKISH_FOLD = tuple(zip("çğıöşüâîû", "cgiosuaiu"))
+
+MARK_START = "<mark>"
+MARK_END = "</mark>"
+
+def normalize_turkish(text: str) -> str:
+    """Türkçe kurallarına göre küçük harfe çevirir (İ -> i, I -> ı)"""
+    return text.replace("İ", "i").replace("I", "ı").lower()
+
+def fold(text: str) -> str:
+    """
+    Karşılaştırma için aksan ve noktasız i farklarını kaldırır.
+    SQLite unicode61 tokenizer'ı ı/i ayrımını yapamadığından FTS5
+    belgeleri ve sorguları bu biçimde saklanır.
+    """
+    folded = normalize_turkish(text)
+    for source, target in TURKISH_FOLD:
+        folded = folded.replace(source, target)
+    if folded.isascii():
+        return folded
+    decomposed = unicodedata.normalize("NFKD", folded)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+def search_vector_expression(title: Any, content: Any) -> ColumnElement:
+    """
+    PostgreSQL için başlık (A) ve içerik (B) ağırlıklı tsvector ifadesi.
+    Değerler normalize_turkish ile hazırlanmış olmalıdır.
+    """
+    return func.setweight(
+        func.to_tsvector(SEARCH_CONFIG, title), literal_column("'A'")
+    ).op("||")(
+        func.setweight(func.to_tsvector(SEARCH_CONFIG, content), literal_column("'B'"))
+    )
+
+def to_search_vector(title: str, content: str) -> ColumnElement:
+    """Başlık ve içerikten PostgreSQL tsvector ifadesi"""
+    return search_vector_expression(normalize_turkish(title), normalize_turkish(content))
+
+def to_search_query(query: str) -> ColumnElement:
+    """PostgreSQL için kullanıcı sorgusundan tsquery ifadesi"""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, normalize_turkish(query))
+
+def search_terms(query: str) -> List[str]:
+    """Arama sorgusundaki terimleri karşılaştırma biçiminde döndürür"""
+    return [fold(word) for word in WORD_PATTERN.findall(query)]
+
+def term_prefix(term: str) -> str:
+    """Terimin ek farklarından etkilenmeyen baş kısmı"""
+    return term[:PREFIX_LENGTH]
+
+def fts_match_query(query: str) -> Optional[str]:
+    """
+    Kullanıcı sorgusunu FTS5 MATCH ifadesine çevirir.
+    Her terim tırnaklanır (FTS5 sözdizimi hatalarını önler) ve önek
+    aramasıyla aranır; terimler AND ile birleşir.
+
+    Returns:
+        Optional[str]: MATCH ifadesi, sorguda terim yoksa None
+    """
+    terms = search_terms(query)
+    if not terms:
+        return None
+    return " ".join(f'"{term_prefix(term)}"*' for term in terms)
+
+def highlight(content: str, query: str, max_words: int) -> str:
+    """
+    İçerikten sorgu terimlerinin geçtiği bölümü vurgulanmış olarak çıkarır.
+    Metin HTML olarak kaçışlanır, eşleşen kelimeler <mark> ile işaretlenir.
+
+    Args:
+        content: Dilekçe içeriği
+        query: Arama sorgusu
+        max_words: Parçadaki en fazla kelime sayısı
+
+    Returns:
+        str: Vurgulanmış içerik parçası
+    """
+    prefixes = tuple(term_prefix(term) for term in search_terms(query))
+    words = list(WORD_PATTERN.finditer(content))
+    if not words:
+        return ""
+
+    matched = [bool(prefixes) and fold(match.group()).startswith(prefixes) for match in words]
+    first = matched.index(True) if any(matched) else 0
+    start = max(0, first - max_words // 4)
+    end = min(len(words), start + max_words)
+
+    parts = ["… "] if start > 0 else []
+    position = words[start].start()
+    for index in range(start, end):
+        word = words[index]
+        if index > start:
+            parts.append(escape(WHITESPACE_PATTERN.sub(" ", content[position:word.start()])))
+        if matched[index]:
+            parts.append(MARK_START + escape(word.group()) + MARK_END)
+        else:
+            parts.append(escape(word.group()))
+        position = word.end()
+    if end < len(words):
+        parts.append(" …")
+    return "".join(parts)
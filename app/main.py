@@ -3,14 +3,40 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.core.middleware import setup_middlewares
-from app.core.monitoring import init_monitoring
+from app.core.monitoring import init_monitoring, refresh_stats
+from app.core.autosave import autosave_buffer
+from app.core.user_cache import user_cache
+from app.core.revocation import revocation_list
+from app.core.hashing import password_hasher
+from app.core.storage import collect_orphan_pdfs
+from app.db.analytics import run_rollups
+from app.db.archive import archive_petitions
+from app.db.premium import expire_premiums
+from app.core.tasks import PeriodicTask, start_tasks, stop_tasks
+from app.db.replicas import replica_router
 from app.api import v1_router
-from app.db.database import engine
-from app.db import models
+from app.db.database import init_db
+from app.db import models  # noqa: F401  Modellerin metadata'ya kaydı için
 from prometheus_fastapi_instrumentator import Instrumentator
 import os
 from app.api.v1.endpoints import health
 
+# Arka plan görevleri
+background_tasks = [
+    PeriodicTask("pdf_gc", collect_orphan_pdfs, settings.PDF_GC_INTERVAL_SECONDS),
+    PeriodicTask("stats_refresh", refresh_stats, settings.STATS_REFRESH_SECONDS, initial_delay=0),
+    PeriodicTask("analytics_rollup", run_rollups, settings.ANALYTICS_ROLLUP_INTERVAL_SECONDS),
+    PeriodicTask("petition_archive", archive_petitions, settings.ARCHIVE_INTERVAL_SECONDS),
+    PeriodicTask("premium_expiry", expire_premiums, settings.PREMIUM_EXPIRY_INTERVAL_SECONDS, initial_delay=0),
+    PeriodicTask("autosave_flush", autosave_buffer.flush_due, settings.AUTOSAVE_CHECK_SECONDS),
+    PeriodicTask("user_cache_poll", user_cache.poll_changes, settings.USER_CACHE_POLL_SECONDS, initial_delay=0),
+    PeriodicTask("revocation_poll", revocation_list.poll_changes, settings.REVOCATION_POLL_SECONDS, initial_delay=0),
+]
+if replica_router.enabled:
+    background_tasks.append(
+        PeriodicTask("replica_lag", replica_router.check_lag, settings.DB_REPLICA_LAG_CHECK_SECONDS, initial_delay=0)
+    )
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -22,13 +48,18 @@ async def lifespan(app: FastAPI):
     if not settings.TESTING:
         try:
             print("Veritabanı kontrol ediliyor...")
-            models.Base.metadata.create_all(bind=engine)
+            init_db()
             print("Veritabanı tabloları hazır!")
         except Exception as e:
             print(f"Veritabanı hatası: {str(e)}")
+        start_tasks(background_tasks)
     yield
     # Shutdown
     print("Uygulama kapatılıyor...")
+    await stop_tasks(background_tasks)
+    # Bellekteki taslaklar kaybolmasın
+    await autosave_buffer.flush_all()
+    password_hasher.shutdown()
 
 def create_app() -> FastAPI:
     """
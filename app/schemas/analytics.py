@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from datetime import date
+
+class Percentiles(BaseModel):
+    """Yüzdelik değerleri şeması"""
+    p50: Optional[int] = None
+    p95: Optional[int] = None
+    p99: Optional[int] = None
+
+class AnalyticsDay(BaseModel):
+    """Günlük analitik özeti şeması"""
+    day: date
+    petitions: int = Field(..., description="Oluşturulan dilekçe sayısı")
+    petitions_by_type: Dict[str, int] = Field(default_factory=dict, description="Dilekçe tipine göre sayılar")
+    active_users: int = Field(..., description="O gün dilekçe oluşturan kullanıcı sayısı")
+    new_users: int = Field(..., description="Yeni kayıt sayısı")
+    premium_conversions: int = Field(..., description="Premium'a geçen kullanıcı sayısı")
+    generation_ms: Percentiles = Field(..., description="AI üretim süresi (ms)")
+    tokens: Percentiles = Field(..., description="AI token kullanımı")
+
+class AnalyticsReport(BaseModel):
+    """Analitik raporu şeması"""
+    start: date
+    end: date
+    processed_until: Optional[date] = Field(None, description="Bu günden önceki günler toplandı")
+    days: List[AnalyticsDay]
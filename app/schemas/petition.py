@@ -1,8 +1,11 @@
 from pydantic import BaseModel, Field, validator
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from enum import Enum
 
+# Dilekçe durumları
+PETITION_STATUSES = {"draft", "submitted", "approved", "rejected"}
+
 class PetitionType(str, Enum):
     """Dilekçe tipleri"""
     CONSUMER_COMPLAINT = "consumer_complaint"
@@ -53,15 +56,32 @@ class PetitionUpdate(BaseModel):
     """Dilekçe güncelleme şeması"""
     content: Optional[str] = Field(None, description="Dilekçe içeriği")
     status: Optional[str] = Field(None, description="Dilekçe durumu")
+    version: Optional[int] = Field(None, description="Düzenlenen sürüm (If-Match başlığı yerine)")
+
+    @validator('status')
+    def validate_status(cls, v):
+        """Durum değeri doğrulama"""
+        if v not in PETITION_STATUSES:
+            raise ValueError(f"Geçersiz durum. Geçerli değerler: {PETITION_STATUSES}")
+        return v
+
+class PetitionStatusBulkUpdate(BaseModel):
+    """Toplu durum güncelleme şeması"""
+    ids: List[int] = Field(..., min_length=1, max_length=1000, description="Dilekçe ID'leri")
+    status: str = Field(..., description="Yeni durum")
 
     @validator('status')
     def validate_status(cls, v):
         """Durum değeri doğrulama"""
-        valid_statuses = {"draft", "submitted", "approved", "rejected"}
-        if v not in valid_statuses:
-            raise ValueError(f"Geçersiz durum. Geçerli değerler: {valid_statuses}")
+        if v not in PETITION_STATUSES:
+            raise ValueError(f"Geçersiz durum. Geçerli değerler: {PETITION_STATUSES}")
         return v
 
+class PetitionStatusBulkResult(BaseModel):
+    """Toplu durum güncelleme sonucu şeması"""
+    status: str
+    updated: List[int] = Field(..., description="Durumu değiştirilen dilekçe ID'leri")
+
 class PetitionResponse(BaseModel):
     """Dilekçe yanıt şeması"""
     id: int
@@ -71,6 +91,7 @@ class PetitionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     status: str = Field(default="draft")
+    version: int = Field(default=1, description="Sürüm numarası (ETag)")
     pdf_path: Optional[str] = None
 
     class Config:
@@ -80,6 +101,43 @@ class PetitionResponse(BaseModel):
             datetime: lambda v: v.isoformat()
         }
 
+class PetitionSummary(BaseModel):
+    """
+    Dilekçe liste özeti şeması.
+    İçerik yerine kısa bir özet döner; fields= ile seçilmeyen alanlar yanıta eklenmez.
+    """
+    id: int
+    title: Optional[str] = Field(None, description="Dilekçe tipi açıklaması")
+    petition_type: Optional[PetitionType] = None
+    status: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    excerpt: Optional[str] = Field(None, description="İçeriğin ilk kısmı")
+
+class PetitionPage(BaseModel):
+    """Sayfalı dilekçe listesi şeması"""
+    items: List[PetitionSummary]
+    next_cursor: Optional[str] = Field(None, description="Sonraki sayfa için cursor")
+
+class PetitionSearchResult(BaseModel):
+    """
+    Dilekçe arama sonucu şeması.
+    İçerik özeti yerine eşleşmelerin vurgulandığı parça döner.
+    """
+    id: int
+    title: Optional[str] = Field(None, description="Dilekçe tipi açıklaması")
+    petition_type: Optional[PetitionType] = None
+    status: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    rank: float = Field(..., description="İlgi puanı (yüksek daha ilgili)")
+    highlight: str = Field(..., description="Eşleşmelerin <mark> ile işaretlendiği içerik parçası")
+
+class PetitionSearchPage(BaseModel):
+    """Sayfalı dilekçe arama sonuçları şeması"""
+    items: List[PetitionSearchResult]
+    next_cursor: Optional[str] = Field(None, description="Sonraki sayfa için cursor")
+
 class PetitionRequest(BaseModel):
     """Dilekçe istek şeması"""
     petition_type: PetitionType
@@ -93,3 +151,24 @@ class PetitionRequest(BaseModel):
         if missing_fields:
             raise ValueError(f"Eksik alanlar: {missing_fields}")
         return v
+
+class PetitionAutosave(BaseModel):
+    """Otomatik kayıt taslağı şeması"""
+    content: str = Field(..., description="Taslak içerik")
+    version: int = Field(..., description="Düzenlenen sürüm")
+
+class AutosaveStatus(BaseModel):
+    """Otomatik kayıt durumu şeması"""
+    petition_id: int
+    version: int
+    saved: bool = Field(..., description="Taslak veritabanına yazıldı mı")
+
+class PetitionRevisionInfo(BaseModel):
+    """Dilekçe revizyon bilgisi şeması"""
+    version: int
+    replaced_at: Optional[datetime] = Field(None, description="Sürümün yerini yenisine bıraktığı zaman")
+
+class PetitionRevisionContent(BaseModel):
+    """Dilekçenin belirli bir sürümü şeması"""
+    version: int
+    content: str
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import datetime
 
 class Token(BaseModel):
@@ -7,6 +7,12 @@ class Token(BaseModel):
     access_token: str = Field(..., description="JWT access token")
     token_type: str = Field(default="bearer", description="Token tipi")
     expires_at: datetime = Field(..., description="Token geçerlilik süresi")
+    refresh_token: Optional[str] = Field(None, description="Tek kullanımlık refresh token")
+    refresh_expires_at: Optional[datetime] = Field(None, description="Refresh token geçerlilik süresi")
+
+class RefreshTokenRequest(BaseModel):
+    """Token yenileme / çıkış isteği şeması"""
+    refresh_token: str = Field(..., description="Refresh token")
 
 class TokenData(BaseModel):
     """Token payload şeması"""
@@ -16,6 +22,9 @@ class TokenData(BaseModel):
     type: str = Field(..., description="Token tipi")
     is_premium: bool = Field(default=False, description="Premium üyelik durumu")
     premium_until: Optional[datetime] = Field(None, description="Premium üyelik bitiş tarihi")
+    user_id: Optional[int] = Field(None, description="Kullanıcı ID")
+    is_active: bool = Field(default=True, description="Kullanıcı aktif mi")
+    token_version: int = Field(default=0, description="Kullanıcının token sürümü")
 
     class Config:
         """Pydantic config"""
@@ -23,6 +32,33 @@ class TokenData(BaseModel):
             datetime: lambda v: int(v.timestamp())  # Unix timestamp formatı
         }
 
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "TokenData":
+        """
+        Doğrulanmış JWT payload'ından oluşturur. Zaman claim'leri Unix
+        timestamp'tir; naive UTC datetime'a çevrilir.
+
+        Args:
+            payload: JWT payload
+
+        Returns:
+            TokenData: Token verisi
+        """
+        def to_datetime(value: Optional[int]) -> Optional[datetime]:
+            return datetime.utcfromtimestamp(value) if value is not None else None
+
+        return cls(
+            email=payload["sub"],
+            exp=to_datetime(payload["exp"]),
+            iat=to_datetime(payload["iat"]),
+            type=payload.get("type", "access_token"),
+            is_premium=payload.get("is_premium", False),
+            premium_until=to_datetime(payload.get("premium_until")),
+            user_id=payload.get("uid"),
+            is_active=payload.get("is_active", True),
+            token_version=payload.get("ver", 0)
+        )
+
     def is_expired(self) -> bool:
         """Token'ın süresi dolmuş mu kontrol eder"""
         return datetime.utcnow() > self.exp
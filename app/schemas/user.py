@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field, root_validator, validator
 from typing import List, Optional
 from datetime import datetime
 
@@ -66,6 +66,14 @@ class User(UserBase):
     premium_until: Optional[datetime] = Field(None, description="Premium üyelik bitiş tarihi")
     created_at: datetime = Field(..., description="Kayıt tarihi")
 
+    @root_validator(skip_on_failure=True)
+    def validate_premium(cls, values):
+        """Süresi dolan premium, kayıt henüz kapatılmamış olsa da pasif gösterilir"""
+        premium_until = values.get("premium_until")
+        if values.get("is_premium") and (premium_until is None or premium_until <= datetime.utcnow()):
+            values["is_premium"] = False
+        return values
+
     class Config:
         """Pydantic config"""
         from_attributes = True
@@ -0,0 +1,216 @@
+"""
+PDF oluşturma benchmark'ı.
+
+PDFGenerator.create_pdf için kısa, tipik ve çok uzun (1-50 sayfa) Türkçe
+dilekçelerde saniye başına render (çekirdek başına), p50/p99 gecikme ve
+tepe RSS değerlerini ölçer. PDFGenerator.__init__ içindeki font kaydı ve
+getSampleStyleSheet kurulum maliyeti ayrıca raporlanır.
+
+Her senaryo ayrı bir süreçte çalışır; böylece tepe RSS değerleri
+birbirini etkilemez.
+
+Kullanım:
+    python -m benchmarks.pdf_benchmark
+    python -m benchmarks.pdf_benchmark --save-baseline bench_baseline.json
+    python -m benchmarks.pdf_benchmark --baseline bench_baseline.json --max-regression 1.25
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from io import BytesIO
+from typing import Any, Dict, List
+
+# Uygulama ayarları zorunlu alanlar içerir; benchmark bunları kullanmaz
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
+
+SENTENCES = [
+    "Müvekkilim adına yapılan başvurunun reddine ilişkin işlemin iptali talep edilmektedir.",
+    "Söz konusu ihtarname tarafıma tebliğ edilmemiş olup süre işlemeye başlamamıştır.",
+    "6098 sayılı Türk Borçlar Kanunu'nun 344. maddesi uyarınca artış oranı TÜFE ile sınırlıdır.",
+    "Yargıtay'ın yerleşik içtihatları da bu yöndedir; ağır kusur iddiası ispatlanamamıştır.",
+    "İşverence yapılan fesih geçerli bir nedene dayanmadığından işe iade talebimiz haklıdır.",
+    "Tüketici hakem heyetine yapılan başvuruda ayıplı malın değişimi istenmiştir.",
+    "Şikâyet konusu ürünün garanti süresi içinde arızalandığı fatura ile sabittir.",
+    "Açıklanan nedenlerle davanın kabulüne ve yargılama giderlerinin karşı tarafa yükletilmesine karar verilmesini saygılarımla arz ederim.",
+]
+
+# Senaryo adı -> paragraf sayısı (A4'te sayfa başına ~9 paragraf)
+CASES = {
+    "short": 3,        # 1 sayfa
+    "typical": 24,     # ~3 sayfa
+    "very_long": 460,  # ~50 sayfa
+}
+
+def build_petition(paragraphs: int) -> str:
+    """Belirtilen paragraf sayısında deterministik Türkçe dilekçe metni üretir"""
+    lines = []
+    for i in range(paragraphs):
+        sentences = [SENTENCES[(i + j) % len(SENTENCES)] for j in range(4)]
+        lines.append(f"{i + 1}. " + " ".join(sentences))
+    return "\n".join(lines)
+
+def percentile(values: List[float], pct: float) -> float:
+    """Sıralı listeden en yakın sıra yöntemiyle yüzdelik değer hesaplar"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def peak_rss_mb() -> float:
+    """Sürecin tepe RSS değerini MB olarak döndürür"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux KB, macOS bayt döndürür
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def summarize(latencies: List[float], cpu_seconds: float) -> Dict[str, float]:
+    """Gecikme listesinden rapor alanlarını hesaplar"""
+    return {
+        "iterations": len(latencies),
+        "renders_per_sec_per_core": len(latencies) / cpu_seconds if cpu_seconds else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+def bench_init(iterations: int) -> Dict[str, Any]:
+    """PDFGenerator kurulum maliyetini bileşenleriyle ölçer"""
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from app.core.pdf_generator import PDFGenerator, FONT_NAME, FONT_PATH
+
+    results = {}
+    steps = {
+        "font_registration": lambda: pdfmetrics.registerFont(TTFont(FONT_NAME, FONT_PATH)),
+        "sample_stylesheet": getSampleStyleSheet,
+        "pdf_generator_init": PDFGenerator,
+    }
+    for name, step in steps.items():
+        latencies = []
+        cpu_start = time.process_time()
+        for _ in range(iterations):
+            start = time.perf_counter()
+            step()
+            latencies.append(time.perf_counter() - start)
+        results[name] = summarize(latencies, time.process_time() - cpu_start)
+    return results
+
+def bench_render(case: str, iterations: int, warmup: int) -> Dict[str, Any]:
+    """Tek bir senaryo için create_pdf ölçümü yapar"""
+    from pypdf import PdfReader
+    from app.core.pdf_generator import PDFGenerator
+
+    generator = PDFGenerator()
+    content = build_petition(CASES[case])
+
+    for _ in range(warmup):
+        generator.create_pdf(content, BytesIO())
+
+    latencies = []
+    output = BytesIO()
+    cpu_start = time.process_time()
+    for _ in range(iterations):
+        output = BytesIO()
+        start = time.perf_counter()
+        generator.create_pdf(content, output)
+        latencies.append(time.perf_counter() - start)
+    result = summarize(latencies, time.process_time() - cpu_start)
+
+    output.seek(0)
+    result["pages"] = len(PdfReader(output).pages)
+    result["pdf_kb"] = len(output.getvalue()) / 1024
+    return result
+
+def _run_isolated(func, *args) -> Dict[str, Any]:
+    """Ölçümü temiz bir süreçte çalıştırır"""
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        return pool.apply(func, args)
+
+def run(iterations: Dict[str, int], init_iterations: int, warmup: int) -> Dict[str, Any]:
+    """Tüm senaryoları çalıştırır"""
+    report = {"init": _run_isolated(bench_init, init_iterations), "render": {}}
+    for case in CASES:
+        report["render"][case] = _run_isolated(bench_render, case, iterations[case], warmup)
+    return report
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Sonuçları tablo olarak yazdırır"""
+    header = f"{'senaryo':<22}{'sayfa':>7}{'render/s/çekirdek':>19}{'p50 ms':>10}{'p99 ms':>10}{'RSS MB':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, result in report["init"].items():
+        print(f"{'init:' + name:<22}{'-':>7}{result['renders_per_sec_per_core']:>19.1f}"
+              f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['peak_rss_mb']:>9.1f}")
+    for name, result in report["render"].items():
+        print(f"{'render:' + name:<22}{result['pages']:>7}{result['renders_per_sec_per_core']:>19.1f}"
+              f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['peak_rss_mb']:>9.1f}")
+
+def check_regression(report: Dict[str, Any], baseline: Dict[str, Any], max_ratio: float) -> List[str]:
+    """
+    Baseline'a göre gerilemeleri bulur.
+
+    p50 gecikme ve tepe RSS değerleri max_ratio katını aşan senaryolar
+    gerileme sayılır.
+
+    Returns:
+        List[str]: Gerileme açıklamaları
+    """
+    failures = []
+    for group in ("init", "render"):
+        for name, result in report[group].items():
+            reference = baseline.get(group, {}).get(name)
+            if not reference:
+                continue
+            for metric in ("p50_ms", "peak_rss_mb"):
+                if reference[metric] and result[metric] > reference[metric] * max_ratio:
+                    failures.append(
+                        f"{group}:{name} {metric} {result[metric]:.2f} > "
+                        f"{reference[metric]:.2f} x {max_ratio}"
+                    )
+    return failures
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PDFGenerator benchmark")
+    parser.add_argument("--iterations", type=int, default=50, help="short/typical render sayısı")
+    parser.add_argument("--long-iterations", type=int, default=5, help="very_long render sayısı")
+    parser.add_argument("--init-iterations", type=int, default=20, help="kurulum ölçüm sayısı")
+    parser.add_argument("--warmup", type=int, default=2, help="ısınma render sayısı")
+    parser.add_argument("--json", help="sonuçları JSON olarak kaydet")
+    parser.add_argument("--save-baseline", help="sonuçları baseline olarak kaydet")
+    parser.add_argument("--baseline", help="karşılaştırılacak baseline JSON dosyası")
+    parser.add_argument("--max-regression", type=float, default=1.25,
+                        help="izin verilen en yüksek oran (varsayılan: 1.25)")
+    args = parser.parse_args()
+
+    iterations = {
+        "short": args.iterations,
+        "typical": args.iterations,
+        "very_long": args.long_iterations,
+    }
+    report = run(iterations, args.init_iterations, args.warmup)
+    print_report(report)
+
+    for path in filter(None, (args.json, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as source:
+            failures = check_regression(report, json.load(source), args.max_regression)
+        if failures:
+            print("\nPerformans gerilemesi:")
+            for failure in failures:
+                print(f"  {failure}")
+            return 1
+        print("\nBaseline ile karşılaştırma başarılı")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -38,14 +38,18 @@ echo "💾 Creating database backup..."
 echo "🏗️ Building Docker images..."
 docker-compose build --no-cache
 
-# 6. Servisleri başlat
+# 6. Database migration (API başlamadan önce; uygulama mevcut şemayı değiştirmez)
+echo "📦 Running database migrations..."
+docker-compose up -d db
+until docker exec dilekce_db pg_isready -U dilekce_user > /dev/null 2>&1; do
+    sleep 1
+done
+docker-compose run --rm api alembic upgrade head
+
+# 7. Servisleri başlat
 echo "🌟 Starting services..."
 docker-compose up -d
 
-# 7. Database migration
-echo "📦 Running database migrations..."
-docker-compose exec api alembic upgrade head
-
 # 8. Nginx reload
 echo "🔄 Reloading Nginx configuration..."
 docker-compose exec nginx nginx -s reload
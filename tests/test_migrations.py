@@ -0,0 +1,161 @@
+"""
+Migration testleri (SQLite, veri içeren veritabanı).
+
+batch_alter_table ile tablo yeniden oluşturan downgrade'ler foreign key'ler
+açıkken bağlı tabloları ON DELETE CASCADE ile boşaltıyordu; tur sonunda
+satırların korunduğu kontrol edilir. Migration'lardan önceki şemadaki bir
+veritabanının uygulama başlangıcından (init_db) sonra head'e
+yükseltilebildiği de kontrol edilir.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///./test.db")
+
+import pytest
+import sqlalchemy as sa
+from app.db import database as db_module, models
+from app.db.compression import decompress_text
+from app.db.database import Base, init_db
+from app.schemas.petition import PetitionType
+
+ROOT = Path(__file__).resolve().parents[1]
+TABLES = ("users", "petitions", "petition_revisions")
+
+def alembic(url: str, *args: str) -> None:
+    env = {**os.environ, "SQLALCHEMY_DATABASE_URI": url}
+    result = subprocess.run(
+        [sys.executable, "-m", "alembic", *args],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+def counts(engine: sa.engine.Engine) -> dict:
+    existing = set(sa.inspect(engine).get_table_names())
+    with engine.connect() as connection:
+        return {
+            table: connection.execute(sa.text(f"SELECT COUNT(*) FROM {table}")).scalar()
+            for table in TABLES
+            if table in existing
+        }
+
+# Migration'lardan (0001) önceki şema
+baseline = sa.MetaData()
+sa.Table(
+    "users",
+    baseline,
+    sa.Column("id", sa.Integer, primary_key=True, index=True),
+    sa.Column("email", sa.String, unique=True, index=True, nullable=False),
+    sa.Column("hashed_password", sa.String, nullable=False),
+    sa.Column("full_name", sa.String),
+    sa.Column("is_active", sa.Boolean, default=True),
+    sa.Column("is_premium", sa.Boolean, default=False),
+    sa.Column("premium_until", sa.DateTime, nullable=True),
+    sa.Column("created_at", sa.DateTime, server_default=sa.func.now()),
+    sa.Column("updated_at", sa.DateTime, server_default=sa.func.now()),
+)
+sa.Table(
+    "petitions",
+    baseline,
+    sa.Column("id", sa.Integer, primary_key=True, index=True),
+    sa.Column("petition_type", sa.Enum(PetitionType), nullable=False),
+    sa.Column("content", sa.String, nullable=False),
+    sa.Column("user_id", sa.Integer, sa.ForeignKey("users.id"), nullable=False),
+    sa.Column("created_at", sa.DateTime, server_default=sa.func.now()),
+    sa.Column("updated_at", sa.DateTime, server_default=sa.func.now()),
+    sa.Column("status", sa.String, default="draft"),
+    sa.Column("pdf_path", sa.String, nullable=True),
+)
+
+@pytest.fixture
+def database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'migrations.db'}"
+    engine = sa.create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        user_id = connection.execute(
+            sa.insert(models.User.__table__).values(email="a@b.com", hashed_password="x", full_name="Ali Veli")
+        ).inserted_primary_key[0]
+        for i in range(3):
+            petition_id = connection.execute(
+                sa.insert(models.Petition.__table__).values(
+                    petition_type=PetitionType.CONSUMER_COMPLAINT,
+                    content=f"{i} Sayın Hâkimlik, içerik",
+                    user_id=user_id,
+                    version=2
+                )
+            ).inserted_primary_key[0]
+            connection.execute(
+                sa.insert(models.PetitionRevision.__table__).values(
+                    petition_id=petition_id, version=1, kind="snapshot", data="Eski içerik"
+                )
+            )
+    alembic(url, "stamp", "head")
+    yield url, engine
+    engine.dispose()
+
+@pytest.mark.parametrize("target", ["0006", "0003"])
+def test_downgrade_round_trip_keeps_rows(database, target):
+    url, engine = database
+    before = counts(engine)
+
+    alembic(url, "downgrade", target)
+    after_downgrade = counts(engine)
+    assert after_downgrade == {table: before[table] for table in after_downgrade}
+    assert after_downgrade["petitions"] == 3
+
+    alembic(url, "upgrade", "head")
+    after_upgrade = counts(engine)
+    assert after_upgrade["users"] == before["users"]
+    assert after_upgrade["petitions"] == before["petitions"]
+    if "petition_revisions" in after_downgrade:
+        assert after_upgrade["petition_revisions"] == before["petition_revisions"]
+
+    with engine.connect() as connection:
+        assert connection.execute(sa.text("PRAGMA foreign_key_check")).fetchall() == []
+
+def test_init_db_then_upgrade_from_baseline_schema(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'baseline.db'}"
+    engine = sa.create_engine(url)
+    baseline.create_all(bind=engine)
+    with engine.begin() as connection:
+        user_id = connection.execute(
+            sa.insert(baseline.tables["users"]).values(email="a@b.com", hashed_password="x", full_name="Ali Veli")
+        ).inserted_primary_key[0]
+        connection.execute(sa.insert(baseline.tables["petitions"]), [
+            {"petition_type": PetitionType.CONSUMER_COMPLAINT.name, "content": f"{i} Sayın Hâkimlik", "user_id": user_id}
+            for i in range(3)
+        ])
+
+    # Uygulama başlangıcı mevcut şemaya dokunmamalı
+    monkeypatch.setattr(db_module, "engine", engine)
+    init_db()
+    assert set(sa.inspect(engine).get_table_names()) == {"users", "petitions"}
+
+    alembic(url, "upgrade", "head")
+    with engine.connect() as connection:
+        rows = connection.execute(sa.text("SELECT content, version FROM petitions ORDER BY id")).all()
+        token_versions = connection.execute(sa.text("SELECT token_version FROM users")).scalars().all()
+    assert [decompress_text(bytes(content)) for content, _ in rows] == [f"{i} Sayın Hâkimlik" for i in range(3)]
+    assert {version for _, version in rows} == {1}
+    assert token_versions == [0]
+    engine.dispose()
+
+def test_init_db_creates_and_stamps_fresh_database(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'fresh.db'}"
+    engine = sa.create_engine(url)
+    monkeypatch.setattr(db_module, "engine", engine)
+    init_db()
+    init_db()
+
+    # Head'de işaretli; upgrade bir şey yapmaz
+    alembic(url, "upgrade", "head")
+    assert set(Base.metadata.tables) <= set(sa.inspect(engine).get_table_names())
+    engine.dispose()